@@ -110,7 +110,8 @@ class SoylentRed():
         return Crew(
             agents=self.agents,
             tasks=self.tasks,
-            process=Process.sequential,
+            process=Process.dag,
             verbose=True,
+            task_cache=True,  # Only tasks whose inputs changed run again
             memory=False  # Disable built-in memory to avoid conflicts
         )
\ No newline at end of file
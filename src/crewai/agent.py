@@ -1,3 +1,4 @@
+import asyncio
 import shutil
 import subprocess
 import time
@@ -25,6 +26,14 @@ from crewai.utilities.agent_utils import (
     parse_tools,
     render_text_description_and_args,
 )
+from crewai.utilities.cancellation import (
+    CancellationToken,
+    ExecutionCancelledException,
+    ExecutionDeadlineExceededException,
+    cancellation_scope,
+    current_cancellation_token,
+    raise_if_cancelled,
+)
 from crewai.utilities.constants import TRAINED_AGENTS_DATA_FILE, TRAINING_DATA_FILE
 from crewai.utilities.converter import generate_model_description
 from crewai.utilities.events.agent_events import (
@@ -254,6 +263,90 @@ class Agent(BaseAgent):
             ValueError: If the max execution time is not a positive integer.
             RuntimeError: If the agent execution fails for other reasons.
         """
+        task_prompt, tools = self._prepare_task_execution(task, context, tools)
+
+        try:
+            self._emit_execution_started(task, task_prompt)
+
+            # Determine execution method based on timeout setting
+            if self.max_execution_time is not None:
+                self._validate_max_execution_time()
+                result = self._execute_with_timeout(
+                    task_prompt, task, self.max_execution_time
+                )
+            else:
+                result = self._execute_without_timeout(task_prompt, task)
+
+        except (TimeoutError, ExecutionCancelledException) as e:
+            # Propagate timeouts and cancellations without retry
+            self._emit_execution_error(task, e)
+            raise e
+        except Exception as e:
+            self._handle_execution_failure(task, e)
+            result = self.execute_task(task, context, tools)
+
+        return self._complete_task_execution(task, result)
+
+    async def aexecute_task(
+        self,
+        task: Task,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Execute a task with the agent natively on the running event loop.
+
+        Preparation (reasoning, memory and knowledge retrieval) runs in a worker
+        thread, while the agent's LLM calls are awaited through the executor's
+        async loop.
+
+        Args:
+            task: Task to execute.
+            context: Context to execute the task in.
+            tools: Tools to use for the task.
+
+        Returns:
+            Output of the agent
+
+        Raises:
+            TimeoutError: If execution exceeds the maximum execution time.
+            ValueError: If the max execution time is not a positive integer.
+            RuntimeError: If the agent execution fails for other reasons.
+        """
+        task_prompt, tools = await asyncio.to_thread(
+            self._prepare_task_execution, task, context, tools
+        )
+
+        try:
+            self._emit_execution_started(task, task_prompt)
+
+            if self.max_execution_time is not None:
+                self._validate_max_execution_time()
+                result = await self._aexecute_with_timeout(
+                    task_prompt, task, self.max_execution_time
+                )
+            else:
+                result = await self._aexecute_without_timeout(task_prompt, task)
+
+        except (TimeoutError, ExecutionCancelledException) as e:
+            self._emit_execution_error(task, e)
+            raise e
+        except Exception as e:
+            self._handle_execution_failure(task, e)
+            result = await self.aexecute_task(task, context, tools)
+
+        return self._complete_task_execution(task, result)
+
+    def _prepare_task_execution(
+        self,
+        task: Task,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> Tuple[str, List[BaseTool]]:
+        """Build the task prompt and the agent executor for a task.
+
+        Returns:
+            The task prompt and the tools the executor was created with.
+        """
         if self.reasoning:
             try:
                 from crewai.utilities.reasoning_handler import (
@@ -408,71 +501,48 @@ class Agent(BaseAgent):
         else:
             task_prompt = self._use_trained_data(task_prompt=task_prompt)
 
-        try:
-            crewai_event_bus.emit(
-                self,
-                event=AgentExecutionStartedEvent(
-                    agent=self,
-                    tools=self.tools,
-                    task_prompt=task_prompt,
-                    task=task,
-                ),
-            )
 
-            # Determine execution method based on timeout setting
-            if self.max_execution_time is not None:
-                if (
-                    not isinstance(self.max_execution_time, int)
-                    or self.max_execution_time <= 0
-                ):
-                    raise ValueError(
-                        "Max Execution time must be a positive integer greater than zero"
-                    )
-                result = self._execute_with_timeout(
-                    task_prompt, task, self.max_execution_time
-                )
-            else:
-                result = self._execute_without_timeout(task_prompt, task)
+        return task_prompt, tools
 
-        except TimeoutError as e:
-            # Propagate TimeoutError without retry
-            crewai_event_bus.emit(
-                self,
-                event=AgentExecutionErrorEvent(
-                    agent=self,
-                    task=task,
-                    error=str(e),
-                ),
-            )
-            raise e
-        except Exception as e:
-            if e.__class__.__module__.startswith("litellm"):
-                # Do not retry on litellm errors
-                crewai_event_bus.emit(
-                    self,
-                    event=AgentExecutionErrorEvent(
-                        agent=self,
-                        task=task,
-                        error=str(e),
-                    ),
-                )
-                raise e
-            self._times_executed += 1
-            if self._times_executed > self.max_retry_limit:
-                crewai_event_bus.emit(
-                    self,
-                    event=AgentExecutionErrorEvent(
-                        agent=self,
-                        task=task,
-                        error=str(e),
-                    ),
-                )
-                raise e
-            result = self.execute_task(task, context, tools)
+    def _emit_execution_started(self, task: Task, task_prompt: str) -> None:
+        crewai_event_bus.emit(
+            self,
+            event=AgentExecutionStartedEvent(
+                agent=self,
+                tools=self.tools,
+                task_prompt=task_prompt,
+                task=task,
+            ),
+        )
+
+    def _emit_execution_error(self, task: Task, error: Exception) -> None:
+        crewai_event_bus.emit(
+            self,
+            event=AgentExecutionErrorEvent(
+                agent=self,
+                task=task,
+                error=str(error),
+            ),
+        )
 
-        if self.max_rpm and self._rpm_controller:
-            self._rpm_controller.stop_rpm_counter()
+    def _validate_max_execution_time(self) -> None:
+        if not isinstance(self.max_execution_time, int) or self.max_execution_time <= 0:
+            raise ValueError(
+                "Max Execution time must be a positive integer greater than zero"
+            )
 
+    def _handle_execution_failure(self, task: Task, error: Exception) -> None:
+        """Re-raise errors that must not be retried, otherwise count the retry."""
+        if error.__class__.__module__.startswith("litellm"):
+            # Do not retry on litellm errors
+            self._emit_execution_error(task, error)
+            raise error
+        self._times_executed += 1
+        if self._times_executed > self.max_retry_limit:
+            self._emit_execution_error(task, error)
+            raise error
+
+    def _complete_task_execution(self, task: Task, result: Any) -> Any:
         # If there was any tool in self.tools_results that had result_as_answer
         # set to True, return the results of the last tool that had
         # result_as_answer set to True
@@ -496,27 +566,44 @@ class Agent(BaseAgent):
         Returns:
             The output of the agent.
 
+        The agent runs under a cancellation token expiring with the timeout,
+        so that it stops at its next step instead of running on in the
+        background once the timeout has been raised.
+
         Raises:
             TimeoutError: If execution exceeds the timeout.
+            ExecutionCancelledException: If the kickoff was cancelled.
             RuntimeError: If execution fails for other reasons.
         """
         import concurrent.futures
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
+        parent = current_cancellation_token() or CancellationToken()
+        token = parent.child(timeout)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        try:
             future = executor.submit(
-                self._execute_without_timeout, task_prompt=task_prompt, task=task
+                self._execute_in_scope, token, task_prompt=task_prompt, task=task
+            )
+            return future.result(timeout=timeout)
+        except (concurrent.futures.TimeoutError, ExecutionDeadlineExceededException):
+            # A deadline of the kickoff takes precedence over the agent's own
+            parent.raise_if_cancelled()
+            token.cancel(f"Task '{task.description}' execution timed out")
+            raise TimeoutError(
+                f"Task '{task.description}' execution timed out after {timeout} seconds. Consider increasing max_execution_time or optimizing the task."
             )
+        except ExecutionCancelledException:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Task execution failed: {str(e)}")
+        finally:
+            executor.shutdown(wait=False)
 
-            try:
-                return future.result(timeout=timeout)
-            except concurrent.futures.TimeoutError:
-                future.cancel()
-                raise TimeoutError(
-                    f"Task '{task.description}' execution timed out after {timeout} seconds. Consider increasing max_execution_time or optimizing the task."
-                )
-            except Exception as e:
-                future.cancel()
-                raise RuntimeError(f"Task execution failed: {str(e)}")
+    def _execute_in_scope(
+        self, token: CancellationToken, task_prompt: str, task: Task
+    ) -> str:
+        with cancellation_scope(token):
+            return self._execute_without_timeout(task_prompt=task_prompt, task=task)
 
     def _execute_without_timeout(self, task_prompt: str, task: Task) -> str:
         """Execute a task without a timeout.
@@ -537,6 +624,42 @@ class Agent(BaseAgent):
             }
         )["output"]
 
+    async def _aexecute_with_timeout(
+        self, task_prompt: str, task: Task, timeout: int
+    ) -> str:
+        """Async version of _execute_with_timeout.
+
+        The agent's coroutine is cancelled when the timeout expires instead of
+        being left running in a background thread.
+        """
+        try:
+            return await asyncio.wait_for(
+                self._aexecute_without_timeout(task_prompt=task_prompt, task=task),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            raise_if_cancelled()
+            raise TimeoutError(
+                f"Task '{task.description}' execution timed out after {timeout} seconds. Consider increasing max_execution_time or optimizing the task."
+            )
+        except ExecutionCancelledException:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Task execution failed: {str(e)}")
+
+    async def _aexecute_without_timeout(self, task_prompt: str, task: Task) -> str:
+        """Async version of _execute_without_timeout."""
+        return (
+            await self.agent_executor.ainvoke(
+                {
+                    "input": task_prompt,
+                    "tool_names": self.agent_executor.tools_names,
+                    "tools": self.agent_executor.tools_description,
+                    "ask_for_human_input": task.human_input,
+                }
+            )
+        )["output"]
+
     def create_agent_executor(
         self, tools: Optional[List[BaseTool]] = None, task=None
     ) -> None:
@@ -584,7 +707,7 @@ class Agent(BaseAgent):
             request_within_rpm_limit=(
                 self._rpm_controller.check_or_wait if self._rpm_controller else None
             ),
-            callbacks=[TokenCalcHandler(self._token_process)],
+            callbacks=[TokenCalcHandler(self._token_process, self._rpm_controller)],
         )
 
     def get_delegation_tools(self, agents: List[BaseAgent]):
@@ -707,6 +830,12 @@ class Agent(BaseAgent):
                 f"Docker is not running. Please start Docker to use code execution with agent: {self.role}"
             )
 
+    def _fork(self) -> "Agent":
+        """Fork the agent for another run, with its own count of retries."""
+        forked = super()._fork()
+        forked._times_executed = 0
+        return forked
+
     def __repr__(self):
         return f"Agent(role={self.role}, goal={self.goal}, backstory={self.backstory})"
 
@@ -798,25 +927,7 @@ class Agent(BaseAgent):
         Returns:
             LiteAgentOutput: The result of the agent execution.
         """
-        lite_agent = LiteAgent(
-            id=self.id,
-            role=self.role,
-            goal=self.goal,
-            backstory=self.backstory,
-            llm=self.llm,
-            tools=self.tools or [],
-            max_iterations=self.max_iter,
-            max_execution_time=self.max_execution_time,
-            respect_context_window=self.respect_context_window,
-            verbose=self.verbose,
-            response_format=response_format,
-            i18n=self.i18n,
-            original_agent=self,
-            guardrail=self.guardrail,
-            guardrail_max_retries=self.guardrail_max_retries,
-        )
-
-        return lite_agent.kickoff(messages)
+        return self._build_lite_agent(response_format).kickoff(messages)
 
     async def kickoff_async(
         self,
@@ -837,7 +948,12 @@ class Agent(BaseAgent):
         Returns:
             LiteAgentOutput: The result of the agent execution.
         """
-        lite_agent = LiteAgent(
+        return await self._build_lite_agent(response_format).kickoff_async(messages)
+
+    def _build_lite_agent(self, response_format: Optional[Type[Any]] = None) -> LiteAgent:
+        """Create a LiteAgent that mirrors this agent's configuration."""
+        return LiteAgent(
+            id=self.id,
             role=self.role,
             goal=self.goal,
             backstory=self.backstory,
@@ -850,6 +966,6 @@ class Agent(BaseAgent):
             response_format=response_format,
             i18n=self.i18n,
             original_agent=self,
+            guardrail=self.guardrail,
+            guardrail_max_retries=self.guardrail_max_retries,
         )
-
-        return await lite_agent.kickoff_async(messages)
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from copy import copy as shallow_copy
@@ -43,6 +44,7 @@ class BaseAgent(ABC, BaseModel):
         config (Optional[Dict[str, Any]]): Configuration for the agent.
         verbose (bool): Verbose mode for the Agent Execution.
         max_rpm (Optional[int]): Maximum number of requests per minute for the agent execution.
+        max_tpm (Optional[int]): Maximum number of tokens per minute for the agent execution.
         allow_delegation (bool): Allow delegation of tasks to agents.
         tools (Optional[List[Any]]): Tools at the agent's disposal.
         max_iter (int): Maximum iterations for an agent to execute a task.
@@ -104,6 +106,10 @@ class BaseAgent(ABC, BaseModel):
         default=None,
         description="Maximum number of requests per minute for the agent execution to be respected.",
     )
+    max_tpm: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tokens per minute for the agent execution to be respected.",
+    )
     allow_delegation: bool = Field(
         default=False,
         description="Enable agent to delegate and ask questions among each other.",
@@ -206,9 +212,9 @@ class BaseAgent(ABC, BaseModel):
 
         # Set private attributes
         self._logger = Logger(verbose=self.verbose)
-        if self.max_rpm and not self._rpm_controller:
+        if (self.max_rpm or self.max_tpm) and not self._rpm_controller:
             self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
+                max_rpm=self.max_rpm, max_tpm=self.max_tpm, logger=self._logger
             )
         if not self._token_process:
             self._token_process = TokenProcess()
@@ -231,9 +237,9 @@ class BaseAgent(ABC, BaseModel):
     def set_private_attrs(self):
         """Set private attributes."""
         self._logger = Logger(verbose=self.verbose)
-        if self.max_rpm and not self._rpm_controller:
+        if (self.max_rpm or self.max_tpm) and not self._rpm_controller:
             self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
+                max_rpm=self.max_rpm, max_tpm=self.max_tpm, logger=self._logger
             )
         if not self._token_process:
             self._token_process = TokenProcess()
@@ -257,6 +263,19 @@ class BaseAgent(ABC, BaseModel):
     ) -> str:
         pass
 
+    async def aexecute_task(
+        self,
+        task: Any,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Execute a task asynchronously.
+
+        Runs execute_task in a worker thread by default. Agents with a native
+        async execution path should override this method.
+        """
+        return await asyncio.to_thread(self.execute_task, task, context, tools)
+
     @abstractmethod
     def create_agent_executor(self, tools=None) -> None:
         pass
@@ -320,6 +339,28 @@ class BaseAgent(ABC, BaseModel):
 
         return copied_agent
 
+    def _fork(self: T) -> T:
+        """Create a cheap copy of the Agent for another run of its crew.
+
+        Unlike copy, nothing is dumped or validated again: configuration,
+        tools, knowledge and the rate limiter are shared with this agent, so
+        forks draw on one max_rpm/max_tpm budget. The executor, tools handler,
+        tool results and token usage of the fork are its own.
+        """
+        forked = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "llm": shallow_copy(self.llm),
+                "agent_executor": None,
+                "tools_handler": None,
+                "tools_results": [],
+                "crew": None,
+            }
+        )
+        forked._token_process = TokenProcess()
+        forked.set_cache_handler(self.cache_handler or CacheHandler())
+        return forked
+
     def interpolate_inputs(self, inputs: Dict[str, Any]) -> None:
         """Interpolate inputs into the agent description and backstory."""
         if self._original_role is None:
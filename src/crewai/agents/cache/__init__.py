@@ -1,3 +1,3 @@
-from .cache_handler import CacheHandler
+from .cache_handler import CacheHandler, ToolCacheMetrics
 
-__all__ = ["CacheHandler"]
+__all__ = ["CacheHandler", "ToolCacheMetrics"]
@@ -1,15 +1,200 @@
-from typing import Any, Dict, Optional
+"""Bounded cache of tool results with an optional SQLite tier."""
 
-from pydantic import BaseModel, PrivateAttr
+import ast
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+from crewai.utilities.errors import DatabaseOperationError
+
+logger = logging.getLogger(__name__)
+
+
+class ToolCacheMetrics(BaseModel):
+    """Snapshot of the activity of a CacheHandler.
+
+    Attributes:
+        hits: Reads answered from memory or from the SQLite tier.
+        misses: Reads that found no valid entry.
+        evictions: Entries dropped from memory to stay within max_size.
+        size: Entries currently held in memory.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
 
 
 class CacheHandler(BaseModel):
-    """Callback handler for tool usage."""
+    """Cache of tool results keyed by tool name and canonical arguments.
 
-    _cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    Arguments are canonicalized before building the key, so the same call
+    with reordered keyword arguments, or given as a JSON string instead of a
+    dict, hits the same entry. Memory holds at most max_size entries and
+    evicts the least recently used one first. Entries expire after the TTL
+    of their tool, or the default ttl.
+
+    With persist=True results are also written to SQLite, shared by every
+    crew and process using the same database, and survive between kickoffs.
+    Results that cannot be encoded as JSON stay in memory only, and a failing
+    SQLite tier is logged and skipped rather than failing the tool call.
+    """
+
+    max_size: Optional[int] = Field(
+        default=1000,
+        description="Maximum number of results kept in memory. None means unbounded.",
+    )
+    ttl: Optional[float] = Field(
+        default=None,
+        description="Seconds a result stays valid. None means results never expire.",
+    )
+    tool_ttls: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Seconds the results of a tool stay valid, by tool name.",
+    )
+    persist: bool = Field(
+        default=False,
+        description="Also store results in SQLite, shared across crews and processes.",
+    )
+    db_path: Optional[str] = Field(
+        default=None,
+        description="SQLite database of persisted results. Defaults to the CrewAI storage dir.",
+    )
+    max_persisted: Optional[int] = Field(
+        default=10000,
+        description="Maximum number of results kept in SQLite. None means unbounded.",
+    )
+    _cache: "OrderedDict[str, Any]" = PrivateAttr(default_factory=OrderedDict)
+    _expires_at: Dict[str, float] = PrivateAttr(default_factory=dict)
+    _metrics: ToolCacheMetrics = PrivateAttr(default_factory=ToolCacheMetrics)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _storage: Any = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def set_storage(self):
+        if self.persist and self._storage is None:
+            from crewai.memory.storage.tool_cache_storage import (
+                ToolCacheSQLiteStorage,
+            )
+
+            self._storage = ToolCacheSQLiteStorage(db_path=self.db_path)
+        return self
+
+    @staticmethod
+    def make_key(tool: str, input: Any) -> str:
+        """Return the key of a tool call, independent of argument order."""
+        return f"{tool}-{_canonical_input(input)}"
 
     def add(self, tool, input, output):
-        self._cache[f"{tool}-{input}"] = output
+        key = self.make_key(tool, input)
+        ttl = self.tool_ttls.get(tool, self.ttl)
+        with self._lock:
+            self._store(key, output, ttl)
+
+        if self._storage is not None:
+            try:
+                encoded = json.dumps(output)
+            except (TypeError, ValueError):
+                return
+            try:
+                self._storage.add(
+                    key, tool, encoded, ttl=ttl, max_entries=self.max_persisted
+                )
+            except DatabaseOperationError as e:
+                logger.warning(f"Tool cache write to SQLite failed: {str(e)}")
 
     def read(self, tool, input) -> Optional[str]:
-        return self._cache.get(f"{tool}-{input}")
+        key = self.make_key(tool, input)
+        with self._lock:
+            if key in self._cache:
+                expires_at = self._expires_at.get(key)
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._cache.move_to_end(key)
+                    self._metrics.hits += 1
+                    return self._cache[key]
+                del self._cache[key]
+                del self._expires_at[key]
+
+        stored = self._read_storage(key)
+        with self._lock:
+            if stored is None:
+                self._metrics.misses += 1
+                return None
+
+            encoded, expires_at = stored
+            output = json.loads(encoded)
+            ttl = expires_at - time.time() if expires_at is not None else None
+            self._store(key, output, ttl)
+            self._metrics.hits += 1
+            return output
+
+    def _read_storage(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        if self._storage is None:
+            return None
+        try:
+            return self._storage.get(key)
+        except DatabaseOperationError as e:
+            logger.warning(f"Tool cache read from SQLite failed: {str(e)}")
+            return None
+
+    def _store(self, key: str, output: Any, ttl: Optional[float]) -> None:
+        self._cache[key] = output
+        self._cache.move_to_end(key)
+        if ttl is not None:
+            self._expires_at[key] = time.monotonic() + ttl
+        else:
+            self._expires_at.pop(key, None)
+        while self.max_size is not None and len(self._cache) > self.max_size:
+            evicted, _ = self._cache.popitem(last=False)
+            self._expires_at.pop(evicted, None)
+            self._metrics.evictions += 1
+
+    def metrics(self) -> ToolCacheMetrics:
+        """Return the hit, miss and eviction counts and the size in memory."""
+        with self._lock:
+            return self._metrics.model_copy(update={"size": len(self._cache)})
+
+    def reset(self) -> None:
+        """Drop every result, in memory and in SQLite."""
+        with self._lock:
+            self._cache.clear()
+            self._expires_at.clear()
+        if self._storage is not None:
+            self._storage.delete_all()
+
+
+def _canonical_input(input: Any) -> str:
+    if isinstance(input, str):
+        parsed = _parse_input(input)
+        if parsed is None:
+            return input
+        input = parsed
+    return repr(_canonical_value(input))
+
+
+def _parse_input(input: str) -> Any:
+    try:
+        return json.loads(input)
+    except ValueError:
+        pass
+    try:
+        # Tool inputs are also rendered with str() of a dict, as by CacheTools
+        return ast.literal_eval(input)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+
+def _canonical_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            str(k): _canonical_value(value[k]) for k in sorted(value, key=str)
+        }
+    if isinstance(value, (list, tuple)):
+        return [_canonical_value(v) for v in value]
+    return value
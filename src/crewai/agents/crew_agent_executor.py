@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Callable, Dict, List, Optional, Union
 
 from crewai.agents.agent_builder.base_agent import BaseAgent
@@ -11,9 +12,11 @@ from crewai.agents.tools_handler import ToolsHandler
 from crewai.llm import BaseLLM
 from crewai.tools.base_tool import BaseTool
 from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.tool_registry import ToolRegistry
 from crewai.tools.tool_types import ToolResult
 from crewai.utilities import I18N, Printer
 from crewai.utilities.agent_utils import (
+    aget_llm_response,
     enforce_rpm_limit,
     format_message_for_llm,
     get_llm_response,
@@ -26,9 +29,16 @@ from crewai.utilities.agent_utils import (
     is_context_length_exceeded,
     process_llm_response,
 )
+from crewai.utilities.cancellation import (
+    ExecutionCancelledException,
+    raise_if_cancelled,
+)
 from crewai.utilities.constants import MAX_LLM_RETRY, TRAINING_DATA_FILE
 from crewai.utilities.logger import Logger
-from crewai.utilities.tool_utils import execute_tool_and_check_finality
+from crewai.utilities.tool_utils import (
+    aexecute_tool_and_check_finality,
+    execute_tool_and_check_finality,
+)
 from crewai.utilities.training_handler import CrewTrainingHandler
 from crewai.utilities.events.agent_events import (
     AgentLogsStartedEvent,
@@ -83,10 +93,12 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self.ask_for_human_input = False
         self.messages: List[Dict[str, str]] = []
         self.iterations = 0
+        self.tool_results: List[Dict[str, Any]] = []
         self.log_error_after = 3
         self.tool_name_to_tool_map: Dict[str, Union[CrewStructuredTool, BaseTool]] = {
             tool.name: tool for tool in self.tools
         }
+        self.tool_registry = ToolRegistry(self.tools)
         existing_stop = self.llm.stop or []
         self.llm.stop = list(
             set(
@@ -97,18 +109,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         )
 
     def invoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
-        if "system" in self.prompt:
-            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
-            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
-            self.messages.append(format_message_for_llm(system_prompt, role="system"))
-            self.messages.append(format_message_for_llm(user_prompt))
-        else:
-            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
-            self.messages.append(format_message_for_llm(user_prompt))
-
-        self._show_start_logs()
-
-        self.ask_for_human_input = bool(inputs.get("ask_for_human_input", False))
+        self._setup_messages(inputs)
 
         try:
             formatted_answer = self._invoke_loop()
@@ -118,6 +119,8 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                 color="red",
             )
             raise
+        except ExecutionCancelledException:
+            raise
         except Exception as e:
             handle_unknown_error(self._printer, e)
             if e.__class__.__module__.startswith("litellm"):
@@ -126,6 +129,49 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             else:
                 raise e
 
+        return self._finalize_invoke(formatted_answer)
+
+    async def ainvoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
+        """Async version of invoke, awaiting LLM calls on the running event loop."""
+        self._setup_messages(inputs)
+
+        try:
+            formatted_answer = await self._ainvoke_loop()
+        except AssertionError:
+            self._printer.print(
+                content="Agent failed to reach a final answer. This is likely a bug - please report it.",
+                color="red",
+            )
+            raise
+        except ExecutionCancelledException:
+            raise
+        except Exception as e:
+            handle_unknown_error(self._printer, e)
+            raise e
+
+        return await asyncio.to_thread(self._finalize_invoke, formatted_answer)
+
+    def _setup_messages(self, inputs: Dict[str, str]) -> None:
+        checkpoint = self._pop_checkpoint()
+        if checkpoint is not None:
+            # Resume the task where its last run stopped
+            self.messages = checkpoint["messages"]
+            self.iterations = checkpoint["iterations"]
+            self.tool_results = checkpoint["tool_results"]
+        elif "system" in self.prompt:
+            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
+            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
+            self.messages.append(format_message_for_llm(system_prompt, role="system"))
+            self.messages.append(format_message_for_llm(user_prompt))
+        else:
+            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
+            self.messages.append(format_message_for_llm(user_prompt))
+
+        self._show_start_logs()
+
+        self.ask_for_human_input = bool(inputs.get("ask_for_human_input", False))
+
+    def _finalize_invoke(self, formatted_answer: AgentFinish) -> Dict[str, Any]:
         if self.ask_for_human_input:
             formatted_answer = self._handle_human_feedback(formatted_answer)
 
@@ -142,6 +188,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         formatted_answer = None
         while not isinstance(formatted_answer, AgentFinish):
             try:
+                raise_if_cancelled()
                 if has_reached_max_iterations(self.iterations, self.max_iter):
                     formatted_answer = handle_max_iterations_exceeded(
                         formatted_answer,
@@ -159,42 +206,18 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                     messages=self.messages,
                     callbacks=self.callbacks,
                     printer=self._printer,
-                    from_task=self.task
+                    from_task=self.task,
+                    from_agent=self.agent,
                 )
                 formatted_answer = process_llm_response(answer, self.use_stop_words)
 
                 if isinstance(formatted_answer, AgentAction):
-                    # Extract agent fingerprint if available
-                    fingerprint_context = {}
-                    if (
-                        self.agent
-                        and hasattr(self.agent, "security_config")
-                        and hasattr(self.agent.security_config, "fingerprint")
-                    ):
-                        fingerprint_context = {
-                            "agent_fingerprint": str(
-                                self.agent.security_config.fingerprint
-                            )
-                        }
-
-                    tool_result = execute_tool_and_check_finality(
-                        agent_action=formatted_answer,
-                        fingerprint_context=fingerprint_context,
-                        tools=self.tools,
-                        i18n=self._i18n,
-                        agent_key=self.agent.key if self.agent else None,
-                        agent_role=self.agent.role if self.agent else None,
-                        tools_handler=self.tools_handler,
-                        task=self.task,
-                        agent=self.agent,
-                        function_calling_llm=self.function_calling_llm,
-                    )
-                    formatted_answer = self._handle_agent_action(
-                        formatted_answer, tool_result
-                    )
+                    formatted_answer = self._execute_agent_action(formatted_answer)
 
                 self._invoke_step_callback(formatted_answer)
                 self._append_message(formatted_answer.text, role="assistant")
+                if not isinstance(formatted_answer, AgentFinish):
+                    self._save_checkpoint()
 
             except OutputParserException as e:
                 formatted_answer = handle_output_parser_exception(
@@ -205,6 +228,9 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                     printer=self._printer,
                 )
 
+            except ExecutionCancelledException:
+                raise
+
             except Exception as e:
                 if e.__class__.__module__.startswith("litellm"):
                     # Do not retry on litellm errors
@@ -233,6 +259,153 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self._show_logs(formatted_answer)
         return formatted_answer
 
+    async def _ainvoke_loop(self) -> AgentFinish:
+        """
+        Async version of _invoke_loop. LLM calls and async tools are awaited
+        natively, while sync tools run in a worker thread.
+        """
+        formatted_answer = None
+        while not isinstance(formatted_answer, AgentFinish):
+            try:
+                raise_if_cancelled()
+                if has_reached_max_iterations(self.iterations, self.max_iter):
+                    formatted_answer = await asyncio.to_thread(
+                        handle_max_iterations_exceeded,
+                        formatted_answer,
+                        printer=self._printer,
+                        i18n=self._i18n,
+                        messages=self.messages,
+                        llm=self.llm,
+                        callbacks=self.callbacks,
+                    )
+
+                if self.request_within_rpm_limit:
+                    await asyncio.to_thread(
+                        enforce_rpm_limit, self.request_within_rpm_limit
+                    )
+
+                answer = await aget_llm_response(
+                    llm=self.llm,
+                    messages=self.messages,
+                    callbacks=self.callbacks,
+                    printer=self._printer,
+                    from_task=self.task,
+                    from_agent=self.agent,
+                )
+                formatted_answer = process_llm_response(answer, self.use_stop_words)
+
+                if isinstance(formatted_answer, AgentAction):
+                    formatted_answer = await self._aexecute_agent_action(
+                        formatted_answer
+                    )
+
+                self._invoke_step_callback(formatted_answer)
+                self._append_message(formatted_answer.text, role="assistant")
+                if not isinstance(formatted_answer, AgentFinish):
+                    self._save_checkpoint()
+
+            except OutputParserException as e:
+                formatted_answer = handle_output_parser_exception(
+                    e=e,
+                    messages=self.messages,
+                    iterations=self.iterations,
+                    log_error_after=self.log_error_after,
+                    printer=self._printer,
+                )
+
+            except ExecutionCancelledException:
+                raise
+
+            except Exception as e:
+                if e.__class__.__module__.startswith("litellm"):
+                    # Do not retry on litellm errors
+                    raise e
+                if is_context_length_exceeded(e):
+                    await asyncio.to_thread(
+                        handle_context_length,
+                        respect_context_window=self.respect_context_window,
+                        printer=self._printer,
+                        messages=self.messages,
+                        llm=self.llm,
+                        callbacks=self.callbacks,
+                        i18n=self._i18n,
+                    )
+                    continue
+                else:
+                    handle_unknown_error(self._printer, e)
+                    raise e
+            finally:
+                self.iterations += 1
+
+        assert isinstance(formatted_answer, AgentFinish)
+        self._show_logs(formatted_answer)
+        return formatted_answer
+
+    def _execute_agent_action(
+        self, formatted_answer: AgentAction
+    ) -> Union[AgentAction, AgentFinish]:
+        """Execute the tool requested by the agent and fold in its result."""
+        tool_result = execute_tool_and_check_finality(
+            **self._tool_execution_params(formatted_answer)
+        )
+        self._record_tool_result(formatted_answer, tool_result)
+        return self._handle_agent_action(formatted_answer, tool_result)
+
+    async def _aexecute_agent_action(
+        self, formatted_answer: AgentAction
+    ) -> Union[AgentAction, AgentFinish]:
+        """Async version of _execute_agent_action that awaits the tool."""
+        tool_result = await aexecute_tool_and_check_finality(
+            **self._tool_execution_params(formatted_answer)
+        )
+        self._record_tool_result(formatted_answer, tool_result)
+        return await asyncio.to_thread(
+            self._handle_agent_action, formatted_answer, tool_result
+        )
+
+    def _tool_execution_params(self, formatted_answer: AgentAction) -> Dict[str, Any]:
+        # Extract agent fingerprint if available
+        fingerprint_context = {}
+        if (
+            self.agent
+            and hasattr(self.agent, "security_config")
+            and hasattr(self.agent.security_config, "fingerprint")
+        ):
+            fingerprint_context = {
+                "agent_fingerprint": str(self.agent.security_config.fingerprint)
+            }
+
+        return {
+            "agent_action": formatted_answer,
+            "fingerprint_context": fingerprint_context,
+            "tools": self.tools,
+            "i18n": self._i18n,
+            "agent_key": self.agent.key if self.agent else None,
+            "agent_role": self.agent.role if self.agent else None,
+            "tools_handler": self.tools_handler,
+            "task": self.task,
+            "agent": self.agent,
+            "function_calling_llm": self.function_calling_llm,
+            "tool_registry": self._get_tool_registry(),
+        }
+
+    def _record_tool_result(
+        self, formatted_answer: AgentAction, tool_result: ToolResult
+    ) -> None:
+        self.tool_results.append(
+            {
+                "tool": formatted_answer.tool,
+                "input": formatted_answer.tool_input,
+                "result": str(tool_result.result),
+            }
+        )
+
+    def _get_tool_registry(self) -> ToolRegistry:
+        """Return the tool registry, rebuilt only if the tools were replaced."""
+        if not self.tool_registry.matches(self.tools):
+            self.tool_registry = ToolRegistry(self.tools)
+        return self.tool_registry
+
     def _handle_agent_action(
         self, formatted_answer: AgentAction, tool_result: ToolResult
     ) -> Union[AgentAction, AgentFinish]:
@@ -255,6 +428,25 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             show_logs=self._show_logs,
         )
 
+    def _save_checkpoint(self) -> None:
+        """Persist the state of the loop after a step, through the crew."""
+        save_task_checkpoint = getattr(self.crew, "_save_task_checkpoint", None)
+        if save_task_checkpoint is not None:
+            save_task_checkpoint(
+                self.task,
+                messages=self.messages,
+                iterations=self.iterations + 1,
+                tool_results=self.tool_results,
+            )
+
+    def _pop_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Return the checkpoint to resume the task from, if the crew has one."""
+        pop_task_checkpoint = getattr(self.crew, "_pop_task_checkpoint", None)
+        if pop_task_checkpoint is None:
+            return None
+        checkpoint = pop_task_checkpoint(self.task)
+        return checkpoint if isinstance(checkpoint, dict) else None
+
     def _invoke_step_callback(self, formatted_answer) -> None:
         """Invoke the step callback if it exists."""
         if self.step_callback:
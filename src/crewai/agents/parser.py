@@ -1,5 +1,5 @@
 import re
-from typing import Any, Optional, Union
+from typing import Any, List, Optional, Union
 
 from json_repair import repair_json
 
@@ -9,6 +9,7 @@ FINAL_ANSWER_ACTION = "Final Answer:"
 MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE = "I did it wrong. Invalid Format: I missed the 'Action:' after 'Thought:'. I will do right next, and don't use a tool I have already used.\n"
 MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE = "I did it wrong. Invalid Format: I missed the 'Action Input:' after 'Action:'. I will do right next, and don't use a tool I have already used.\n"
 FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE = "I did it wrong. Tried to both perform Action and give a Final Answer at the same time, I must do one or the other"
+ACTION_REGEX = r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)"
 
 
 class AgentAction:
@@ -87,10 +88,7 @@ class CrewAgentParser:
     def parse(self, text: str) -> Union[AgentAction, AgentFinish]:
         thought = self._extract_thought(text)
         includes_answer = FINAL_ANSWER_ACTION in text
-        regex = (
-            r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)"
-        )
-        action_match = re.search(regex, text, re.DOTALL)
+        action_match = re.search(ACTION_REGEX, text, re.DOTALL)
         if includes_answer:
             final_answer = text.split(FINAL_ANSWER_ACTION)[-1].strip()
             # Check whether the final answer ends with triple backticks.
@@ -130,6 +128,36 @@ class CrewAgentParser:
                 error,
             )
 
+    @staticmethod
+    def find_step_end(
+        text: str, stop_words: Optional[List[str]] = None
+    ) -> Optional[int]:
+        """Return where a complete ReAct step ends in partially streamed text.
+
+        A step is complete once a stop word shows up, since the provider would
+        have cut the response there, or once an Action Input holding a JSON
+        object or array has been closed. Plain text action inputs and final
+        answers can still grow, so they are only complete at a stop word.
+
+        Args:
+            text: The response text received so far.
+            stop_words: Stop words the response should be cut at.
+
+        Returns:
+            The length of the complete step, or None if more text is needed.
+        """
+        stop_indexes = [text.find(word) for word in stop_words or [] if word]
+        stop_indexes = [index for index in stop_indexes if index != -1]
+        if stop_indexes:
+            return min(stop_indexes)
+
+        if FINAL_ANSWER_ACTION in text:
+            return None
+        action_match = re.search(ACTION_REGEX, text, re.DOTALL)
+        if not action_match or not action_match.group(2):
+            return None
+        return _find_json_end(text, action_match.start(2))
+
     def _extract_thought(self, text: str) -> str:
         thought_index = text.find("\nAction")
         if thought_index == -1:
@@ -167,3 +195,31 @@ class CrewAgentParser:
             return tool_input
 
         return str(result)
+
+
+def _find_json_end(text: str, start: int) -> Optional[int]:
+    """Return the index just past the JSON value opening at start, if it is closed."""
+    if text[start] not in "{[":
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    return None
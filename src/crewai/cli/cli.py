@@ -10,6 +10,9 @@ from crewai.cli.crew_chat import run_chat
 from crewai.memory.storage.kickoff_task_outputs_storage import (
     KickoffTaskOutputsSQLiteStorage,
 )
+from crewai.memory.storage.task_checkpoints_storage import (
+    TaskCheckpointsSQLiteStorage,
+)
 
 from .authentication.main import AuthenticationCommand
 from .deploy.main import DeployCommand
@@ -117,8 +120,9 @@ def log_tasks_outputs() -> None:
     try:
         storage = KickoffTaskOutputsSQLiteStorage()
         tasks = storage.load()
+        checkpoints = TaskCheckpointsSQLiteStorage().load()
 
-        if not tasks:
+        if not tasks and not checkpoints:
             click.echo(
                 "No task outputs found. Only crew kickoff task outputs are logged."
             )
@@ -129,6 +133,16 @@ def log_tasks_outputs() -> None:
             click.echo(f"Description: {task['expected_output']}")
             click.echo("------")
 
+        for checkpoint in checkpoints:
+            click.echo(
+                f"In-flight task {checkpoint['task_index'] + 1}: {checkpoint['task_id']}"
+            )
+            click.echo(
+                f"Checkpointed after {checkpoint['iterations']} iterations, "
+                "replay resumes it from there"
+            )
+            click.echo("------")
+
     except Exception as e:
         click.echo(f"An error occurred while logging task outputs: {e}", err=True)
 
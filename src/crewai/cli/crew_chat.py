@@ -381,14 +381,24 @@ def generate_crew_chat_inputs(crew: Crew, crew_name: str, chat_llm) -> ChatInput
     # Extract placeholders from tasks and agents
     required_inputs = fetch_required_inputs(crew)
 
-    # Generate descriptions for each input using AI
-    input_fields = []
-    for input_name in required_inputs:
-        description = generate_input_description_with_ai(input_name, crew, chat_llm)
-        input_fields.append(ChatInputField(name=input_name, description=description))
+    # Generate descriptions for each input and for the crew in one batch
+    input_names = list(required_inputs)
+    prompts = [
+        _build_input_description_prompt(input_name, crew) for input_name in input_names
+    ]
+    prompts.append(_build_crew_description_prompt(crew))
+    batch = chat_llm.batch_call(
+        [[{"role": "user", "content": prompt}] for prompt in prompts]
+    )
+    batch.raise_first_error()
+    *input_descriptions, crew_description = [
+        response.strip() for response in batch.responses
+    ]
 
-    # Generate crew description using AI
-    crew_description = generate_crew_description_with_ai(crew, chat_llm)
+    input_fields = [
+        ChatInputField(name=input_name, description=description)
+        for input_name, description in zip(input_names, input_descriptions)
+    ]
 
     return ChatInputs(
         crew_name=crew_name, crew_description=crew_description, inputs=input_fields
@@ -433,6 +443,20 @@ def generate_input_description_with_ai(input_name: str, crew: Crew, chat_llm) ->
     Returns:
         str: A concise description of the input.
     """
+    prompt = _build_input_description_prompt(input_name, crew)
+    response = chat_llm.call(messages=[{"role": "user", "content": prompt}])
+    description = response.strip()
+
+    return description
+
+
+def _build_input_description_prompt(input_name: str, crew: Crew) -> str:
+    """
+    Builds the prompt used to describe an input from the context of the crew.
+
+    Raises:
+        ValueError: If the input is not used by any task or agent.
+    """
     # Gather context from tasks and agents where the input is used
     context_texts = []
     placeholder_pattern = re.compile(r"\{(.+?)\}")
@@ -478,10 +502,7 @@ def generate_input_description_with_ai(input_name: str, crew: Crew, chat_llm) ->
         "Context:\n"
         f"{context}"
     )
-    response = chat_llm.call(messages=[{"role": "user", "content": prompt}])
-    description = response.strip()
-
-    return description
+    return prompt
 
 
 def generate_crew_description_with_ai(crew: Crew, chat_llm) -> str:
@@ -495,6 +516,20 @@ def generate_crew_description_with_ai(crew: Crew, chat_llm) -> str:
     Returns:
         str: A concise description of the crew's purpose (15 words or less).
     """
+    prompt = _build_crew_description_prompt(crew)
+    response = chat_llm.call(messages=[{"role": "user", "content": prompt}])
+    crew_description = response.strip()
+
+    return crew_description
+
+
+def _build_crew_description_prompt(crew: Crew) -> str:
+    """
+    Builds the prompt used to describe the crew's purpose.
+
+    Raises:
+        ValueError: If the crew has no tasks or agents to describe.
+    """
     # Gather context from tasks and agents
     context_texts = []
     placeholder_pattern = re.compile(r"\{(.+?)\}")
@@ -530,7 +565,4 @@ def generate_crew_description_with_ai(crew: Crew, chat_llm) -> str:
         "Context:\n"
         f"{context}"
     )
-    response = chat_llm.call(messages=[{"role": "user", "content": prompt}])
-    crew_description = response.strip()
-
-    return crew_description
+    return prompt
@@ -1,15 +1,27 @@
 import asyncio
 import json
+import queue
 import re
+import threading
 import uuid
 import warnings
-from concurrent.futures import Future
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
 from copy import copy as shallow_copy
 from hashlib import md5
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -57,6 +69,7 @@ from crewai.tools.agent_tools.agent_tools import AgentTools
 from crewai.tools.base_tool import BaseTool, Tool
 from crewai.types.usage_metrics import UsageMetrics
 from crewai.utilities import I18N, FileHandler, Logger, RPMController
+from crewai.utilities.cancellation import CancellationToken
 from crewai.utilities.constants import NOT_SPECIFIED, TRAINING_DATA_FILE
 from crewai.utilities.evaluators.crew_evaluator_handler import CrewEvaluator
 from crewai.utilities.evaluators.task_evaluator import TaskEvaluator
@@ -73,17 +86,46 @@ from crewai.utilities.events.crew_events import (
 )
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.event_listener import EventListener
+from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+from crewai.utilities.events.task_events import TaskCompletedEvent, TaskStartedEvent
+from crewai.utilities.events.tool_usage_events import ToolUsageFinishedEvent
 from crewai.utilities.formatter import (
     aggregate_raw_outputs_from_task_outputs,
     aggregate_raw_outputs_from_tasks,
 )
 from crewai.utilities.llm_utils import create_llm
 from crewai.utilities.planning_handler import CrewPlanner
+from crewai.utilities.task_executor import (
+    TaskExecutor,
+    TaskExecutorMetrics,
+    get_default_task_executor,
+)
 from crewai.utilities.task_output_storage_handler import TaskOutputStorageHandler
+from crewai.utilities.task_result_cache_handler import TaskResultCacheHandler
 from crewai.utilities.training_handler import CrewTrainingHandler
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
+# Items yielded by Crew.kickoff_stream, the crew output coming last
+CrewStreamItem = Union[
+    TaskStartedEvent,
+    LLMStreamChunkEvent,
+    ToolUsageFinishedEvent,
+    TaskCompletedEvent,
+    CrewOutput,
+]
+STREAM_EVENT_TYPES = (
+    TaskStartedEvent,
+    LLMStreamChunkEvent,
+    ToolUsageFinishedEvent,
+    TaskCompletedEvent,
+)
+_STREAM_END = object()
+
+# A conditional task started early, the future of its agent's result, the
+# context it ran with and the token to discard it with
+_Speculation = Tuple[ConditionalTask, "Future[str]", str, CancellationToken]
+
 
 class Crew(FlowTrackable, BaseModel):
     """
@@ -94,14 +136,21 @@ class Crew(FlowTrackable, BaseModel):
         agents: List of agents part of this crew.
         manager_llm: The language model that will run manager agent.
         manager_agent: Custom agent that will be used as manager.
+        parallel_delegation: Let the manager delegate several tasks to coworkers in one step and run them in parallel.
         memory: Whether the crew should use memory to store memories of it's execution.
         memory_config: Configuration for the memory to be used for the crew.
         cache: Whether the crew should use a cache to store the results of the tools execution.
+        tool_cache: Cache of tool results handed to the agents when cache is on, instead of a fresh in-memory one.
+        task_cache: Cache of task outputs reused across kickoffs, or True for the default one.
         function_calling_llm: The language model that will run the tool calling for all the agents.
-        process: The process flow that the crew will follow (e.g., sequential, hierarchical).
+        process: The process flow that the crew will follow (e.g., sequential, hierarchical, dag).
+        max_concurrency: Maximum number of tasks running at once in the dag process.
+        max_async_workers: Size of the crew's own pool for tasks with async_execution.
         verbose: Indicates the verbosity level for logging during execution.
         config: Configuration settings for the crew.
         max_rpm: Maximum number of requests per minute for the crew execution to be respected.
+        max_tpm: Maximum number of tokens per minute for the crew execution to be respected.
+        rate_limit_key: Key of a rate limit budget shared with other crews and processes.
         prompt_file: Path to the prompt json file to be used for the crew.
         id: A unique identifier for the crew instance.
         task_callback: Callback to be executed after each task for every agents execution.
@@ -117,7 +166,7 @@ class Crew(FlowTrackable, BaseModel):
     _rpm_controller: RPMController = PrivateAttr()
     _logger: Logger = PrivateAttr()
     _file_handler: FileHandler = PrivateAttr()
-    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default=CacheHandler())
+    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default_factory=CacheHandler)
     _short_term_memory: Optional[InstanceOf[ShortTermMemory]] = PrivateAttr()
     _long_term_memory: Optional[InstanceOf[LongTermMemory]] = PrivateAttr()
     _entity_memory: Optional[InstanceOf[EntityMemory]] = PrivateAttr()
@@ -132,12 +181,37 @@ class Crew(FlowTrackable, BaseModel):
     _task_output_handler: TaskOutputStorageHandler = PrivateAttr(
         default_factory=TaskOutputStorageHandler
     )
+    _task_executor: Optional[TaskExecutor] = PrivateAttr(default=None)
+    _factory: Optional[Callable[[], "Crew"]] = PrivateAttr(default=None)
+    _resume_checkpoints: Dict[int, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+    _log_task_outputs: bool = PrivateAttr(default=True)
+    _cancellation_token: CancellationToken = PrivateAttr(
+        default_factory=CancellationToken
+    )
+    _pending_cancellation: Optional[CancellationToken] = PrivateAttr(default=None)
+    _kickoff_running: bool = PrivateAttr(default=False)
 
     name: Optional[str] = Field(default=None)
     cache: bool = Field(default=True)
+    tool_cache: Optional[InstanceOf[CacheHandler]] = Field(
+        default=None,
+        description="Tool result cache shared by the agents, e.g. CacheHandler(persist=True) to reuse results across kickoffs and processes. Defaults to a fresh in-memory cache.",
+    )
+    task_cache: Union[bool, InstanceOf[TaskResultCacheHandler], None] = Field(
+        default=None,
+        description="Reuse the stored output of tasks that already ran with the same description, context, agent, LLM and tools. True uses the default cache. Tasks with cache=False always run.",
+    )
     tasks: List[Task] = Field(default_factory=list)
     agents: List[BaseAgent] = Field(default_factory=list)
     process: Process = Field(default=Process.sequential)
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tasks running at once in the dag process. Defaults to no limit.",
+    )
+    max_async_workers: Optional[int] = Field(
+        default=None,
+        description="Size of a pool of the crew's own for tasks with async_execution. Defaults to the pool shared by all crews.",
+    )
     verbose: bool = Field(default=False)
     memory: bool = Field(
         default=False,
@@ -181,6 +255,10 @@ class Crew(FlowTrackable, BaseModel):
     manager_agent: Optional[BaseAgent] = Field(
         description="Custom agent that will be used as manager.", default=None
     )
+    parallel_delegation: bool = Field(
+        default=False,
+        description="Give the manager a tool that delegates several tasks to coworkers at once and runs them in parallel.",
+    )
     function_calling_llm: Optional[Union[str, InstanceOf[LLM], Any]] = Field(
         description="Language model that will run the agent.", default=None
     )
@@ -209,6 +287,14 @@ class Crew(FlowTrackable, BaseModel):
         default=None,
         description="Maximum number of requests per minute for the crew execution to be respected.",
     )
+    max_tpm: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tokens per minute for the crew execution to be respected.",
+    )
+    rate_limit_key: Optional[str] = Field(
+        default=None,
+        description="Crews with the same key share one max_rpm/max_tpm budget, also across processes.",
+    )
     prompt_file: Optional[str] = Field(
         default=None,
         description="Path to the prompt json file to be used for the crew.",
@@ -274,18 +360,33 @@ class Crew(FlowTrackable, BaseModel):
         # TODO: Improve typing
         return json.loads(v) if isinstance(v, Json) else v  # type: ignore
 
+    @field_validator("task_cache")
+    @classmethod
+    def create_task_cache(
+        cls, v: Union[bool, TaskResultCacheHandler, None]
+    ) -> Optional[TaskResultCacheHandler]:
+        """Turn task_cache=True into the default cache of task outputs."""
+        if v is True:
+            return TaskResultCacheHandler()
+        return v or None
+
     @model_validator(mode="after")
     def set_private_attrs(self) -> "Crew":
         """Set private attributes."""
 
-        self._cache_handler = CacheHandler()
+        self._cache_handler = self.tool_cache or CacheHandler()
         event_listener = EventListener()
         event_listener.verbose = self.verbose
         event_listener.formatter.verbose = self.verbose
         self._logger = Logger(verbose=self.verbose)
         if self.output_log_file:
             self._file_handler = FileHandler(self.output_log_file)
-        self._rpm_controller = RPMController(max_rpm=self.max_rpm, logger=self._logger)
+        self._rpm_controller = RPMController(
+            max_rpm=self.max_rpm,
+            max_tpm=self.max_tpm,
+            shared_key=self.rate_limit_key,
+            logger=self._logger,
+        )
         if self.function_calling_llm and not isinstance(self.function_calling_llm, LLM):
             self.function_calling_llm = create_llm(self.function_calling_llm)
 
@@ -392,22 +493,25 @@ class Crew(FlowTrackable, BaseModel):
         if self.config:
             self._setup_from_config()
 
-        if self.agents:
-            for agent in self.agents:
-                if self.cache:
-                    agent.set_cache_handler(self._cache_handler)
-                if self.max_rpm:
-                    agent.set_rpm_controller(self._rpm_controller)
+        for agent in self.agents:
+            self._attach_agent(agent)
         return self
 
+    def _attach_agent(self, agent: BaseAgent) -> None:
+        """Hand the crew's tool cache and rate limiter to an agent."""
+        if self.cache:
+            agent.set_cache_handler(self._cache_handler)
+        if self.max_rpm or self.max_tpm:
+            agent.set_rpm_controller(self._rpm_controller)
+
     @model_validator(mode="after")
     def validate_tasks(self):
-        if self.process == Process.sequential:
+        if self.process in (Process.sequential, Process.dag):
             for task in self.tasks:
                 if task.agent is None:
                     raise PydanticCustomError(
                         "missing_agent_in_task",
-                        f"Sequential process error: Agent is missing in the task with the following description: {task.description}",  # type: ignore # Argument of type "str" cannot be assigned to parameter "message_template" of type "LiteralString"
+                        f"{self.process.value.capitalize()} process error: Agent is missing in the task with the following description: {task.description}",  # type: ignore # Argument of type "str" cannot be assigned to parameter "message_template" of type "LiteralString"
                         {},
                     )
 
@@ -516,6 +620,14 @@ class Crew(FlowTrackable, BaseModel):
         ]
         return md5("|".join(source).encode(), usedforsecurity=False).hexdigest()
 
+    @property
+    def async_task_metrics(self) -> TaskExecutorMetrics:
+        """Load of the pool running this crew's tasks with async_execution.
+
+        A crew with max_async_workers reports the pool of its latest kickoff.
+        """
+        return (self._task_executor or get_default_task_executor()).metrics()
+
     @property
     def fingerprint(self) -> Fingerprint:
         """
@@ -620,66 +732,41 @@ class Crew(FlowTrackable, BaseModel):
     def kickoff(
         self,
         inputs: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
     ) -> CrewOutput:
+        """Run the crew's tasks with the given inputs.
+
+        Args:
+            inputs: Values interpolated into the agents and tasks.
+            deadline: Seconds the kickoff may take. Running agents stop at
+                their next step once it has passed, and the kickoff raises
+                ExecutionDeadlineExceededException.
+
+        Returns:
+            The output of the crew.
+        """
+        self._start_cancellation_token(deadline)
         ctx = baggage.set_baggage(
             "crew_context", CrewContext(id=str(self.id), key=self.key)
         )
         token = attach(ctx)
 
         try:
-            for before_callback in self.before_kickoff_callbacks:
-                if inputs is None:
-                    inputs = {}
-                inputs = before_callback(inputs)
-
-            crewai_event_bus.emit(
-                self,
-                CrewKickoffStartedEvent(crew_name=self.name or "crew", inputs=inputs),
-            )
-
-            # Starts the crew to work on its assigned tasks.
-            self._task_output_handler.reset()
-            self._logging_color = "bold_purple"
-
-            if inputs is not None:
-                self._inputs = inputs
-                self._interpolate_inputs(inputs)
-            self._set_tasks_callbacks()
-
-            i18n = I18N(prompt_file=self.prompt_file)
-
-            for agent in self.agents:
-                agent.i18n = i18n
-                # type: ignore[attr-defined] # Argument 1 to "_interpolate_inputs" of "Crew" has incompatible type "dict[str, Any] | None"; expected "dict[str, Any]"
-                agent.crew = self  # type: ignore[attr-defined]
-                agent.set_knowledge(crew_embedder=self.embedder)
-                # TODO: Create an AgentFunctionCalling protocol for future refactoring
-                if not agent.function_calling_llm:  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
-                    agent.function_calling_llm = self.function_calling_llm  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
-
-                if not agent.step_callback:  # type: ignore # "BaseAgent" has no attribute "step_callback"
-                    agent.step_callback = self.step_callback  # type: ignore # "BaseAgent" has no attribute "step_callback"
-
-                agent.create_agent_executor()
-
-            if self.planning:
-                self._handle_crew_planning()
+            self._start_task_executor()
+            inputs = self._prepare_kickoff(inputs)
 
             if self.process == Process.sequential:
                 result = self._run_sequential_process()
             elif self.process == Process.hierarchical:
                 result = self._run_hierarchical_process()
+            elif self.process == Process.dag:
+                result = self._run_dag_process()
             else:
                 raise NotImplementedError(
                     f"The process '{self.process}' is not implemented yet."
                 )
 
-            for after_callback in self.after_kickoff_callbacks:
-                result = after_callback(result)
-
-            self.usage_metrics = self.calculate_usage_metrics()
-
-            return result
+            return self._complete_kickoff(result)
         except Exception as e:
             crewai_event_bus.emit(
                 self,
@@ -687,10 +774,122 @@ class Crew(FlowTrackable, BaseModel):
             )
             raise
         finally:
+            self._stop_task_executor()
+            self._kickoff_running = False
             detach(token)
 
-    def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[CrewOutput]:
-        """Executes the Crew's workflow for each input in the list and aggregates results."""
+    def _start_task_executor(self) -> None:
+        """Create the crew's own pool for async tasks, if it has one, for a run."""
+        if self.max_async_workers:
+            self._task_executor = TaskExecutor(max_workers=self.max_async_workers)
+
+    def _stop_task_executor(self) -> None:
+        """Release the worker threads of the crew's own pool once a run is over.
+
+        The pool is kept for its metrics, but its threads are stopped, so that
+        copies and forks of the crew never leave idle workers behind.
+        """
+        if self.max_async_workers and self._task_executor is not None:
+            self._task_executor.shutdown(wait=False, cancel_futures=True)
+
+    def cancel(self, reason: Optional[str] = None) -> None:
+        """Stop the running kickoff.
+
+        Agents stop at their next step, streamed LLM responses are dropped and
+        the kickoff raises ExecutionCancelledException. Called while no
+        kickoff is running, it cancels the next kickoff before its first task.
+        """
+        if self._cancel_running_kickoff(reason):
+            return
+        pending = CancellationToken()
+        pending.cancel(reason)
+        self._pending_cancellation = pending
+
+    def _cancel_running_kickoff(self, reason: Optional[str] = None) -> bool:
+        """Cancel the kickoff that is running, if any, and tell whether there was one."""
+        if not self._kickoff_running:
+            return False
+        self._cancellation_token.cancel(reason)
+        return True
+
+    def _start_cancellation_token(self, deadline: Optional[float]) -> None:
+        """Give the kickoff a fresh token, carrying over a cancel() made before it."""
+        self._cancellation_token = CancellationToken(
+            timeout=deadline, parent=self._pending_cancellation
+        )
+        self._pending_cancellation = None
+        self._kickoff_running = True
+
+    def _prepare_kickoff(
+        self, inputs: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Run the before-kickoff callbacks and get agents and tasks ready to run."""
+        for before_callback in self.before_kickoff_callbacks:
+            if inputs is None:
+                inputs = {}
+            inputs = before_callback(inputs)
+
+        crewai_event_bus.emit(
+            self,
+            CrewKickoffStartedEvent(crew_name=self.name or "crew", inputs=inputs),
+        )
+
+        # Starts the crew to work on its assigned tasks.
+        if self._log_task_outputs:
+            self._task_output_handler.reset()
+        self._logging_color = "bold_purple"
+
+        if inputs is not None:
+            self._inputs = inputs
+            self._interpolate_inputs(inputs)
+        self._set_tasks_callbacks()
+        self._setup_agents()
+
+        if self.planning:
+            self._handle_crew_planning()
+
+        return inputs
+
+    def _setup_agents(self) -> None:
+        """Attach the agents to this crew and create their executors."""
+        i18n = I18N(prompt_file=self.prompt_file)
+
+        for agent in self.agents:
+            agent.i18n = i18n
+            # type: ignore[attr-defined] # Argument 1 to "_interpolate_inputs" of "Crew" has incompatible type "dict[str, Any] | None"; expected "dict[str, Any]"
+            agent.crew = self  # type: ignore[attr-defined]
+            agent.set_knowledge(crew_embedder=self.embedder)
+            # TODO: Create an AgentFunctionCalling protocol for future refactoring
+            if not agent.function_calling_llm:  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
+                agent.function_calling_llm = self.function_calling_llm  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
+
+            if not agent.step_callback:  # type: ignore # "BaseAgent" has no attribute "step_callback"
+                agent.step_callback = self.step_callback  # type: ignore # "BaseAgent" has no attribute "step_callback"
+
+            agent.create_agent_executor()
+
+    def _complete_kickoff(self, result: CrewOutput) -> CrewOutput:
+        """Run the after-kickoff callbacks and record the usage metrics."""
+        for after_callback in self.after_kickoff_callbacks:
+            result = after_callback(result)
+
+        self.usage_metrics = self.calculate_usage_metrics()
+
+        return result
+
+    def kickoff_for_each(
+        self, inputs: List[Dict[str, Any]], max_workers: Optional[int] = None
+    ) -> List[CrewOutput]:
+        """Executes the Crew's workflow for each input in the list and aggregates results.
+
+        Inputs run one after another on copies of the crew, unless max_workers
+        is given: up to max_workers inputs then run at once, as with
+        kickoff_for_each_iter.
+        """
+        if max_workers is not None:
+            outputs = dict(self.kickoff_for_each_iter(inputs, max_workers=max_workers))
+            return [outputs[index] for index in range(len(outputs))]
+
         results: List[CrewOutput] = []
 
         # Initialize the parent crew's usage metrics
@@ -710,9 +909,146 @@ class Crew(FlowTrackable, BaseModel):
         self._task_output_handler.reset()
         return results
 
-    async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = {}) -> CrewOutput:
-        """Asynchronous kickoff method to start the crew execution."""
-        return await asyncio.to_thread(self.kickoff, inputs)
+    def kickoff_for_each_iter(
+        self, inputs: Iterable[Dict[str, Any]], max_workers: int = 4
+    ) -> Iterator[Tuple[int, CrewOutput]]:
+        """Executes the Crew's workflow for each input, yielding results as they complete.
+
+        Up to max_workers inputs run at once, each on a fork of this crew
+        made right before its run. Forks share the LLMs, tools, knowledge,
+        memory, tool cache and rate limiter of this crew instead of rebuilding
+        them, so at most max_workers forks are alive at any time and inputs
+        may be a lazy iterable.
+
+        Yields:
+            Tuple[int, CrewOutput]: The position of the input and its output.
+        """
+        total_usage_metrics = UsageMetrics()
+        self.usage_metrics = total_usage_metrics
+        numbered_inputs = enumerate(inputs)
+        running: Dict[Future[Tuple[CrewOutput, UsageMetrics]], int] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="crew-kickoff"
+        ) as executor:
+
+            def submit_next() -> None:
+                next_input = next(numbered_inputs, None)
+                if next_input is not None:
+                    index, input_data = next_input
+                    running[executor.submit(self._kickoff_fork, input_data)] = index
+
+            try:
+                for _ in range(max_workers):
+                    submit_next()
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = running.pop(future)
+                        output, usage_metrics = future.result()
+                        total_usage_metrics.add_usage_metrics(usage_metrics)
+                        submit_next()
+                        yield index, output
+            finally:
+                for future in running:
+                    future.cancel()
+
+        self._task_output_handler.reset()
+
+    def kickoff_for_each_process(
+        self,
+        inputs: List[Dict[str, Any]],
+        processes: Optional[int] = None,
+        crew_factory: Optional[Callable[[], "Crew"]] = None,
+    ) -> List[CrewOutput]:
+        """Executes the Crew's workflow for each input in worker processes.
+
+        Meant for crews with CPU-bound tools, which would serialize on the GIL
+        with kickoff_for_each. Each worker process builds the crew once, with
+        crew_factory or from the CrewBase class that created this crew, and
+        runs its inputs on forks of it. Usage metrics of all runs are merged
+        into this crew's.
+
+        Args:
+            inputs: Inputs of each run.
+            processes: Number of worker processes. Defaults to the CPU count.
+            crew_factory: Picklable callable building the crew. Required for
+                crews not created by a CrewBase class.
+
+        Returns:
+            List[CrewOutput]: The outputs, in the order of the inputs.
+        """
+        factory = crew_factory or self._factory
+        if factory is None:
+            raise ValueError(
+                "kickoff_for_each_process requires a crew created by a CrewBase class or a crew_factory."
+            )
+
+        results: List[CrewOutput] = []
+        total_usage_metrics = UsageMetrics()
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_process_crew,
+            initargs=(factory,),
+        ) as executor:
+            for output, usage_metrics in executor.map(_kickoff_process_crew, inputs):
+                total_usage_metrics.add_usage_metrics(usage_metrics)
+                results.append(output)
+
+        self.usage_metrics = total_usage_metrics
+        return results
+
+    def _kickoff_fork(
+        self, inputs: Dict[str, Any]
+    ) -> Tuple[CrewOutput, UsageMetrics]:
+        crew = self._fork()
+        output = crew.kickoff(inputs=inputs)
+        return output, crew.usage_metrics or UsageMetrics()
+
+    async def kickoff_async(
+        self,
+        inputs: Optional[Dict[str, Any]] = {},
+        deadline: Optional[float] = None,
+    ) -> CrewOutput:
+        """Asynchronous kickoff method to start the crew execution.
+
+        Tasks run natively on the calling event loop: LLM calls are awaited
+        instead of blocking a thread per crew, and tasks marked with
+        async_execution run as concurrent coroutines. The deadline is the
+        same as for kickoff.
+        """
+        self._start_cancellation_token(deadline)
+        ctx = baggage.set_baggage(
+            "crew_context", CrewContext(id=str(self.id), key=self.key)
+        )
+        token = attach(ctx)
+
+        try:
+            self._start_task_executor()
+            inputs = await asyncio.to_thread(self._prepare_kickoff, inputs)
+
+            if self.process == Process.sequential:
+                result = await self._arun_sequential_process()
+            elif self.process == Process.hierarchical:
+                result = await self._arun_hierarchical_process()
+            elif self.process == Process.dag:
+                result = await self._arun_dag_process()
+            else:
+                raise NotImplementedError(
+                    f"The process '{self.process}' is not implemented yet."
+                )
+
+            return self._complete_kickoff(result)
+        except Exception as e:
+            crewai_event_bus.emit(
+                self,
+                CrewKickoffFailedEvent(error=str(e), crew_name=self.name or "crew"),
+            )
+            raise
+        finally:
+            self._stop_task_executor()
+            self._kickoff_running = False
+            detach(token)
 
     async def kickoff_for_each_async(self, inputs: List[Dict]) -> List[CrewOutput]:
         crew_copies = [self.copy() for _ in inputs]
@@ -736,6 +1072,101 @@ class Crew(FlowTrackable, BaseModel):
         self._task_output_handler.reset()
         return results
 
+    def kickoff_stream(
+        self,
+        inputs: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[CrewStreamItem]:
+        """Run the crew, yielding its progress as it happens.
+
+        Yields the TaskStartedEvent, LLMStreamChunkEvent, ToolUsageFinishedEvent
+        and TaskCompletedEvent of this kickoff only, then the CrewOutput. Token
+        chunks are only produced by LLMs created with stream=True. Closing the
+        generator early cancels the kickoff.
+
+        Args:
+            inputs: Values interpolated into the agents and tasks.
+            deadline: Seconds the kickoff may take, as for kickoff.
+        """
+        items: "queue.Queue[Any]" = queue.Queue()
+        result: "Future[CrewOutput]" = Future()
+
+        def run() -> None:
+            try:
+                result.set_result(self.kickoff(inputs=inputs, deadline=deadline))
+            except BaseException as e:
+                result.set_exception(e)
+            finally:
+                items.put(_STREAM_END)
+
+        with self._stream_events(items.put):
+            thread = threading.Thread(target=run, daemon=True)
+            thread.start()
+            try:
+                while (item := items.get()) is not _STREAM_END:
+                    yield item
+            finally:
+                # A kickoff that already returned must not leave a pending
+                # cancel behind for the crew's next kickoff
+                if not result.done():
+                    self._cancel_running_kickoff("Kickoff stream was closed")
+        yield result.result()
+
+    async def kickoff_stream_async(
+        self,
+        inputs: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[CrewStreamItem]:
+        """Async version of kickoff_stream, running the crew with kickoff_async."""
+        loop = asyncio.get_running_loop()
+        items: "asyncio.Queue[Any]" = asyncio.Queue()
+
+        def put(item: Any) -> None:
+            # Events are also emitted from worker threads
+            loop.call_soon_threadsafe(items.put_nowait, item)
+
+        with self._stream_events(put):
+            kickoff = asyncio.ensure_future(
+                self.kickoff_async(inputs=inputs, deadline=deadline)
+            )
+            kickoff.add_done_callback(lambda _: put(_STREAM_END))
+            try:
+                while (item := await items.get()) is not _STREAM_END:
+                    yield item
+            finally:
+                if not kickoff.done():
+                    self._cancel_running_kickoff("Kickoff stream was closed")
+                    kickoff.cancel()
+        yield kickoff.result()
+
+    @contextmanager
+    def _stream_events(self, put: Callable[[Any], None]) -> Iterator[None]:
+        """Pass the streamed events of this crew's kickoff to put while the block runs."""
+
+        def handler(source: Any, event: Any) -> None:
+            if isinstance(event, LLMStreamChunkEvent):
+                # The manager agent of a hierarchical crew is created by kickoff
+                agents = [*self.agents, self.manager_agent]
+                owned = any(
+                    agent is not None and agent.id == event.agent_id
+                    for agent in agents
+                )
+            elif isinstance(event, ToolUsageFinishedEvent):
+                owned = getattr(event.agent, "crew", None) is self
+            else:
+                agent = getattr(event.task, "agent", None)
+                owned = getattr(agent, "crew", None) is self
+            if owned:
+                put(event)
+
+        for event_type in STREAM_EVENT_TYPES:
+            crewai_event_bus.register_handler(event_type, handler)
+        try:
+            yield
+        finally:
+            for event_type in STREAM_EVENT_TYPES:
+                crewai_event_bus.unregister_handler(event_type, handler)
+
     def _handle_crew_planning(self):
         """Handles the Crew planning."""
         self._logger.log("info", "Planning the crew execution")
@@ -753,6 +1184,9 @@ class Crew(FlowTrackable, BaseModel):
         task_index: int,
         was_replayed: bool = False,
     ):
+        if not self._log_task_outputs:
+            return
+
         if self._inputs:
             inputs = self._inputs
         else:
@@ -774,6 +1208,33 @@ class Crew(FlowTrackable, BaseModel):
             "was_replayed": was_replayed,
         }
         self._task_output_handler.update(task_index, log)
+        self._task_output_handler.clear_checkpoint(task_index)
+
+    def _save_task_checkpoint(
+        self,
+        task: Task,
+        messages: List[Dict[str, Any]],
+        iterations: int,
+        tool_results: List[Dict[str, Any]],
+    ) -> None:
+        """Store the state of a task's agent loop so that replay can resume it."""
+        if not self._log_task_outputs:
+            return
+        task_index = next((i for i, t in enumerate(self.tasks) if t is task), None)
+        if task_index is None:
+            return
+        self._task_output_handler.save_checkpoint(
+            task_index,
+            task,
+            messages=messages,
+            iterations=iterations,
+            tool_results=tool_results,
+            inputs=self._inputs,
+        )
+
+    def _pop_task_checkpoint(self, task: Task) -> Optional[Dict[str, Any]]:
+        """Return, once, the checkpoint replay selected to resume a task from."""
+        return self._resume_checkpoints.pop(id(task), None)
 
     def _run_sequential_process(self) -> CrewOutput:
         """Executes tasks sequentially and returns the final output."""
@@ -784,6 +1245,23 @@ class Crew(FlowTrackable, BaseModel):
         self._create_manager_agent()
         return self._execute_tasks(self.tasks)
 
+    def _run_dag_process(self) -> CrewOutput:
+        """Executes each task as soon as the tasks it depends on are done."""
+        return self._execute_dag_tasks(self.tasks)
+
+    async def _arun_sequential_process(self) -> CrewOutput:
+        """Async version of _run_sequential_process."""
+        return await self._aexecute_tasks(self.tasks)
+
+    async def _arun_hierarchical_process(self) -> CrewOutput:
+        """Async version of _run_hierarchical_process."""
+        self._create_manager_agent()
+        return await self._aexecute_tasks(self.tasks)
+
+    async def _arun_dag_process(self) -> CrewOutput:
+        """Async version of _run_dag_process."""
+        return await self._aexecute_dag_tasks(self.tasks)
+
     def _create_manager_agent(self):
         i18n = I18N(prompt_file=self.prompt_file)
         if self.manager_agent is not None:
@@ -801,7 +1279,9 @@ class Crew(FlowTrackable, BaseModel):
                 role=i18n.retrieve("hierarchical_manager_agent", "role"),
                 goal=i18n.retrieve("hierarchical_manager_agent", "goal"),
                 backstory=i18n.retrieve("hierarchical_manager_agent", "backstory"),
-                tools=AgentTools(agents=self.agents).tools(),
+                tools=AgentTools(
+                    agents=self.agents, parallel_delegation=self.parallel_delegation
+                ).tools(),
                 allow_delegation=True,
                 llm=self.manager_llm,
                 verbose=self.verbose,
@@ -828,6 +1308,99 @@ class Crew(FlowTrackable, BaseModel):
         task_outputs: List[TaskOutput] = []
         futures: List[Tuple[Task, Future[TaskOutput], int]] = []
         last_sync_output: Optional[TaskOutput] = None
+        speculation: Optional[_Speculation] = None
+
+        try:
+            for task_index, task in enumerate(tasks):
+                if start_index is not None and task_index < start_index:
+                    if task.output:
+                        if task.async_execution:
+                            task_outputs.append(task.output)
+                        else:
+                            task_outputs = [task.output]
+                            last_sync_output = task.output
+                    continue
+
+                agent_to_use, tools_for_task = self._prepare_task_execution(task)
+
+                if isinstance(task, ConditionalTask):
+                    skipped_task_output = self._handle_conditional_task(
+                        task, task_outputs, futures, task_index, was_replayed
+                    )
+                    speculative_output = None
+                    if speculation is not None and speculation[0] is task:
+                        speculative_output = self._finish_speculation(
+                            speculation,
+                            task_outputs,
+                            agent_to_use,
+                            tools_for_task,
+                            keep=skipped_task_output is None,
+                        )
+                        speculation = None
+                    if skipped_task_output:
+                        task_outputs.append(skipped_task_output)
+                        continue
+                    if speculative_output:
+                        task_outputs.append(speculative_output)
+                        self._process_task_result(task, speculative_output)
+                        self._store_execution_log(
+                            task, speculative_output, task_index, was_replayed
+                        )
+                        continue
+
+                if task.async_execution:
+                    context = self._get_context(
+                        task, [last_sync_output] if last_sync_output else []
+                    )
+                    future = task.execute_async(
+                        agent=agent_to_use,
+                        context=context,
+                        tools=cast(List[BaseTool], tools_for_task),
+                        executor=self._task_executor,
+                    )
+                    futures.append((task, future, task_index))
+                else:
+                    if futures:
+                        task_outputs = self._process_async_tasks(futures, was_replayed)
+                        futures.clear()
+
+                    context = self._get_context(task, task_outputs)
+                    speculation = self._start_speculation(
+                        tasks, task_index, agent_to_use, task_outputs
+                    )
+                    task_output = task.execute_sync(
+                        agent=agent_to_use,
+                        context=context,
+                        tools=cast(List[BaseTool], tools_for_task),
+                    )
+                    task_outputs.append(task_output)
+                    self._process_task_result(task, task_output)
+                    self._store_execution_log(
+                        task, task_output, task_index, was_replayed
+                    )
+        finally:
+            if speculation is not None:
+                speculation[3].cancel("Speculative execution discarded")
+
+        if futures:
+            task_outputs = self._process_async_tasks(futures, was_replayed)
+
+        return self._create_crew_output(task_outputs)
+
+    async def _aexecute_tasks(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Async version of _execute_tasks.
+
+        Tasks with async_execution run as asyncio tasks on the current event
+        loop instead of in separate threads.
+        """
+        task_outputs: List[TaskOutput] = []
+        pending: List[Tuple[Task, asyncio.Task[TaskOutput], int]] = []
+        last_sync_output: Optional[TaskOutput] = None
 
         for task_index, task in enumerate(tasks):
             if start_index is not None and task_index < start_index:
@@ -839,26 +1412,16 @@ class Crew(FlowTrackable, BaseModel):
                         last_sync_output = task.output
                 continue
 
-            agent_to_use = self._get_agent_to_use(task)
-            if agent_to_use is None:
-                raise ValueError(
-                    f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
-                )
-
-            # Determine which tools to use - task tools take precedence over agent tools
-            tools_for_task = task.tools or agent_to_use.tools or []
-            # Prepare tools and ensure they're compatible with task execution
-            tools_for_task = self._prepare_tools(
-                agent_to_use,
-                task,
-                cast(Union[List[Tool], List[BaseTool]], tools_for_task),
-            )
-
-            self._log_task_start(task, agent_to_use.role)
+            agent_to_use, tools_for_task = self._prepare_task_execution(task)
 
             if isinstance(task, ConditionalTask):
+                if pending:
+                    task_outputs = await self._aprocess_async_tasks(
+                        pending, was_replayed
+                    )
+                    pending.clear()
                 skipped_task_output = self._handle_conditional_task(
-                    task, task_outputs, futures, task_index, was_replayed
+                    task, task_outputs, [], task_index, was_replayed
                 )
                 if skipped_task_output:
                     task_outputs.append(skipped_task_output)
@@ -868,19 +1431,28 @@ class Crew(FlowTrackable, BaseModel):
                 context = self._get_context(
                     task, [last_sync_output] if last_sync_output else []
                 )
-                future = task.execute_async(
-                    agent=agent_to_use,
-                    context=context,
-                    tools=cast(List[BaseTool], tools_for_task),
+                pending.append(
+                    (
+                        task,
+                        asyncio.create_task(
+                            task.aexecute(
+                                agent=agent_to_use,
+                                context=context,
+                                tools=cast(List[BaseTool], tools_for_task),
+                            )
+                        ),
+                        task_index,
+                    )
                 )
-                futures.append((task, future, task_index))
             else:
-                if futures:
-                    task_outputs = self._process_async_tasks(futures, was_replayed)
-                    futures.clear()
+                if pending:
+                    task_outputs = await self._aprocess_async_tasks(
+                        pending, was_replayed
+                    )
+                    pending.clear()
 
                 context = self._get_context(task, task_outputs)
-                task_output = task.execute_sync(
+                task_output = await task.aexecute(
                     agent=agent_to_use,
                     context=context,
                     tools=cast(List[BaseTool], tools_for_task),
@@ -889,11 +1461,308 @@ class Crew(FlowTrackable, BaseModel):
                 self._process_task_result(task, task_output)
                 self._store_execution_log(task, task_output, task_index, was_replayed)
 
-        if futures:
-            task_outputs = self._process_async_tasks(futures, was_replayed)
+        if pending:
+            task_outputs = await self._aprocess_async_tasks(pending, was_replayed)
 
         return self._create_crew_output(task_outputs)
 
+    def _execute_dag_tasks(self, tasks: List[Task]) -> CrewOutput:
+        """Executes tasks on a worker pool, following the graph of their contexts.
+
+        A task starts once every task it depends on is done, on at most
+        max_concurrency workers, and never while its agent is busy with
+        another task.
+
+        Args:
+            tasks (List[Task]): List of tasks to execute
+
+        Returns:
+            CrewOutput: Final output of the crew
+        """
+        dependencies = self._get_task_dependencies(tasks)
+        outputs: Dict[int, TaskOutput] = {}
+        pending = list(range(len(tasks)))
+        running: Dict[Future[TaskOutput], int] = {}
+        busy_agents: Set[int] = set()
+        max_workers = self.max_concurrency or len(tasks)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="crew-dag"
+        ) as executor:
+            try:
+                while pending or running:
+                    ready = self._start_ready_dag_tasks(
+                        tasks,
+                        dependencies,
+                        outputs,
+                        pending,
+                        busy_agents,
+                        max_workers - len(running),
+                    )
+                    for task_index, context in ready:
+                        task = tasks[task_index]
+                        agent_to_use, tools_for_task = self._prepare_task_execution(task)
+                        future = executor.submit(
+                            task.execute_sync,
+                            agent=agent_to_use,
+                            context=context,
+                            tools=cast(List[BaseTool], tools_for_task),
+                        )
+                        running[future] = task_index
+
+                    if not running:
+                        break
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        task_index = running.pop(future)
+                        self._complete_dag_task(
+                            tasks[task_index],
+                            task_index,
+                            future.result(),
+                            outputs,
+                            busy_agents,
+                        )
+            except BaseException:
+                # Stop the other running tasks at their next step, instead of
+                # waiting for their agents to finish before raising
+                self._cancellation_token.cancel("Another task of the crew failed")
+                for future in running:
+                    future.cancel()
+                raise
+
+        return self._create_crew_output([outputs[i] for i in range(len(tasks))])
+
+    async def _aexecute_dag_tasks(self, tasks: List[Task]) -> CrewOutput:
+        """Async version of _execute_dag_tasks.
+
+        Ready tasks run as asyncio tasks on the current event loop instead of
+        on a worker pool.
+        """
+        dependencies = self._get_task_dependencies(tasks)
+        outputs: Dict[int, TaskOutput] = {}
+        pending = list(range(len(tasks)))
+        running: Dict["asyncio.Task[TaskOutput]", int] = {}
+        busy_agents: Set[int] = set()
+        max_workers = self.max_concurrency or len(tasks)
+
+        try:
+            while pending or running:
+                ready = self._start_ready_dag_tasks(
+                    tasks,
+                    dependencies,
+                    outputs,
+                    pending,
+                    busy_agents,
+                    max_workers - len(running),
+                )
+                for task_index, context in ready:
+                    task = tasks[task_index]
+                    agent_to_use, tools_for_task = self._prepare_task_execution(task)
+                    pending_task = asyncio.create_task(
+                        task.aexecute(
+                            agent=agent_to_use,
+                            context=context,
+                            tools=cast(List[BaseTool], tools_for_task),
+                        )
+                    )
+                    running[pending_task] = task_index
+
+                if not running:
+                    break
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for pending_task in done:
+                    task_index = running.pop(pending_task)
+                    self._complete_dag_task(
+                        tasks[task_index],
+                        task_index,
+                        pending_task.result(),
+                        outputs,
+                        busy_agents,
+                    )
+        finally:
+            for pending_task in running:
+                pending_task.cancel()
+
+        return self._create_crew_output([outputs[i] for i in range(len(tasks))])
+
+    def _get_task_dependencies(self, tasks: List[Task]) -> List[List[int]]:
+        """Return, for each task, the indices of the tasks it depends on.
+
+        A task depends on the tasks in its context. A task whose context is
+        not specified depends on every task before it, as in the sequential
+        process, while context=None or [] marks a task with no dependencies.
+        """
+        task_indices = {id(task): i for i, task in enumerate(tasks)}
+        dependencies: List[List[int]] = []
+        for task_index, task in enumerate(tasks):
+            if task.context is NOT_SPECIFIED:
+                dependencies.append(list(range(task_index)))
+            else:
+                dependencies.append(
+                    sorted(
+                        task_indices[id(context_task)]
+                        for context_task in cast(List[Task], task.context or [])
+                        if id(context_task) in task_indices
+                    )
+                )
+        return dependencies
+
+    def _start_ready_dag_tasks(
+        self,
+        tasks: List[Task],
+        dependencies: List[List[int]],
+        outputs: Dict[int, TaskOutput],
+        pending: List[int],
+        busy_agents: Set[int],
+        slots: int,
+    ) -> List[Tuple[int, str]]:
+        """Take up to slots ready tasks out of pending, with their context.
+
+        Conditional tasks whose condition fails on the output of their last
+        dependency are skipped right away, which may make more tasks ready.
+        """
+        ready: List[Tuple[int, str]] = []
+        progressed = True
+        while progressed:
+            progressed = False
+            for task_index in list(pending):
+                if len(ready) >= slots:
+                    return ready
+                task = tasks[task_index]
+                if id(task.agent) in busy_agents or any(
+                    dependency not in outputs for dependency in dependencies[task_index]
+                ):
+                    continue
+
+                pending.remove(task_index)
+                dependency_outputs = [outputs[i] for i in dependencies[task_index]]
+                if isinstance(task, ConditionalTask):
+                    skipped_task_output = self._handle_conditional_task(
+                        task, dependency_outputs, [], task_index, False
+                    )
+                    if skipped_task_output:
+                        outputs[task_index] = skipped_task_output
+                        progressed = True
+                        continue
+
+                busy_agents.add(id(task.agent))
+                ready.append((task_index, self._get_context(task, dependency_outputs)))
+        return ready
+
+    def _complete_dag_task(
+        self,
+        task: Task,
+        task_index: int,
+        task_output: TaskOutput,
+        outputs: Dict[int, TaskOutput],
+        busy_agents: Set[int],
+    ) -> None:
+        busy_agents.discard(id(task.agent))
+        outputs[task_index] = task_output
+        self._process_task_result(task, task_output)
+        self._store_execution_log(task, task_output, task_index)
+
+    def _prepare_task_execution(self, task: Task) -> Tuple[BaseAgent, List[BaseTool]]:
+        """Resolve the agent and tools for a task and log its start."""
+        agent_to_use, tools_for_task = self._get_task_agent_and_tools(task)
+        self._log_task_start(task, agent_to_use.role)
+        return agent_to_use, tools_for_task
+
+    def _get_task_agent_and_tools(
+        self, task: Task
+    ) -> Tuple[BaseAgent, List[BaseTool]]:
+        agent_to_use = self._get_agent_to_use(task)
+        if agent_to_use is None:
+            raise ValueError(
+                f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+            )
+
+        # Determine which tools to use - task tools take precedence over agent tools
+        tools_for_task = task.tools or agent_to_use.tools or []
+        # Prepare tools and ensure they're compatible with task execution
+        tools_for_task = self._prepare_tools(
+            agent_to_use,
+            task,
+            cast(Union[List[Tool], List[BaseTool]], tools_for_task),
+        )
+        return agent_to_use, tools_for_task
+
+    def _start_speculation(
+        self,
+        tasks: List[Task],
+        task_index: int,
+        agent: BaseAgent,
+        task_outputs: List[TaskOutput],
+    ) -> Optional[_Speculation]:
+        """Start the conditional task after tasks[task_index] early if it is predicted to run.
+
+        The conditional task must run on another agent than the task before
+        it, and its explicit context must only hold tasks that are complete.
+        Pending async tasks have been waited for by then.
+        """
+        if task_index + 1 >= len(tasks):
+            return None
+        task = tasks[task_index + 1]
+        if not isinstance(task, ConditionalTask) or not isinstance(task.context, list):
+            return None
+        completed = tasks[:task_index]
+        if any(
+            all(context_task is not done for done in completed)
+            for context_task in task.context
+        ):
+            return None
+        if not task.should_speculate(task_outputs):
+            return None
+
+        speculative_agent, tools = self._get_task_agent_and_tools(task)
+        if speculative_agent is agent:
+            return None
+
+        context = self._get_context(task, task_outputs)
+        token = self._cancellation_token.child()
+        future = (self._task_executor or get_default_task_executor()).submit(
+            task.speculate, speculative_agent, context, tools, token
+        )
+        self._logger.log(
+            "debug",
+            f"Speculatively starting conditional task: {task.description}",
+            color="yellow",
+        )
+        return task, future, context, token
+
+    def _finish_speculation(
+        self,
+        speculation: _Speculation,
+        task_outputs: List[TaskOutput],
+        agent: BaseAgent,
+        tools: List[BaseTool],
+        keep: bool,
+    ) -> Optional[TaskOutput]:
+        """Turn a speculative run into the task output, or discard it.
+
+        The run is kept when the condition holds and the context of the task
+        is still the one it ran with. Otherwise it is cancelled and None is
+        returned, after the agent has stopped so that it can run again.
+        """
+        task, future, context, token = speculation
+        if keep and context == self._get_context(task, task_outputs):
+            try:
+                result = future.result()
+            except Exception as e:
+                # A failure of the kickoff itself is not retried
+                self._cancellation_token.raise_if_cancelled()
+                self._logger.log(
+                    "debug", f"Speculative execution failed, running again: {e}"
+                )
+            else:
+                return task._execute_core(agent, context, tools, result=result)
+        else:
+            token.cancel("Speculative execution discarded")
+        wait([future])
+        return None
+
     def _handle_conditional_task(
         self,
         task: ConditionalTask,
@@ -1037,6 +1906,11 @@ class Crew(FlowTrackable, BaseModel):
                 tools = self._inject_delegation_tools(
                     tools, self.manager_agent, self.agents
                 )
+                if self.parallel_delegation:
+                    tools = self._merge_tools(
+                        tools,
+                        AgentTools(agents=self.agents, parallel_delegation=True).tools(),
+                    )
         return cast(List[BaseTool], tools)
 
     def _get_context(self, task: Task, task_outputs: List[TaskOutput]) -> str:
@@ -1071,8 +1945,6 @@ class Crew(FlowTrackable, BaseModel):
             raise ValueError("No valid task outputs available to create crew output.")
         final_task_output = valid_outputs[-1]
 
-        final_string_output = final_task_output.raw
-        self._finish_execution(final_string_output)
         token_usage = self.calculate_usage_metrics()
         crewai_event_bus.emit(
             self,
@@ -1095,7 +1967,29 @@ class Crew(FlowTrackable, BaseModel):
     ) -> List[TaskOutput]:
         task_outputs: List[TaskOutput] = []
         for future_task, future, task_index in futures:
-            task_output = future.result()
+            try:
+                task_output = future.result()
+            except BaseException:
+                # Tasks still waiting for a worker are not started anymore
+                for _, other_future, _ in futures:
+                    other_future.cancel()
+                raise
+            task_outputs.append(task_output)
+            self._process_task_result(future_task, task_output)
+            self._store_execution_log(
+                future_task, task_output, task_index, was_replayed
+            )
+        return task_outputs
+
+    async def _aprocess_async_tasks(
+        self,
+        pending: List[Tuple[Task, "asyncio.Task[TaskOutput]", int]],
+        was_replayed: bool = False,
+    ) -> List[TaskOutput]:
+        """Async version of _process_async_tasks, awaiting the pending tasks."""
+        results = await asyncio.gather(*(pending_task for _, pending_task, _ in pending))
+        task_outputs: List[TaskOutput] = []
+        for (future_task, _, task_index), task_output in zip(pending, results):
             task_outputs.append(task_output)
             self._process_task_result(future_task, task_output)
             self._store_execution_log(
@@ -1118,23 +2012,46 @@ class Crew(FlowTrackable, BaseModel):
     def replay(
         self, task_id: str, inputs: Optional[Dict[str, Any]] = None
     ) -> CrewOutput:
-        stored_outputs = self._task_output_handler.load()
-        if not stored_outputs:
-            raise ValueError(f"Task with id {task_id} not found in the crew's tasks.")
+        """Re-run the crew from a task, reusing the stored outputs of the tasks before it.
 
+        A task that was still running when the previous run stopped resumes
+        from its last checkpoint, keeping the LLM calls and tool results of
+        the iterations it had completed.
+        """
+        stored_outputs = self._task_output_handler.load() or []
         start_index = self._find_task_index(task_id, stored_outputs)
 
+        # A task that was still running has no output yet, only a checkpoint
+        checkpoint = None
         if start_index is None:
+            checkpoint = next(
+                (
+                    checkpoint
+                    for checkpoint in self._task_output_handler.load_checkpoints()
+                    if checkpoint["task_id"] == str(task_id)
+                ),
+                None,
+            )
+            if checkpoint is not None:
+                start_index = checkpoint["task_index"]
+
+        if start_index is None or start_index >= len(self.tasks):
             raise ValueError(f"Task with id {task_id} not found in the crew's tasks.")
 
         replay_inputs = (
-            inputs if inputs is not None else stored_outputs[start_index]["inputs"]
+            inputs
+            if inputs is not None
+            else (checkpoint or stored_outputs[start_index])["inputs"]
         )
         self._inputs = replay_inputs
 
         if replay_inputs:
             self._interpolate_inputs(replay_inputs)
 
+        # A crew rebuilt in a fresh process has not been kicked off, so its
+        # agents must be attached before they can resume a checkpoint
+        self._setup_agents()
+
         if self.process == Process.hierarchical:
             self._create_manager_agent()
 
@@ -1152,9 +2069,16 @@ class Crew(FlowTrackable, BaseModel):
             )
             self.tasks[i].output = task_output
 
+        resumed_task = self.tasks[start_index]
+        if checkpoint is not None and checkpoint["task_key"] == resumed_task.key:
+            self._resume_checkpoints[id(resumed_task)] = checkpoint
+
         self._logging_color = "bold_blue"
-        result = self._execute_tasks(self.tasks, start_index, True)
-        return result
+        self._start_task_executor()
+        try:
+            return self._execute_tasks(self.tasks, start_index, True)
+        finally:
+            self._stop_task_executor()
 
     def query_knowledge(
         self, query: List[str], results_limit: int = 3, score_threshold: float = 0.35
@@ -1205,6 +2129,7 @@ class Crew(FlowTrackable, BaseModel):
             "_execution_span",
             "_file_handler",
             "_cache_handler",
+            "tool_cache",
             "_short_term_memory",
             "_long_term_memory",
             "_entity_memory",
@@ -1268,10 +2193,53 @@ class Crew(FlowTrackable, BaseModel):
             knowledge=existing_knowledge,
             manager_agent=manager_agent,
             manager_llm=manager_llm,
+            tool_cache=self.tool_cache,
         )
 
         return copied_crew
 
+    def _fork(self) -> "Crew":
+        """Creates a cheap copy of the Crew for one more run.
+
+        Unlike copy, agents and tasks are forked instead of being dumped and
+        validated again. LLMs, tools, knowledge, memory, the tool cache and
+        the rate limiters are shared with this crew, so concurrent forks also
+        share one max_rpm/max_tpm budget. Forks do not log their task outputs
+        or checkpoints, as concurrent forks would overwrite each other's
+        entries in the replay log.
+
+        Returns:
+            Crew: A new instance with its own agents and tasks
+        """
+        agents: Dict[int, BaseAgent] = {
+            id(agent): agent._fork() for agent in self.agents
+        }
+        manager_agent = self.manager_agent._fork() if self.manager_agent else None
+
+        tasks: Dict[int, Task] = {id(task): task._fork(agents) for task in self.tasks}
+        for task in tasks.values():
+            if isinstance(task.context, list):
+                task.context = [
+                    tasks.get(id(context_task), context_task)
+                    for context_task in task.context
+                ]
+
+        forked_crew = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agents": list(agents.values()),
+                "tasks": list(tasks.values()),
+                "manager_agent": manager_agent,
+                "usage_metrics": None,
+                "execution_logs": [],
+            }
+        )
+        forked_crew._resume_checkpoints = {}
+        forked_crew._log_task_outputs = False
+        for agent in forked_crew.agents:
+            forked_crew._attach_agent(agent)
+        return forked_crew
+
     def _set_tasks_callbacks(self) -> None:
         """Sets callback for every task suing task_callback"""
         for task in self.tasks:
@@ -1291,10 +2259,6 @@ class Crew(FlowTrackable, BaseModel):
         for agent in self.agents:
             agent.interpolate_inputs(inputs)
 
-    def _finish_execution(self, final_string_output: str) -> None:
-        if self.max_rpm:
-            self._rpm_controller.stop_rpm_counter()
-
     def calculate_usage_metrics(self) -> UsageMetrics:
         """Calculates and returns the usage metrics."""
         total_usage_metrics = UsageMetrics()
@@ -1513,3 +2477,17 @@ class Crew(FlowTrackable, BaseModel):
         """Reset crew and agent knowledge storage."""
         for ks in knowledges:
             ks.reset()
+
+
+# Crew built once in each worker process of Crew.kickoff_for_each_process.
+_process_crew: Optional[Crew] = None
+
+
+def _init_process_crew(factory: Callable[[], Crew]) -> None:
+    global _process_crew
+    _process_crew = factory()
+
+
+def _kickoff_process_crew(inputs: Dict[str, Any]) -> Tuple[CrewOutput, UsageMetrics]:
+    assert _process_crew is not None
+    return _process_crew._kickoff_fork(inputs)
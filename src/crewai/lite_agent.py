@@ -43,9 +43,11 @@ from crewai.flow.flow_trackable import FlowTrackable
 from crewai.llm import LLM
 from crewai.tools.base_tool import BaseTool
 from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.tool_registry import ToolRegistry
 from crewai.utilities import I18N
 from crewai.utilities.guardrail import process_guardrail
 from crewai.utilities.agent_utils import (
+    aget_llm_response,
     enforce_rpm_limit,
     format_message_for_llm,
     get_llm_response,
@@ -78,7 +80,10 @@ from crewai.utilities.events.llm_events import (
 from crewai.utilities.llm_utils import create_llm
 from crewai.utilities.printer import Printer
 from crewai.utilities.token_counter_callback import TokenCalcHandler
-from crewai.utilities.tool_utils import execute_tool_and_check_finality
+from crewai.utilities.tool_utils import (
+    aexecute_tool_and_check_finality,
+    execute_tool_and_check_finality,
+)
 
 
 class LiteAgentOutput(BaseModel):
@@ -196,6 +201,7 @@ class LiteAgent(FlowTrackable, BaseModel):
     )
     # Private Attributes
     _parsed_tools: List[CrewStructuredTool] = PrivateAttr(default_factory=list)
+    _tool_registry: Optional[ToolRegistry] = PrivateAttr(default=None)
     _token_process: TokenProcess = PrivateAttr(default_factory=TokenProcess)
     _cache_handler: CacheHandler = PrivateAttr(default_factory=CacheHandler)
     _key: str = PrivateAttr(default_factory=lambda: str(uuid.uuid4()))
@@ -225,6 +231,14 @@ class LiteAgent(FlowTrackable, BaseModel):
 
         return self
 
+    def _get_tool_registry(self) -> ToolRegistry:
+        """Return the registry of the parsed tools, rebuilt only if they changed."""
+        if self._tool_registry is None or not self._tool_registry.matches(
+            self._parsed_tools
+        ):
+            self._tool_registry = ToolRegistry(self._parsed_tools)
+        return self._tool_registry
+
     @model_validator(mode="after")
     def ensure_guardrail_is_callable(self) -> Self:
         if callable(self.guardrail):
@@ -303,7 +317,18 @@ class LiteAgent(FlowTrackable, BaseModel):
             LiteAgentOutput: The result of the agent execution.
         """
         # Create agent info for event emission
-        agent_info = {
+        agent_info = self._get_agent_info()
+
+        try:
+            self._reset_run(messages)
+            return self._execute_core(agent_info=agent_info)
+        except Exception as e:
+            self._handle_kickoff_error(agent_info, e)
+            raise e
+
+    def _get_agent_info(self) -> Dict[str, Any]:
+        """Return the agent info used for event emission."""
+        return {
             "role": self.role,
             "goal": self.goal,
             "backstory": self.backstory,
@@ -311,33 +336,48 @@ class LiteAgent(FlowTrackable, BaseModel):
             "verbose": self.verbose,
         }
 
-        try:
-            # Reset state for this run
-            self._iterations = 0
-            self.tools_results = []
+    def _reset_run(self, messages: Union[str, List[Dict[str, str]]]) -> None:
+        """Reset state for a new run and format the messages for the LLM."""
+        self._iterations = 0
+        self.tools_results = []
+        self._messages = self._format_messages(messages)
 
-            # Format messages for the LLM
-            self._messages = self._format_messages(messages)
+    def _handle_kickoff_error(self, agent_info: Dict[str, Any], e: Exception) -> None:
+        self._printer.print(
+            content="Agent failed to reach a final answer. This is likely a bug - please report it.",
+            color="red",
+        )
+        handle_unknown_error(self._printer, e)
+        # Emit error event
+        crewai_event_bus.emit(
+            self,
+            event=LiteAgentExecutionErrorEvent(
+                agent_info=agent_info,
+                error=str(e),
+            ),
+        )
+
+    def _execute_core(self, agent_info: Dict[str, Any]) -> LiteAgentOutput:
+        self._emit_execution_started(agent_info)
 
+        # Execute the agent using invoke loop
+        agent_finish = self._invoke_loop()
+        output = self._build_output(agent_info, agent_finish)
+        if output is None:
             return self._execute_core(agent_info=agent_info)
+        return output
 
-        except Exception as e:
-            self._printer.print(
-                content="Agent failed to reach a final answer. This is likely a bug - please report it.",
-                color="red",
-            )
-            handle_unknown_error(self._printer, e)
-            # Emit error event
-            crewai_event_bus.emit(
-                self,
-                event=LiteAgentExecutionErrorEvent(
-                    agent_info=agent_info,
-                    error=str(e),
-                ),
-            )
-            raise e
+    async def _aexecute_core(self, agent_info: Dict[str, Any]) -> LiteAgentOutput:
+        """Async version of _execute_core."""
+        self._emit_execution_started(agent_info)
 
-    def _execute_core(self, agent_info: Dict[str, Any]) -> LiteAgentOutput:
+        agent_finish = await self._ainvoke_loop()
+        output = self._build_output(agent_info, agent_finish)
+        if output is None:
+            return await self._aexecute_core(agent_info=agent_info)
+        return output
+
+    def _emit_execution_started(self, agent_info: Dict[str, Any]) -> None:
         # Emit event for agent execution start
         crewai_event_bus.emit(
             self,
@@ -348,8 +388,15 @@ class LiteAgent(FlowTrackable, BaseModel):
             ),
         )
 
-        # Execute the agent using invoke loop
-        agent_finish = self._invoke_loop()
+    def _build_output(
+        self, agent_info: Dict[str, Any], agent_finish: AgentFinish
+    ) -> Optional[LiteAgentOutput]:
+        """Build the output for a finished run.
+
+        Returns:
+            The agent output, or None when the guardrail failed and the run
+            should be retried with the guardrail feedback appended.
+        """
         formatted_result: Optional[BaseModel] = None
         if self.response_format:
             try:
@@ -403,7 +450,7 @@ class LiteAgent(FlowTrackable, BaseModel):
                     }
                 )
 
-                return self._execute_core(agent_info=agent_info)
+                return None
 
             # Apply guardrail result if available
             if guardrail_result.result is not None:
@@ -440,7 +487,14 @@ class LiteAgent(FlowTrackable, BaseModel):
         Returns:
             LiteAgentOutput: The result of the agent execution.
         """
-        return await asyncio.to_thread(self.kickoff, messages)
+        agent_info = self._get_agent_info()
+
+        try:
+            self._reset_run(messages)
+            return await self._aexecute_core(agent_info=agent_info)
+        except Exception as e:
+            self._handle_kickoff_error(agent_info, e)
+            raise e
 
     def _get_default_system_prompt(self) -> str:
         """Get the default system prompt for the agent."""
@@ -561,6 +615,7 @@ class LiteAgent(FlowTrackable, BaseModel):
                             agent_key=self.key,
                             agent_role=self.role,
                             agent=self.original_agent,
+                            tool_registry=self._get_tool_registry(),
                         )
                     except Exception as e:
                         raise e
@@ -606,6 +661,122 @@ class LiteAgent(FlowTrackable, BaseModel):
         self._show_logs(formatted_answer)
         return formatted_answer
 
+    async def _ainvoke_loop(self) -> AgentFinish:
+        """
+        Async version of _invoke_loop. LLM calls are awaited natively, while
+        tools, which are synchronous, run in a worker thread.
+
+        Returns:
+            AgentFinish: The final result of the agent execution.
+        """
+        formatted_answer = None
+        while not isinstance(formatted_answer, AgentFinish):
+            try:
+                if has_reached_max_iterations(self._iterations, self.max_iterations):
+                    formatted_answer = await asyncio.to_thread(
+                        handle_max_iterations_exceeded,
+                        formatted_answer,
+                        printer=self._printer,
+                        i18n=self.i18n,
+                        messages=self._messages,
+                        llm=cast(LLM, self.llm),
+                        callbacks=self._callbacks,
+                    )
+
+                if self.request_within_rpm_limit:
+                    await asyncio.to_thread(
+                        enforce_rpm_limit, self.request_within_rpm_limit
+                    )
+
+                crewai_event_bus.emit(
+                    self,
+                    event=LLMCallStartedEvent(
+                        messages=self._messages,
+                        tools=None,
+                        callbacks=self._callbacks,
+                        from_agent=self,
+                    ),
+                )
+
+                try:
+                    answer = await aget_llm_response(
+                        llm=cast(LLM, self.llm),
+                        messages=self._messages,
+                        callbacks=self._callbacks,
+                        printer=self._printer,
+                        from_agent=self,
+                    )
+
+                    crewai_event_bus.emit(
+                        self,
+                        event=LLMCallCompletedEvent(
+                            response=answer,
+                            call_type=LLMCallType.LLM_CALL,
+                            from_agent=self,
+                        ),
+                    )
+                except Exception as e:
+                    crewai_event_bus.emit(
+                        self,
+                        event=LLMCallFailedEvent(error=str(e), from_agent=self),
+                    )
+                    raise e
+
+                formatted_answer = process_llm_response(answer, self.use_stop_words)
+
+                if isinstance(formatted_answer, AgentAction):
+                    tool_result = await aexecute_tool_and_check_finality(
+                        agent_action=formatted_answer,
+                        tools=self._parsed_tools,
+                        i18n=self.i18n,
+                        agent_key=self.key,
+                        agent_role=self.role,
+                        agent=self.original_agent,
+                        tool_registry=self._get_tool_registry(),
+                    )
+
+                    formatted_answer = handle_agent_action_core(
+                        formatted_answer=formatted_answer,
+                        tool_result=tool_result,
+                        show_logs=self._show_logs,
+                    )
+
+                self._append_message(formatted_answer.text, role="assistant")
+            except OutputParserException as e:
+                formatted_answer = handle_output_parser_exception(
+                    e=e,
+                    messages=self._messages,
+                    iterations=self._iterations,
+                    log_error_after=3,
+                    printer=self._printer,
+                )
+
+            except Exception as e:
+                if e.__class__.__module__.startswith("litellm"):
+                    # Do not retry on litellm errors
+                    raise e
+                if is_context_length_exceeded(e):
+                    await asyncio.to_thread(
+                        handle_context_length,
+                        respect_context_window=self.respect_context_window,
+                        printer=self._printer,
+                        messages=self._messages,
+                        llm=cast(LLM, self.llm),
+                        callbacks=self._callbacks,
+                        i18n=self.i18n,
+                    )
+                    continue
+                else:
+                    handle_unknown_error(self._printer, e)
+                    raise e
+
+            finally:
+                self._iterations += 1
+
+        assert isinstance(formatted_answer, AgentFinish)
+        self._show_logs(formatted_answer)
+        return formatted_answer
+
     def _show_logs(self, formatted_answer: Union[AgentAction, AgentFinish]):
         """Show logs for the agent's execution."""
         crewai_event_bus.emit(
@@ -1,18 +1,25 @@
+import asyncio
+import inspect
 import json
 import logging
 import os
 import sys
 import threading
+import time
 import warnings
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from typing import (
     Any,
+    Callable,
     DefaultDict,
+    Deque,
     Dict,
     List,
     Literal,
     Optional,
+    Tuple,
     Type,
     TypedDict,
     Union,
@@ -20,7 +27,7 @@ from typing import (
 )
 from datetime import datetime
 from dotenv import load_dotenv
-from litellm.types.utils import ChatCompletionDeltaToolCall
+from litellm.types.utils import ChatCompletionDeltaToolCall, Usage
 from pydantic import BaseModel, Field
 
 from crewai.utilities.events.llm_events import (
@@ -52,7 +59,16 @@ import io
 from typing import TextIO
 
 from crewai.llms.base_llm import BaseLLM
+from crewai.llms.capabilities import CapabilityKey, model_capability_registry
+from crewai.types.usage_metrics import UsageMetrics
 from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.llm_response_cache_handler import LLMResponseCacheHandler
+from crewai.utilities.cancellation import (
+    ExecutionCancelledException,
+    current_cancellation_token,
+    raise_if_cancelled,
+    submit_in_context,
+)
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededException,
 )
@@ -253,6 +269,10 @@ LLM_CONTEXT_WINDOW_SIZES = {
 
 DEFAULT_CONTEXT_WINDOW_SIZE = 8192
 CONTEXT_WINDOW_USAGE_RATIO = 0.85
+# Number of recent primary latencies kept to estimate the hedging percentile,
+# and the number needed before the estimate replaces hedge_after.
+HEDGE_LATENCY_WINDOW = 200
+HEDGE_MIN_SAMPLES = 20
 
 
 @contextmanager
@@ -286,6 +306,90 @@ class AccumulatedToolArgs(BaseModel):
     function: FunctionArgs = Field(default_factory=FunctionArgs)
 
 
+class StreamingResponseState:
+    """Accumulated state of a streaming response, shared by the sync and async paths."""
+
+    def __init__(self) -> None:
+        self.full_response = ""
+        self.last_chunk: Optional[Any] = None
+        self.chunk_count = 0
+        self.usage_info: Optional[Any] = None
+        self.accumulated_tool_args: DefaultDict[int, AccumulatedToolArgs] = (
+            defaultdict(AccumulatedToolArgs)
+        )
+
+
+def _as_llm(llm: Union[str, BaseLLM]) -> BaseLLM:
+    return LLM(model=llm) if isinstance(llm, str) else llm
+
+
+def _copy_messages(
+    messages: Union[str, List[Dict[str, str]]],
+) -> Union[str, List[Dict[str, str]]]:
+    """Copy messages so that one attempt's provider formatting cannot leak into another."""
+    if isinstance(messages, str):
+        return messages
+    return [dict(message) for message in messages]
+
+
+def _close_stream(stream: Any) -> None:
+    """Release the connection of a stream, even one that was not read to its end."""
+    for target in (stream, getattr(stream, "completion_stream", None)):
+        close = getattr(target, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logging.debug(f"Error closing streaming response: {e}")
+            return
+
+
+async def _aclose_stream(stream: Any) -> None:
+    """Async twin of _close_stream, awaiting the close of async streams."""
+    for target in (stream, getattr(stream, "completion_stream", None)):
+        close = getattr(target, "aclose", None) or getattr(target, "close", None)
+        if callable(close):
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logging.debug(f"Error closing streaming response: {e}")
+            return
+
+
+def _first_successful_result(futures: List[Any]) -> Any:
+    """Return the first result among futures, raising the first error if all fail."""
+    pending = set(futures)
+    errors: List[BaseException] = []
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            error = future.exception()
+            if error is None:
+                for other in pending:
+                    other.cancel()
+                return future.result()
+            errors.append(error)
+    raise errors[0]
+
+
+def _with_cache_control(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a message whose last content block is cache-marked."""
+    content = message["content"]
+    blocks: List[Dict[str, Any]]
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content and isinstance(content[-1], dict):
+        blocks = [dict(block) for block in content]
+    else:
+        return message
+
+    if "cache_control" not in blocks[-1]:
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+    return {**message, "content": blocks}
+
+
 class LLM(BaseLLM):
     def __init__(
         self,
@@ -311,6 +415,12 @@ class LLM(BaseLLM):
         callbacks: List[Any] = [],
         reasoning_effort: Optional[Literal["none", "low", "medium", "high"]] = None,
         stream: bool = False,
+        response_cache: Union[bool, LLMResponseCacheHandler, None] = None,
+        prompt_caching: bool = False,
+        fallbacks: Optional[List[Union[str, BaseLLM]]] = None,
+        hedge_llm: Optional[Union[str, BaseLLM]] = None,
+        hedge_after: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
         **kwargs,
     ):
         self.model = model
@@ -337,6 +447,30 @@ class LLM(BaseLLM):
         self.additional_params = kwargs
         self.is_anthropic = self._is_anthropic_model(model)
         self.stream = stream
+        self.prompt_caching = prompt_caching
+        self.fallbacks: List[BaseLLM] = [
+            _as_llm(fallback) for fallback in fallbacks or []
+        ]
+        self.hedge_llm: Optional[BaseLLM] = (
+            _as_llm(hedge_llm) if hedge_llm is not None else None
+        )
+        if (
+            self.hedge_llm is not None
+            and hedge_after is None
+            and hedge_percentile is None
+        ):
+            raise ValueError("hedge_llm requires hedge_after or hedge_percentile")
+        if hedge_percentile is not None and not 0 < hedge_percentile < 100:
+            raise ValueError("hedge_percentile must be between 0 and 100")
+        self.hedge_after = hedge_after
+        self.hedge_percentile = hedge_percentile
+        self._latencies: Deque[float] = deque(maxlen=HEDGE_LATENCY_WINDOW)
+        if response_cache is True:
+            self.response_cache: Optional[LLMResponseCacheHandler] = (
+                LLMResponseCacheHandler()
+            )
+        else:
+            self.response_cache = response_cache or None
 
         litellm.drop_params = True
 
@@ -382,13 +516,15 @@ class LLM(BaseLLM):
         # --- 1) Format messages according to provider requirements
         if isinstance(messages, str):
             messages = [{"role": "user", "content": messages}]
-        formatted_messages = self._format_messages_for_provider(messages)
+        formatted_messages = self._apply_prompt_caching(
+            self._format_messages_for_provider(messages)
+        )
 
         # --- 2) Prepare the parameters for the completion call
         params = {
             "model": self.model,
             "messages": formatted_messages,
-            "timeout": self.timeout,
+            "timeout": self._request_timeout(),
             "temperature": self.temperature,
             "top_p": self.top_p,
             "n": self.n,
@@ -438,180 +574,334 @@ class LLM(BaseLLM):
             Exception: If no content is received from the streaming response
         """
         # --- 1) Initialize response tracking
-        full_response = ""
-        last_chunk = None
-        chunk_count = 0
-        usage_info = None
-        tool_calls = None
-
-        accumulated_tool_args: DefaultDict[int, AccumulatedToolArgs] = defaultdict(
-            AccumulatedToolArgs
-        )
+        state = StreamingResponseState()
 
         # --- 2) Make sure stream is set to True and include usage metrics
         params["stream"] = True
         params["stream_options"] = {"include_usage": True}
 
         try:
-            # --- 3) Process each chunk in the stream
-            for chunk in litellm.completion(**params):
-                chunk_count += 1
-                last_chunk = chunk
-
-                # Extract content from the chunk
-                chunk_content = None
-
-                # Safely extract content from various chunk formats
-                try:
-                    # Try to access choices safely
-                    choices = None
-                    if isinstance(chunk, dict) and "choices" in chunk:
-                        choices = chunk["choices"]
-                    elif hasattr(chunk, "choices"):
-                        # Check if choices is not a type but an actual attribute with value
-                        if not isinstance(getattr(chunk, "choices"), type):
-                            choices = getattr(chunk, "choices")
-
-                    # Try to extract usage information if available
-                    if isinstance(chunk, dict) and "usage" in chunk:
-                        usage_info = chunk["usage"]
-                    elif hasattr(chunk, "usage"):
-                        # Check if usage is not a type but an actual attribute with value
-                        if not isinstance(getattr(chunk, "usage"), type):
-                            usage_info = getattr(chunk, "usage")
-
-                    if choices and len(choices) > 0:
-                        choice = choices[0]
-
-                        # Handle different delta formats
-                        delta = None
-                        if isinstance(choice, dict) and "delta" in choice:
-                            delta = choice["delta"]
-                        elif hasattr(choice, "delta"):
-                            delta = getattr(choice, "delta")
-
-                        # Extract content from delta
-                        if delta:
-                            # Handle dict format
-                            if isinstance(delta, dict):
-                                if "content" in delta and delta["content"] is not None:
-                                    chunk_content = delta["content"]
-                            # Handle object format
-                            elif hasattr(delta, "content"):
-                                chunk_content = getattr(delta, "content")
-
-                            # Handle case where content might be None or empty
-                            if chunk_content is None and isinstance(delta, dict):
-                                # Some models might send empty content chunks
-                                chunk_content = ""
-
-                            # Enable tool calls using streaming
-                            if "tool_calls" in delta:
-                                tool_calls = delta["tool_calls"]
-
-                                if tool_calls:
-                                    result = self._handle_streaming_tool_calls(
-                                        tool_calls=tool_calls,
-                                        accumulated_tool_args=accumulated_tool_args,
-                                        available_functions=available_functions,
-                                        from_task=from_task,
-                                        from_agent=from_agent,
-                                    )
-                                    if result is not None:
-                                        chunk_content = result
-
-                except Exception as e:
-                    logging.debug(f"Error extracting content from chunk: {e}")
-                    logging.debug(f"Chunk format: {type(chunk)}, content: {chunk}")
-
-                # Only add non-None content to the response
-                if chunk_content is not None:
-                    # Add the chunk content to the full response
-                    full_response += chunk_content
-
-                    # Emit the chunk event
-                    assert hasattr(crewai_event_bus, "emit")
-                    crewai_event_bus.emit(
-                        self,
-                        event=LLMStreamChunkEvent(chunk=chunk_content, from_task=from_task, from_agent=from_agent),
+            # --- 3) Process each chunk in the stream, stopping as soon as an
+            # agent's ReAct step is complete. The stream is closed either way,
+            # so a cut-short or cancelled call releases its connection.
+            stream = litellm.completion(**params)
+            try:
+                for chunk in stream:
+                    raise_if_cancelled()
+                    self._process_streaming_chunk(
+                        chunk, state, available_functions, from_task, from_agent
                     )
+                    if self._stop_stream_early(
+                        params, state, available_functions, from_agent
+                    ):
+                        break
+            finally:
+                _close_stream(stream)
+
             # --- 4) Fallback to non-streaming if no content received
-            if not full_response.strip() and chunk_count == 0:
+            if not state.full_response.strip() and state.chunk_count == 0:
                 logging.warning(
                     "No chunks received in streaming response, falling back to non-streaming"
                 )
-                non_streaming_params = params.copy()
-                non_streaming_params["stream"] = False
-                non_streaming_params.pop(
-                    "stream_options", None
-                )  # Remove stream_options for non-streaming call
                 return self._handle_non_streaming_response(
-                    non_streaming_params, callbacks, available_functions, from_task, from_agent
+                    self._non_streaming_params(params),
+                    callbacks,
+                    available_functions,
+                    from_task,
+                    from_agent,
                 )
 
-            # --- 5) Handle empty response with chunks
-            if not full_response.strip() and chunk_count > 0:
+            return self._finalize_streaming_response(
+                state, callbacks, available_functions, from_task, from_agent
+            )
+
+        except ContextWindowExceededError as e:
+            # Catch context window errors from litellm and convert them to our own exception type.
+            # This exception is handled by CrewAgentExecutor._invoke_loop() which can then
+            # decide whether to summarize the content or abort based on the respect_context_window flag.
+            raise LLMContextLengthExceededException(str(e))
+        except ExecutionCancelledException:
+            raise
+        except Exception as e:
+            return self._handle_streaming_error(e, state, from_task, from_agent)
+
+    async def _ahandle_streaming_response(
+        self,
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> str:
+        """Async twin of _handle_streaming_response, built on litellm.acompletion."""
+        state = StreamingResponseState()
+
+        params["stream"] = True
+        params["stream_options"] = {"include_usage": True}
+
+        try:
+            stream = await litellm.acompletion(**params)
+            try:
+                async for chunk in stream:
+                    raise_if_cancelled()
+                    # Tool calls may be executed while a chunk is processed, so
+                    # they run in a worker thread instead of on the event loop
+                    if available_functions:
+                        await asyncio.to_thread(
+                            self._process_streaming_chunk,
+                            chunk,
+                            state,
+                            available_functions,
+                            from_task,
+                            from_agent,
+                        )
+                    else:
+                        self._process_streaming_chunk(
+                            chunk, state, available_functions, from_task, from_agent
+                        )
+                    if self._stop_stream_early(
+                        params, state, available_functions, from_agent
+                    ):
+                        break
+            finally:
+                await _aclose_stream(stream)
+
+            if not state.full_response.strip() and state.chunk_count == 0:
                 logging.warning(
-                    f"Received {chunk_count} chunks but no content was extracted"
+                    "No chunks received in streaming response, falling back to non-streaming"
+                )
+                return await self._ahandle_non_streaming_response(
+                    self._non_streaming_params(params),
+                    callbacks,
+                    available_functions,
+                    from_task,
+                    from_agent,
                 )
-                if last_chunk is not None:
-                    try:
-                        # Try to extract content from the last chunk's message
-                        choices = None
-                        if isinstance(last_chunk, dict) and "choices" in last_chunk:
-                            choices = last_chunk["choices"]
-                        elif hasattr(last_chunk, "choices"):
-                            if not isinstance(getattr(last_chunk, "choices"), type):
-                                choices = getattr(last_chunk, "choices")
-
-                        if choices and len(choices) > 0:
-                            choice = choices[0]
-
-                            # Try to get content from message
-                            message = None
-                            if isinstance(choice, dict) and "message" in choice:
-                                message = choice["message"]
-                            elif hasattr(choice, "message"):
-                                message = getattr(choice, "message")
-
-                            if message:
-                                content = None
-                                if isinstance(message, dict) and "content" in message:
-                                    content = message["content"]
-                                elif hasattr(message, "content"):
-                                    content = getattr(message, "content")
-
-                                if content:
-                                    full_response = content
-                                    logging.info(
-                                        f"Extracted content from last chunk message: {full_response}"
-                                    )
-                    except Exception as e:
-                        logging.debug(f"Error extracting content from last chunk: {e}")
-                        logging.debug(
-                            f"Last chunk format: {type(last_chunk)}, content: {last_chunk}"
-                        )
 
-            # --- 6) If still empty, raise an error instead of using a default response
-            if not full_response.strip() and len(accumulated_tool_args) == 0:
-                raise Exception(
-                    "No content received from streaming response. Received empty chunks or failed to extract content."
+            if available_functions:
+                return await asyncio.to_thread(
+                    self._finalize_streaming_response,
+                    state,
+                    callbacks,
+                    available_functions,
+                    from_task,
+                    from_agent,
                 )
+            return self._finalize_streaming_response(
+                state, callbacks, available_functions, from_task, from_agent
+            )
 
-            # --- 7) Check for tool calls in the final response
-            tool_calls = None
-            try:
-                if last_chunk:
+        except ContextWindowExceededError as e:
+            raise LLMContextLengthExceededException(str(e))
+        except ExecutionCancelledException:
+            raise
+        except Exception as e:
+            return self._handle_streaming_error(e, state, from_task, from_agent)
+
+    def _stop_stream_early(
+        self,
+        params: Dict[str, Any],
+        state: StreamingResponseState,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_agent: Optional[Any] = None,
+    ) -> bool:
+        """Check whether an agent's streamed ReAct step is already complete.
+
+        Agents driving a ReAct loop only need the text up to the end of the
+        current step, so the rest of the stream is not awaited once an action
+        with its input, or a stop word, has been received. The response is cut
+        at that point and, since the provider's usage chunk will not arrive,
+        usage is estimated from the text.
+
+        Returns:
+            bool: True if the stream should no longer be consumed.
+        """
+        if from_agent is None or available_functions:
+            return False
+
+        from crewai.agents.parser import CrewAgentParser
+
+        end = CrewAgentParser.find_step_end(state.full_response, self.stop)
+        if end is None:
+            return False
+
+        state.full_response = state.full_response[:end]
+        if state.usage_info is None:
+            state.usage_info = self._estimate_streaming_usage(
+                params, state.full_response
+            )
+        return True
+
+    def _estimate_streaming_usage(
+        self, params: Dict[str, Any], completion: str
+    ) -> Optional[Usage]:
+        """Count tokens locally for a stream that ended before its usage chunk."""
+        try:
+            prompt_tokens = litellm.token_counter(
+                model=self.model, messages=params.get("messages", [])
+            )
+            completion_tokens = litellm.token_counter(
+                model=self.model, text=completion
+            )
+        except Exception as e:
+            logging.debug(f"Error estimating streaming usage: {e}")
+            return None
+        return Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+
+    @staticmethod
+    def _non_streaming_params(params: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of the params suitable for a non-streaming call."""
+        non_streaming_params = params.copy()
+        non_streaming_params["stream"] = False
+        non_streaming_params.pop(
+            "stream_options", None
+        )  # Remove stream_options for non-streaming call
+        return non_streaming_params
+
+    def _process_streaming_chunk(
+        self,
+        chunk: Any,
+        state: StreamingResponseState,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> None:
+        """Accumulate a single streaming chunk into the response state.
+
+        Args:
+            chunk: The chunk received from the stream
+            state: The state of the streaming response so far
+            available_functions: Dict of available functions
+            from_task: Optional task object
+            from_agent: Optional agent object
+        """
+        state.chunk_count += 1
+        state.last_chunk = chunk
+
+        # Extract content from the chunk
+        chunk_content = None
+
+        # Safely extract content from various chunk formats
+        try:
+            # Try to access choices safely
+            choices = None
+            if isinstance(chunk, dict) and "choices" in chunk:
+                choices = chunk["choices"]
+            elif hasattr(chunk, "choices"):
+                # Check if choices is not a type but an actual attribute with value
+                if not isinstance(getattr(chunk, "choices"), type):
+                    choices = getattr(chunk, "choices")
+
+            # Try to extract usage information if available
+            if isinstance(chunk, dict) and "usage" in chunk:
+                state.usage_info = chunk["usage"]
+            elif hasattr(chunk, "usage"):
+                # Check if usage is not a type but an actual attribute with value
+                if not isinstance(getattr(chunk, "usage"), type):
+                    state.usage_info = getattr(chunk, "usage")
+
+            if choices and len(choices) > 0:
+                choice = choices[0]
+
+                # Handle different delta formats
+                delta = None
+                if isinstance(choice, dict) and "delta" in choice:
+                    delta = choice["delta"]
+                elif hasattr(choice, "delta"):
+                    delta = getattr(choice, "delta")
+
+                # Extract content from delta
+                if delta:
+                    # Handle dict format
+                    if isinstance(delta, dict):
+                        if "content" in delta and delta["content"] is not None:
+                            chunk_content = delta["content"]
+                    # Handle object format
+                    elif hasattr(delta, "content"):
+                        chunk_content = getattr(delta, "content")
+
+                    # Handle case where content might be None or empty
+                    if chunk_content is None and isinstance(delta, dict):
+                        # Some models might send empty content chunks
+                        chunk_content = ""
+
+                    # Enable tool calls using streaming
+                    if "tool_calls" in delta:
+                        tool_calls = delta["tool_calls"]
+
+                        if tool_calls:
+                            result = self._handle_streaming_tool_calls(
+                                tool_calls=tool_calls,
+                                accumulated_tool_args=state.accumulated_tool_args,
+                                available_functions=available_functions,
+                                from_task=from_task,
+                                from_agent=from_agent,
+                            )
+                            if result is not None:
+                                chunk_content = result
+
+        except Exception as e:
+            logging.debug(f"Error extracting content from chunk: {e}")
+            logging.debug(f"Chunk format: {type(chunk)}, content: {chunk}")
+
+        # Only add non-None content to the response
+        if chunk_content is not None:
+            # Add the chunk content to the full response
+            state.full_response += chunk_content
+
+            # Emit the chunk event
+            assert hasattr(crewai_event_bus, "emit")
+            crewai_event_bus.emit(
+                self,
+                event=LLMStreamChunkEvent(chunk=chunk_content, from_task=from_task, from_agent=from_agent),
+            )
+
+    def _finalize_streaming_response(
+        self,
+        state: StreamingResponseState,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> str:
+        """Build the call result once the stream has been fully consumed.
+
+        Args:
+            state: The accumulated state of the streaming response
+            callbacks: Optional list of callback functions
+            available_functions: Dict of available functions
+            from_task: Optional task object
+            from_agent: Optional agent object
+
+        Returns:
+            str: The complete response text, or the result of a tool call
+
+        Raises:
+            Exception: If no content is received from the streaming response
+        """
+        # --- 5) Handle empty response with chunks
+        if not state.full_response.strip() and state.chunk_count > 0:
+            logging.warning(
+                f"Received {state.chunk_count} chunks but no content was extracted"
+            )
+            if state.last_chunk is not None:
+                try:
+                    # Try to extract content from the last chunk's message
                     choices = None
-                    if isinstance(last_chunk, dict) and "choices" in last_chunk:
-                        choices = last_chunk["choices"]
-                    elif hasattr(last_chunk, "choices"):
-                        if not isinstance(getattr(last_chunk, "choices"), type):
-                            choices = getattr(last_chunk, "choices")
+                    if isinstance(state.last_chunk, dict) and "choices" in state.last_chunk:
+                        choices = state.last_chunk["choices"]
+                    elif hasattr(state.last_chunk, "choices"):
+                        if not isinstance(getattr(state.last_chunk, "choices"), type):
+                            choices = getattr(state.last_chunk, "choices")
 
                     if choices and len(choices) > 0:
                         choice = choices[0]
 
+                        # Try to get content from message
                         message = None
                         if isinstance(choice, dict) and "message" in choice:
                             message = choice["message"]
@@ -619,52 +909,102 @@ class LLM(BaseLLM):
                             message = getattr(choice, "message")
 
                         if message:
-                            if isinstance(message, dict) and "tool_calls" in message:
-                                tool_calls = message["tool_calls"]
-                            elif hasattr(message, "tool_calls"):
-                                tool_calls = getattr(message, "tool_calls")
-            except Exception as e:
-                logging.debug(f"Error checking for tool calls: {e}")
-            # --- 8) If no tool calls or no available functions, return the text response directly
+                            content = None
+                            if isinstance(message, dict) and "content" in message:
+                                content = message["content"]
+                            elif hasattr(message, "content"):
+                                content = getattr(message, "content")
+
+                            if content:
+                                state.full_response = content
+                                logging.info(
+                                    f"Extracted content from last chunk message: {state.full_response}"
+                                )
+                except Exception as e:
+                    logging.debug(f"Error extracting content from last chunk: {e}")
+                    logging.debug(
+                        f"Last chunk format: {type(state.last_chunk)}, content: {state.last_chunk}"
+                    )
+
+        # --- 6) If still empty, raise an error instead of using a default response
+        if not state.full_response.strip() and len(state.accumulated_tool_args) == 0:
+            raise Exception(
+                "No content received from streaming response. Received empty chunks or failed to extract content."
+            )
 
-            if not tool_calls or not available_functions:
-                # Log token usage if available in streaming mode
-                self._handle_streaming_callbacks(callbacks, usage_info, last_chunk)
-                # Emit completion event and return response
-                self._handle_emit_call_events(full_response, LLMCallType.LLM_CALL, from_task, from_agent)
-                return full_response
+        # --- 7) Check for tool calls in the final response
+        tool_calls = None
+        try:
+            if state.last_chunk:
+                choices = None
+                if isinstance(state.last_chunk, dict) and "choices" in state.last_chunk:
+                    choices = state.last_chunk["choices"]
+                elif hasattr(state.last_chunk, "choices"):
+                    if not isinstance(getattr(state.last_chunk, "choices"), type):
+                        choices = getattr(state.last_chunk, "choices")
+
+                if choices and len(choices) > 0:
+                    choice = choices[0]
+
+                    message = None
+                    if isinstance(choice, dict) and "message" in choice:
+                        message = choice["message"]
+                    elif hasattr(choice, "message"):
+                        message = getattr(choice, "message")
+
+                    if message:
+                        if isinstance(message, dict) and "tool_calls" in message:
+                            tool_calls = message["tool_calls"]
+                        elif hasattr(message, "tool_calls"):
+                            tool_calls = getattr(message, "tool_calls")
+        except Exception as e:
+            logging.debug(f"Error checking for tool calls: {e}")
+        # --- 8) If no tool calls or no available functions, return the text response directly
 
-            # --- 9) Handle tool calls if present
-            tool_result = self._handle_tool_call(tool_calls, available_functions)
-            if tool_result is not None:
-                return tool_result
+        if not tool_calls or not available_functions:
+            # Log token usage if available in streaming mode
+            usage = self._handle_streaming_callbacks(
+                callbacks, state.usage_info, state.last_chunk, from_agent
+            )
+            # Emit completion event and return response
+            self._handle_emit_call_events(state.full_response, LLMCallType.LLM_CALL, from_task, from_agent, usage=usage)
+            return state.full_response
 
-            # --- 10) Log token usage if available in streaming mode
-            self._handle_streaming_callbacks(callbacks, usage_info, last_chunk)
+        # --- 9) Handle tool calls if present
+        tool_result = self._handle_tool_call(tool_calls, available_functions)
+        if tool_result is not None:
+            return tool_result
 
-            # --- 11) Emit completion event and return response
-            self._handle_emit_call_events(full_response, LLMCallType.LLM_CALL, from_task, from_agent)
-            return full_response
+        # --- 10) Log token usage if available in streaming mode
+        usage = self._handle_streaming_callbacks(
+            callbacks, state.usage_info, state.last_chunk, from_agent
+        )
 
-        except ContextWindowExceededError as e:
-            # Catch context window errors from litellm and convert them to our own exception type.
-            # This exception is handled by CrewAgentExecutor._invoke_loop() which can then
-            # decide whether to summarize the content or abort based on the respect_context_window flag.
-            raise LLMContextLengthExceededException(str(e))
-        except Exception as e:
-            logging.error(f"Error in streaming response: {str(e)}")
-            if full_response.strip():
-                logging.warning(f"Returning partial response despite error: {str(e)}")
-                self._handle_emit_call_events(full_response, LLMCallType.LLM_CALL, from_task, from_agent)
-                return full_response
+        # --- 11) Emit completion event and return response
+        self._handle_emit_call_events(state.full_response, LLMCallType.LLM_CALL, from_task, from_agent, usage=usage)
+        return state.full_response
 
-            # Emit failed event and re-raise the exception
-            assert hasattr(crewai_event_bus, "emit")
-            crewai_event_bus.emit(
-                self,
-                event=LLMCallFailedEvent(error=str(e), from_task=from_task, from_agent=from_agent),
-            )
-            raise Exception(f"Failed to get streaming response: {str(e)}")
+    def _handle_streaming_error(
+        self,
+        error: Exception,
+        state: StreamingResponseState,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> str:
+        """Return the partial response if any, otherwise emit a failure and raise."""
+        logging.error(f"Error in streaming response: {str(error)}")
+        if state.full_response.strip():
+            logging.warning(f"Returning partial response despite error: {str(error)}")
+            self._handle_emit_call_events(state.full_response, LLMCallType.LLM_CALL, from_task, from_agent)
+            return state.full_response
+
+        # Emit failed event and re-raise the exception
+        assert hasattr(crewai_event_bus, "emit")
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallFailedEvent(error=str(error), from_task=from_task, from_agent=from_agent),
+        )
+        raise Exception(f"Failed to get streaming response: {str(error)}")
 
     def _handle_streaming_tool_calls(
         self,
@@ -716,42 +1056,91 @@ class LLM(BaseLLM):
         callbacks: Optional[List[Any]],
         usage_info: Optional[Dict[str, Any]],
         last_chunk: Optional[Any],
-    ) -> None:
+        from_agent: Optional[Any] = None,
+    ) -> Optional[UsageMetrics]:
         """Handle callbacks with usage info for streaming responses.
 
         Args:
             callbacks: Optional list of callback functions
             usage_info: Usage information collected during streaming
             last_chunk: The last chunk received from the streaming response
+            from_agent: Optional Agent that invoked the LLM
+
+        Returns:
+            Optional[UsageMetrics]: The usage of this call, if it was reported
         """
-        if callbacks and len(callbacks) > 0:
-            for callback in callbacks:
-                if hasattr(callback, "log_success_event"):
-                    # Use the usage_info we've been tracking
-                    if not usage_info:
-                        # Try to get usage from the last chunk if we haven't already
-                        try:
-                            if last_chunk:
-                                if (
-                                    isinstance(last_chunk, dict)
-                                    and "usage" in last_chunk
-                                ):
-                                    usage_info = last_chunk["usage"]
-                                elif hasattr(last_chunk, "usage"):
-                                    if not isinstance(
-                                        getattr(last_chunk, "usage"), type
-                                    ):
-                                        usage_info = getattr(last_chunk, "usage")
-                        except Exception as e:
-                            logging.debug(f"Error extracting usage info: {e}")
-
-                    if usage_info:
-                        callback.log_success_event(
-                            kwargs={},  # We don't have the original params here
-                            response_obj={"usage": usage_info},
-                            start_time=0,
-                            end_time=0,
-                        )
+        if not usage_info:
+            # Try to get usage from the last chunk if we haven't already
+            try:
+                if last_chunk:
+                    if isinstance(last_chunk, dict) and "usage" in last_chunk:
+                        usage_info = last_chunk["usage"]
+                    elif hasattr(last_chunk, "usage"):
+                        if not isinstance(getattr(last_chunk, "usage"), type):
+                            usage_info = getattr(last_chunk, "usage")
+            except Exception as e:
+                logging.debug(f"Error extracting usage info: {e}")
+
+        # We don't have the original params here
+        return self._record_usage(usage_info, {}, callbacks, from_agent)
+
+    def _record_usage(
+        self,
+        usage: Optional[Any],
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Optional[UsageMetrics]:
+        """Report the usage of one response to the callbacks of its call.
+
+        Usage is handed to the callbacks passed with the call instead of
+        going through litellm's process-wide callbacks, so concurrent calls
+        never count each other's tokens. The token counter of the calling
+        agent is updated as well, unless one of the callbacks already feeds it.
+
+        Args:
+            usage: The usage reported by the provider
+            params: Parameters of the completion call
+            callbacks: Optional list of callback functions
+            from_agent: Optional Agent that invoked the LLM
+
+        Returns:
+            Optional[UsageMetrics]: The usage of this call alone, if any
+        """
+        if not usage:
+            return None
+
+        from crewai.agents.agent_builder.utilities.base_token_process import (
+            TokenProcess,
+        )
+        from crewai.utilities.token_counter_callback import TokenCalcHandler
+
+        counted = set()
+        for callback in callbacks or []:
+            if hasattr(callback, "log_success_event"):
+                callback.log_success_event(
+                    kwargs=params,
+                    response_obj={"usage": usage},
+                    start_time=0,
+                    end_time=0,
+                )
+                process = getattr(callback, "token_cost_process", None)
+                if process is not None:
+                    counted.add(id(process))
+
+        call_process = TokenProcess()
+        processes = [call_process]
+        agent_process = getattr(from_agent, "_token_process", None)
+        if isinstance(agent_process, TokenProcess) and id(agent_process) not in counted:
+            processes.append(agent_process)
+        for process in processes:
+            TokenCalcHandler(process).log_success_event(
+                kwargs=params,
+                response_obj={"usage": usage},
+                start_time=0,
+                end_time=0,
+            )
+        return call_process.get_summary()
 
     def _handle_non_streaming_response(
         self,
@@ -785,6 +1174,60 @@ class LLM(BaseLLM):
             # for consistent handling in the rest of the codebase
             raise LLMContextLengthExceededException(str(e))
 
+        return self._process_non_streaming_response(
+            response, params, callbacks, available_functions, from_task, from_agent
+        )
+
+    async def _ahandle_non_streaming_response(
+        self,
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> str:
+        """Async twin of _handle_non_streaming_response, built on litellm.acompletion."""
+        try:
+            response = await litellm.acompletion(**params)
+        except ContextWindowExceededError as e:
+            raise LLMContextLengthExceededException(str(e))
+
+        if available_functions:
+            return await asyncio.to_thread(
+                self._process_non_streaming_response,
+                response,
+                params,
+                callbacks,
+                available_functions,
+                from_task,
+                from_agent,
+            )
+        return self._process_non_streaming_response(
+            response, params, callbacks, available_functions, from_task, from_agent
+        )
+
+    def _process_non_streaming_response(
+        self,
+        response: Any,
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> str:
+        """Turn a completed (non-streaming) response into the call result.
+
+        Args:
+            response: The response returned by litellm
+            params: Parameters used for the completion call
+            callbacks: Optional list of callback functions
+            available_functions: Dict of available functions
+            from_task: Optional Task that invoked the LLM
+            from_agent: Optional Agent that invoked the LLM
+
+        Returns:
+            str: The response text, or the result of a tool call
+        """
         # --- 2) Extract response message and content
         response_message = cast(Choices, cast(ModelResponse, response).choices)[
             0
@@ -792,24 +1235,16 @@ class LLM(BaseLLM):
         text_response = response_message.content or ""
 
         # --- 3) Handle callbacks with usage info
-        if callbacks and len(callbacks) > 0:
-            for callback in callbacks:
-                if hasattr(callback, "log_success_event"):
-                    usage_info = getattr(response, "usage", None)
-                    if usage_info:
-                        callback.log_success_event(
-                            kwargs=params,
-                            response_obj={"usage": usage_info},
-                            start_time=0,
-                            end_time=0,
-                        )
+        usage = self._record_usage(
+            getattr(response, "usage", None), params, callbacks, from_agent
+        )
 
         # --- 4) Check for tool calls
         tool_calls = getattr(response_message, "tool_calls", [])
 
         # --- 5) If no tool calls or no available functions, return the text response directly
         if not tool_calls or not available_functions:
-            self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL, from_task, from_agent)
+            self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL, from_task, from_agent, usage=usage)
             return text_response
 
         # --- 6) Handle tool calls if present
@@ -818,7 +1253,7 @@ class LLM(BaseLLM):
             return tool_result
 
         # --- 7) If tool call handling didn't return a result, emit completion event and return text response
-        self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL, from_task, from_agent)
+        self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL, from_task, from_agent, usage=usage)
         return text_response
 
     def _handle_tool_call(
@@ -826,76 +1261,128 @@ class LLM(BaseLLM):
         tool_calls: List[Any],
         available_functions: Optional[Dict[str, Any]] = None,
     ) -> Optional[str]:
-        """Handle a tool call from the LLM.
+        """Handle the tool calls from the LLM.
+
+        A single tool call returns the result of the function. Several tool
+        calls run concurrently, each tool within its own max_concurrency, and
+        their results are returned together in one message, in the order the
+        LLM asked for them.
+
+        Only callers passing available_functions get here, such as crew chat
+        or the reasoning handler. CrewAgentExecutor does not: its ReAct prompt
+        produces one Action per turn, which ToolUsage runs. Streamed responses
+        run their first complete tool call as soon as it has arrived.
 
         Args:
             tool_calls: List of tool calls from the LLM
             available_functions: Dict of available functions
 
         Returns:
-            Optional[str]: The result of the tool call, or None if no tool call was made
+            Optional[str]: The result of the tool calls, or None if no tool call was made
         """
         # --- 1) Validate tool calls and available functions
         if not tool_calls or not available_functions:
             return None
 
-        # --- 2) Extract function name from first tool call
-        tool_call = tool_calls[0]
-        function_name = tool_call.function.name
-        function_args = {}  # Initialize to empty dict to avoid unbound variable
-
-        # --- 3) Check if function is available
-        if function_name in available_functions:
+        # --- 2) Run a single tool call in the calling thread
+        if len(tool_calls) == 1:
+            if tool_calls[0].function.name not in available_functions:
+                return None
             try:
-                # --- 3.1) Parse function arguments
-                function_args = json.loads(tool_call.function.arguments)
-                fn = available_functions[function_name]
-
-                # --- 3.2) Execute function
-                assert hasattr(crewai_event_bus, "emit")
-                started_at = datetime.now()
-                crewai_event_bus.emit(
-                    self,
-                    event=ToolUsageStartedEvent(
-                        tool_name=function_name,
-                        tool_args=function_args,
-                    ),
-                )
-                result = fn(**function_args)
-                crewai_event_bus.emit(
-                    self,
-                    event=ToolUsageFinishedEvent(
-                        output=result,
-                        tool_name=function_name,
-                        tool_args=function_args,
-                        started_at=started_at,
-                        finished_at=datetime.now(),
-                    ),
-                )
+                return self._execute_tool_call(tool_calls[0], available_functions)
+            except Exception:
+                return None
+
+        # --- 3) Run several tool calls at once and gather every observation
+        runnable = [
+            tool_call
+            for tool_call in tool_calls
+            if tool_call.function.name in available_functions
+        ]
+        if not runnable:
+            return None
 
-                # --- 3.3) Emit success event
-                self._handle_emit_call_events(result, LLMCallType.TOOL_CALL)
-                return result
-            except Exception as e:
-                # --- 3.4) Handle execution errors
-                fn = available_functions.get(
-                    function_name, lambda: None
-                )  # Ensure fn is always a callable
-                logging.error(f"Error executing function '{function_name}': {e}")
-                assert hasattr(crewai_event_bus, "emit")
-                crewai_event_bus.emit(
-                    self,
-                    event=LLMCallFailedEvent(error=f"Tool execution error: {str(e)}"),
+        with ThreadPoolExecutor(
+            max_workers=len(runnable), thread_name_prefix="crewai-tool-call"
+        ) as executor:
+            futures = {
+                id(tool_call): submit_in_context(
+                    executor,
+                    self._execute_tool_call,
+                    tool_call,
+                    available_functions,
                 )
-                crewai_event_bus.emit(
-                    self,
-                    event=ToolUsageErrorEvent(
-                        tool_name=function_name,
-                        tool_args=function_args,
-                        error=f"Tool execution error: {str(e)}"
-                    ),
+                for tool_call in runnable
+            }
+            observations = []
+            for tool_call in tool_calls:
+                name = tool_call.function.name
+                future = futures.get(id(tool_call))
+                if future is None:
+                    result: Any = f"Error: tool '{name}' is not available"
+                else:
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = f"Error: {e}"
+                observations.append(
+                    f"Tool {name} called with {tool_call.function.arguments} returned:\n{result}"
                 )
-        return None
+        return "\n\n".join(observations)
+
+    def _execute_tool_call(
+        self, tool_call: Any, available_functions: Dict[str, Any]
+    ) -> Any:
+        """Run one tool call and emit its events, re-raising any error."""
+        function_name = tool_call.function.name
+        function_args = {}  # Initialize to empty dict to avoid unbound variable
+        try:
+            # --- 1) Parse function arguments
+            function_args = json.loads(tool_call.function.arguments)
+            fn = available_functions[function_name]
+
+            # --- 2) Execute function
+            assert hasattr(crewai_event_bus, "emit")
+            started_at = datetime.now()
+            crewai_event_bus.emit(
+                self,
+                event=ToolUsageStartedEvent(
+                    tool_name=function_name,
+                    tool_args=function_args,
+                ),
+            )
+            result = fn(**function_args)
+            crewai_event_bus.emit(
+                self,
+                event=ToolUsageFinishedEvent(
+                    output=result,
+                    tool_name=function_name,
+                    tool_args=function_args,
+                    started_at=started_at,
+                    finished_at=datetime.now(),
+                ),
+            )
+
+            # --- 3) Emit success event
+            self._handle_emit_call_events(result, LLMCallType.TOOL_CALL)
+            return result
+        except Exception as e:
+            # --- 4) Handle execution errors
+            logging.error(f"Error executing function '{function_name}': {e}")
+            assert hasattr(crewai_event_bus, "emit")
+            crewai_event_bus.emit(
+                self,
+                event=LLMCallFailedEvent(error=f"Tool execution error: {str(e)}"),
+            )
+            crewai_event_bus.emit(
+                self,
+                event=ToolUsageErrorEvent(
+                    tool_name=function_name,
+                    tool_args=function_args,
+                    error=f"Tool execution error: {str(e)}"
+                ),
+            )
+            raise
 
     def call(
         self,
@@ -908,6 +1395,11 @@ class LLM(BaseLLM):
     ) -> Union[str, Any]:
         """High-level LLM call method.
 
+        When a hedge_llm is configured and this model has not answered within
+        the hedging delay, the same request is also sent to the hedge_llm and
+        the first answer wins. When the call fails, the fallbacks are tried in
+        order.
+
         Args:
             messages: Input messages for the LLM.
                      Can be a string or list of message dictionaries.
@@ -918,7 +1410,9 @@ class LLM(BaseLLM):
             callbacks: Optional list of callback functions to be executed
                       during and after the LLM call.
             available_functions: Optional dict mapping function names to callables
-                               that can be invoked by the LLM.
+                               that can be invoked by the LLM. Native tool calls
+                               are only executed when it is given; every call of
+                               a non-streamed turn then runs concurrently.
             from_task: Optional Task that invoked the LLM
             from_agent: Optional Agent that invoked the LLM
 
@@ -931,79 +1425,440 @@ class LLM(BaseLLM):
             ValueError: If response format is not supported
             LLMContextLengthExceededException: If input exceeds model's context limit
         """
-        # --- 1) Emit call started event
-        assert hasattr(crewai_event_bus, "emit")
-        crewai_event_bus.emit(
-            self,
-            event=LLMCallStartedEvent(
-                messages=messages,
-                tools=tools,
-                callbacks=callbacks,
-                available_functions=available_functions,
-                from_task=from_task,
-                from_agent=from_agent,
-            ),
+        raise_if_cancelled()
+        kwargs = dict(
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
         )
+        if not self.fallbacks:
+            return self._hedged_call(messages, **kwargs)
+
+        attempts: List[Callable[..., Any]] = [
+            self._hedged_call,
+            *(fallback.call for fallback in self.fallbacks),
+        ]
+        last_error: Optional[Exception] = None
+        for attempt in attempts:
+            if last_error is not None:
+                logging.warning(
+                    f"LLM call failed, falling back to the next model: {str(last_error)}"
+                )
+            try:
+                return attempt(_copy_messages(messages), **kwargs)
+            except (LLMContextLengthExceededException, ExecutionCancelledException):
+                raise
+            except Exception as e:
+                last_error = e
+        assert last_error is not None
+        raise last_error
 
-        # --- 2) Validate parameters before proceeding with the call
-        self._validate_call_params()
+    async def acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        """Native async counterpart of call, built on litellm.acompletion.
 
-        # --- 3) Convert string messages to proper format if needed
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
+        The request is awaited on the running event loop instead of blocking a
+        thread, so a single loop can drive many concurrent calls. Arguments,
+        events, caching, hedging, fallbacks and error handling are the same as
+        for call. A request that loses a hedge is cancelled.
+        """
+        raise_if_cancelled()
+        kwargs = dict(
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+        )
+        if not self.fallbacks:
+            return await self._ahedged_call(messages, **kwargs)
+
+        attempts: List[Callable[..., Any]] = [
+            self._ahedged_call,
+            *(fallback.acall for fallback in self.fallbacks),
+        ]
+        last_error: Optional[Exception] = None
+        for attempt in attempts:
+            if last_error is not None:
+                logging.warning(
+                    f"LLM call failed, falling back to the next model: {str(last_error)}"
+                )
+            try:
+                return await attempt(_copy_messages(messages), **kwargs)
+            except (LLMContextLengthExceededException, ExecutionCancelledException):
+                raise
+            except Exception as e:
+                last_error = e
+        assert last_error is not None
+        raise last_error
 
-        # --- 4) Handle O1 model special case (system messages not supported)
-        if "o1" in self.model.lower():
-            for message in messages:
-                if message.get("role") == "system":
-                    message["role"] = "assistant"
+    def _hedged_call(
+        self, messages: Union[str, List[Dict[str, str]]], **kwargs: Any
+    ) -> Union[str, Any]:
+        """Call this model, sending the request to hedge_llm as well if it is slow.
 
-        # --- 5) Set up callbacks if provided
-        with suppress_warnings():
-            if callbacks and len(callbacks) > 0:
-                self.set_callbacks(callbacks)
+        Threads cannot be interrupted, so the losing request runs to completion
+        in the background and its result is discarded. Calls that may execute
+        tools are never hedged, since both requests could run the same tool.
+        """
+        delay = self._hedge_delay()
+        if self.hedge_llm is None or delay is None or self._may_run_tools(kwargs):
+            return self._timed_call(messages, **kwargs)
+
+        # Each call gets its own two threads, so a request is sent as soon as
+        # it is submitted and never waits behind the losers of other calls
+        executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="crewai-llm-hedge"
+        )
+        try:
+            primary = submit_in_context(
+                executor, self._timed_call, messages, **kwargs
+            )
+            done, _ = wait([primary], timeout=delay)
+            if done:
+                return primary.result()
+
+            hedge = submit_in_context(
+                executor,
+                self.hedge_llm.call,
+                _copy_messages(messages),
+                **kwargs,
+            )
+            return _first_successful_result([primary, hedge])
+        finally:
+            # The losing request finishes in the background
+            executor.shutdown(wait=False)
 
+    async def _ahedged_call(
+        self, messages: Union[str, List[Dict[str, str]]], **kwargs: Any
+    ) -> Union[str, Any]:
+        """Async version of _hedged_call, cancelling the request that loses."""
+        delay = self._hedge_delay()
+        if self.hedge_llm is None or delay is None or self._may_run_tools(kwargs):
+            return await self._atimed_call(messages, **kwargs)
+
+        primary = asyncio.ensure_future(self._atimed_call(messages, **kwargs))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        hedge = asyncio.ensure_future(
+            self.hedge_llm.acall(_copy_messages(messages), **kwargs)
+        )
+        pending = {primary, hedge}
+        errors: List[BaseException] = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    errors.append(error)
+            raise errors[0]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _may_run_tools(kwargs: Dict[str, Any]) -> bool:
+        """Check whether a call may execute tools, which must not run twice."""
+        return bool(kwargs.get("tools") or kwargs.get("available_functions"))
+
+    def _timed_call(
+        self, messages: Union[str, List[Dict[str, str]]], **kwargs: Any
+    ) -> Union[str, Any]:
+        started_at = time.monotonic()
+        result = self._call(messages, **kwargs)
+        self._latencies.append(time.monotonic() - started_at)
+        return result
+
+    async def _atimed_call(
+        self, messages: Union[str, List[Dict[str, str]]], **kwargs: Any
+    ) -> Union[str, Any]:
+        started_at = time.monotonic()
+        result = await self._acall(messages, **kwargs)
+        self._latencies.append(time.monotonic() - started_at)
+        return result
+
+    def _request_timeout(self) -> Optional[Union[float, int]]:
+        """Return the HTTP timeout, capped by the time left before the deadline."""
+        token = current_cancellation_token()
+        remaining = token.remaining() if token is not None else None
+        if remaining is None:
+            return self.timeout
+        # A zero timeout would disable it instead of failing right away
+        remaining = max(remaining, 0.001)
+        return remaining if self.timeout is None else min(self.timeout, remaining)
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Return how long to wait for this model before hedging, if at all.
+
+        Once enough calls have been observed, the delay is the configured
+        percentile of the recent latencies. Until then it is hedge_after.
+        """
+        if (
+            self.hedge_percentile is not None
+            and len(self._latencies) >= HEDGE_MIN_SAMPLES
+        ):
+            latencies = sorted(self._latencies)
+            index = int(len(latencies) * self.hedge_percentile / 100)
+            return latencies[min(index, len(latencies) - 1)]
+        return self.hedge_after
+
+    def _call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        """Make a single call to this model, without hedging or fallbacks."""
+        # --- 1) Emit call started event, serving cache hits directly
+        cache_entry, cached_response = self._start_call(
+            messages, tools, callbacks, available_functions, from_task, from_agent
+        )
+        if cached_response is not None:
+            return cached_response
+
+        # --- 2) Validate parameters and normalize messages
+        messages = self._prepare_call_messages(messages)
+
+        # --- 3) Callbacks get the usage of each response directly, so litellm's
+        # global callbacks are never mutated per call
+        with suppress_warnings():
             try:
-                # --- 6) Prepare parameters for the completion call
+                # --- 4) Prepare parameters for the completion call
                 params = self._prepare_completion_params(messages, tools)
 
-                # --- 7) Make the completion call and handle response
+                # --- 5) Make the completion call and handle response
                 if self.stream:
-                    return self._handle_streaming_response(
+                    response = self._handle_streaming_response(
                         params, callbacks, available_functions, from_task, from_agent
                     )
                 else:
-                    return self._handle_non_streaming_response(
+                    response = self._handle_non_streaming_response(
                         params, callbacks, available_functions, from_task, from_agent
                     )
 
+                # --- 6) Store text responses in the response cache
+                if cache_entry and isinstance(response, str) and response:
+                    self._write_response_cache(cache_entry[0], cache_entry[1], response)
+
+                return response
+
             except LLMContextLengthExceededException:
                 # Re-raise LLMContextLengthExceededException as it should be handled
                 # by the CrewAgentExecutor._invoke_loop method, which can then decide
                 # whether to summarize the content or abort based on the respect_context_window flag
                 raise
             except Exception as e:
-                assert hasattr(crewai_event_bus, "emit")
-                crewai_event_bus.emit(
-                    self,
-                    event=LLMCallFailedEvent(error=str(e), from_task=from_task, from_agent=from_agent),
-                )
-                logging.error(f"LiteLLM call failed: {str(e)}")
+                self._handle_call_failure(e, from_task, from_agent)
+                # A request cut short by the deadline fails as a timeout of the run
+                raise_if_cancelled()
+                raise
+
+    async def _acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        """Async version of _call, awaiting litellm.acompletion."""
+        cache_entry, cached_response = self._start_call(
+            messages, tools, callbacks, available_functions, from_task, from_agent
+        )
+        if cached_response is not None:
+            return cached_response
+
+        messages = self._prepare_call_messages(messages)
+
+        with suppress_warnings():
+            try:
+                params = self._prepare_completion_params(messages, tools)
+
+                if self.stream:
+                    response = await self._ahandle_streaming_response(
+                        params, callbacks, available_functions, from_task, from_agent
+                    )
+                else:
+                    response = await self._ahandle_non_streaming_response(
+                        params, callbacks, available_functions, from_task, from_agent
+                    )
+
+                if cache_entry and isinstance(response, str) and response:
+                    self._write_response_cache(cache_entry[0], cache_entry[1], response)
+
+                return response
+
+            except LLMContextLengthExceededException:
+                raise
+            except Exception as e:
+                self._handle_call_failure(e, from_task, from_agent)
+                # A request cut short by the deadline fails as a timeout of the run
+                raise_if_cancelled()
                 raise
 
-    def _handle_emit_call_events(self, response: Any, call_type: LLMCallType, from_task: Optional[Any] = None, from_agent: Optional[Any] = None):
+    def _start_call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Tuple[Optional[Tuple[str, str, Optional[str]]], Optional[str]]:
+        """Emit the call started event, looking up the response cache first.
+
+        Returns:
+            A tuple of (cache entry, cached response). When the cached response
+            is not None the completed event has already been emitted and the
+            caller should return it as is.
+        """
+        cache_entry = self._read_response_cache(
+            messages, tools, available_functions, from_task, from_agent
+        )
+        cached_response = cache_entry[2] if cache_entry else None
+
+        assert hasattr(crewai_event_bus, "emit")
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallStartedEvent(
+                messages=messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+                cached=cached_response is not None,
+            ),
+        )
+
+        if cached_response is not None:
+            self._handle_emit_call_events(
+                cached_response,
+                LLMCallType.LLM_CALL,
+                from_task,
+                from_agent,
+                cached=True,
+            )
+        return cache_entry, cached_response
+
+    def _prepare_call_messages(
+        self, messages: Union[str, List[Dict[str, str]]]
+    ) -> List[Dict[str, str]]:
+        """Validate call parameters and normalize messages for the provider."""
+        # --- 1) Validate parameters before proceeding with the call
+        self._validate_call_params()
+
+        # --- 2) Convert string messages to proper format if needed
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+
+        # --- 3) Handle O1 model special case (system messages not supported)
+        if "o1" in self.model.lower():
+            for message in messages:
+                if message.get("role") == "system":
+                    message["role"] = "assistant"
+        return messages
+
+    def _handle_call_failure(
+        self,
+        error: Exception,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> None:
+        """Emit the call failed event and log the error."""
+        assert hasattr(crewai_event_bus, "emit")
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallFailedEvent(error=str(error), from_task=from_task, from_agent=from_agent),
+        )
+        logging.error(f"LiteLLM call failed: {str(error)}")
+
+    def _handle_emit_call_events(self, response: Any, call_type: LLMCallType, from_task: Optional[Any] = None, from_agent: Optional[Any] = None, cached: bool = False, usage: Optional[UsageMetrics] = None):
         """Handle the events for the LLM call.
 
         Args:
             response (str): The response from the LLM call.
             call_type (str): The type of call, either "tool_call" or "llm_call".
+            cached (bool): Whether the response was served from the response cache.
+            usage (UsageMetrics): The token usage of this call, if reported.
         """
         assert hasattr(crewai_event_bus, "emit")
         crewai_event_bus.emit(
             self,
-            event=LLMCallCompletedEvent(response=response, call_type=call_type, from_task=from_task, from_agent=from_agent),
+            event=LLMCallCompletedEvent(response=response, call_type=call_type, from_task=from_task, from_agent=from_agent, cached=cached, usage=usage),
         )
 
+    def _read_response_cache(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Look up a call in the response cache.
+
+        Calls that may execute functions are never cached, since their side
+        effects would be skipped on a hit. Any failure while building the key
+        or reading the cache is treated as a miss so that the regular call
+        path, with its validation and error events, still runs.
+
+        Returns:
+            None if caching does not apply to this call, otherwise a tuple of
+            (namespace, cache_key, cached_response or None).
+        """
+        if self.response_cache is None or available_functions:
+            return None
+
+        try:
+            if isinstance(messages, str):
+                messages = [{"role": "user", "content": messages}]
+            # Mirror the normalization done in call() on a copy, so the key
+            # matches the parameters that are actually sent.
+            messages = [dict(message) for message in messages]
+            if "o1" in self.model.lower():
+                for message in messages:
+                    if message.get("role") == "system":
+                        message["role"] = "assistant"
+
+            params = self._prepare_completion_params(messages, tools)
+            cache_key = self.response_cache.make_key(params)
+            namespace = self.response_cache.resolve_namespace(from_task, from_agent)
+            return namespace, cache_key, self.response_cache.read(namespace, cache_key)
+        except Exception as e:
+            logging.warning(f"LLM response cache lookup failed: {str(e)}")
+            return None
+
+    def _write_response_cache(
+        self, namespace: str, cache_key: str, response: str
+    ) -> None:
+        """Store a response in the response cache, never failing the call."""
+        if self.response_cache is None:
+            return
+        try:
+            self.response_cache.add(namespace, cache_key, response, model=self.model)
+        except Exception as e:
+            logging.warning(f"LLM response cache write failed: {str(e)}")
+
     def _format_messages_for_provider(
         self, messages: List[Dict[str, str]]
     ) -> List[Dict[str, str]]:
@@ -1065,6 +1920,39 @@ class LLM(BaseLLM):
 
         return messages
 
+    def _apply_prompt_caching(
+        self, messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Mark the stable prompt prefix for Anthropic prompt caching.
+
+        Only applies to LLMs created with prompt_caching=True. The agent's system prompt does not change between iterations or tasks,
+        and every iteration only appends to the conversation. Marking the last
+        system message and the last message lets each call read the previous
+        call's prefix from the cache. Other providers cache prefixes on their
+        own, so their messages are returned as is.
+
+        Args:
+            messages: Messages already formatted for the provider.
+
+        Returns:
+            A new list in which the marked messages are copies carrying an
+            ephemeral cache_control block. The input messages are not modified.
+        """
+        if not self.prompt_caching or not self.is_anthropic or not messages:
+            return messages
+
+        breakpoints = {len(messages) - 1}
+        system_indexes = [
+            index for index, msg in enumerate(messages) if msg["role"] == "system"
+        ]
+        if system_indexes:
+            breakpoints.add(system_indexes[-1])
+
+        return [
+            _with_cache_control(msg) if index in breakpoints else msg
+            for index, msg in enumerate(messages)
+        ]
+
     def _get_custom_llm_provider(self) -> Optional[str]:
         """
         Derives the custom_llm_provider from the model string.
@@ -1095,7 +1983,21 @@ class LLM(BaseLLM):
                 "Please remove response_format or use a supported model."
             )
 
+    def _capability_key(self) -> CapabilityKey:
+        return (
+            self.model,
+            self._get_custom_llm_provider(),
+            self.base_url or self.api_base,
+        )
+
     def supports_function_calling(self) -> bool:
+        return model_capability_registry.resolve(
+            self._capability_key(),
+            "supports_function_calling",
+            self._check_function_calling_support,
+        )
+
+    def _check_function_calling_support(self) -> bool:
         try:
             provider = self._get_custom_llm_provider()
             return litellm.utils.supports_function_calling(
@@ -1106,6 +2008,13 @@ class LLM(BaseLLM):
             return False
 
     def supports_stop_words(self) -> bool:
+        return model_capability_registry.resolve(
+            self._capability_key(),
+            "supports_stop_words",
+            self._check_stop_words_support,
+        )
+
+    def _check_stop_words_support(self) -> bool:
         try:
             params = get_supported_openai_params(model=self.model)
             return params is not None and "stop" in params
@@ -1124,6 +2033,13 @@ class LLM(BaseLLM):
         if self.context_window_size != 0:
             return self.context_window_size
 
+        context_window = model_capability_registry.resolve(
+            self._capability_key(), "context_window", self._lookup_context_window
+        )
+        self.context_window_size = int(context_window * CONTEXT_WINDOW_USAGE_RATIO)
+        return self.context_window_size
+
+    def _lookup_context_window(self) -> int:
         MIN_CONTEXT = 1024
         MAX_CONTEXT = 2097152  # Current max from gemini-1.5-pro
 
@@ -1134,13 +2050,11 @@ class LLM(BaseLLM):
                     f"Context window for {key} must be between {MIN_CONTEXT} and {MAX_CONTEXT}"
                 )
 
-        self.context_window_size = int(
-            DEFAULT_CONTEXT_WINDOW_SIZE * CONTEXT_WINDOW_USAGE_RATIO
-        )
+        context_window = DEFAULT_CONTEXT_WINDOW_SIZE
         for key, value in LLM_CONTEXT_WINDOW_SIZES.items():
             if self.model.startswith(key):
-                self.context_window_size = int(value * CONTEXT_WINDOW_USAGE_RATIO)
-        return self.context_window_size
+                context_window = value
+        return context_window
 
     def set_callbacks(self, callbacks: List[Any]):
         """
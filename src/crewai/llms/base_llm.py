@@ -1,5 +1,38 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from crewai.types.usage_metrics import UsageMetrics
+from crewai.utilities.cancellation import submit_in_context
+
+
+class LLMBatchResult(BaseModel):
+    """Outcome of a batch of independent LLM calls.
+
+    Attributes:
+        responses: One entry per prompt, in the order the prompts were given.
+            Failed prompts have None as their response.
+        errors: Exceptions raised by failed prompts, keyed by prompt index.
+        usage: Token usage summed over the whole batch.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    responses: List[Optional[Any]] = Field(default_factory=list)
+    errors: Dict[int, Exception] = Field(default_factory=dict)
+    usage: UsageMetrics = Field(default_factory=UsageMetrics)
+
+    @property
+    def has_errors(self) -> bool:
+        return bool(self.errors)
+
+    def raise_first_error(self) -> None:
+        """Re-raise the error of the first failed prompt, if any."""
+        if self.errors:
+            raise self.errors[min(self.errors)]
 
 
 class BaseLLM(ABC):
@@ -76,6 +109,170 @@ class BaseLLM(ABC):
         """
         pass
 
+    async def acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        """Asynchronously call the LLM with the given messages.
+
+        The default implementation runs call in a worker thread. Implementations
+        with a native async client should override this method.
+
+        Args:
+            messages: Input messages for the LLM, as for call.
+            tools: Optional list of tool schemas for function calling.
+            callbacks: Optional list of callback functions.
+            available_functions: Optional dict mapping function names to callables.
+            from_task: Optional task caller to be used for the LLM call.
+            from_agent: Optional agent caller to be used for the LLM call.
+
+        Returns:
+            Either a text response from the LLM (str) or
+            the result of a tool function call (Any).
+        """
+        return await asyncio.to_thread(
+            self.call,
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+        )
+
+    def batch_call(
+        self,
+        messages_list: List[Union[str, List[Dict[str, str]]]],
+        max_concurrency: int = 4,
+        callbacks: Optional[List[Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> LLMBatchResult:
+        """Run independent prompts concurrently in a bounded thread pool.
+
+        A failing prompt does not abort the batch; its exception is recorded in
+        the result instead. Token usage is collected for the whole batch and
+        added to the given callbacks' token counters and rate limiters once,
+        at the end.
+
+        Args:
+            messages_list: One messages argument per prompt, as accepted by call.
+            max_concurrency: Maximum number of calls in flight at once.
+            callbacks: Optional callbacks that should receive the batch usage.
+            from_task: Optional task caller to be used for the LLM calls.
+            from_agent: Optional agent caller to be used for the LLM calls.
+
+        Returns:
+            LLMBatchResult: Responses in prompt order, per-prompt errors and usage.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        batch_callbacks, token_process = self._create_batch_callbacks()
+        result = LLMBatchResult(responses=[None] * len(messages_list))
+
+        def _call(messages: Union[str, List[Dict[str, str]]]) -> Any:
+            return self.call(
+                messages,
+                callbacks=batch_callbacks,
+                from_task=from_task,
+                from_agent=from_agent,
+            )
+
+        if messages_list:
+            with ThreadPoolExecutor(
+                max_workers=min(max_concurrency, len(messages_list))
+            ) as executor:
+                # Workers keep the caller's cancellation token and deadline
+                futures = [
+                    submit_in_context(executor, _call, messages)
+                    for messages in messages_list
+                ]
+                for index, future in enumerate(futures):
+                    try:
+                        result.responses[index] = future.result()
+                    except Exception as e:
+                        result.errors[index] = e
+
+        self._finalize_batch_usage(result, token_process, callbacks)
+        return result
+
+    async def abatch_call(
+        self,
+        messages_list: List[Union[str, List[Dict[str, str]]]],
+        max_concurrency: int = 4,
+        callbacks: Optional[List[Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> LLMBatchResult:
+        """Async version of batch_call, bounding concurrent acall invocations."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        batch_callbacks, token_process = self._create_batch_callbacks()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _call(messages: Union[str, List[Dict[str, str]]]) -> Any:
+            async with semaphore:
+                return await self.acall(
+                    messages,
+                    callbacks=batch_callbacks,
+                    from_task=from_task,
+                    from_agent=from_agent,
+                )
+
+        outcomes = await asyncio.gather(
+            *(_call(messages) for messages in messages_list), return_exceptions=True
+        )
+        result = LLMBatchResult(responses=[None] * len(messages_list))
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                result.errors[index] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                result.responses[index] = outcome
+
+        self._finalize_batch_usage(result, token_process, callbacks)
+        return result
+
+    @staticmethod
+    def _create_batch_callbacks() -> Tuple[List[Any], Any]:
+        from crewai.agents.agent_builder.utilities.base_token_process import (
+            TokenProcess,
+        )
+        from crewai.utilities.token_counter_callback import TokenCalcHandler
+
+        token_process = TokenProcess()
+        return [TokenCalcHandler(token_process)], token_process
+
+    @staticmethod
+    def _finalize_batch_usage(
+        result: LLMBatchResult,
+        token_process: Any,
+        callbacks: Optional[List[Any]] = None,
+    ) -> None:
+        result.usage = token_process.get_summary()
+        for callback in callbacks or []:
+            rpm_controller = getattr(callback, "rpm_controller", None)
+            if rpm_controller is not None and result.usage.total_tokens:
+                rpm_controller.record_tokens(result.usage.total_tokens)
+            caller_process = getattr(callback, "token_cost_process", None)
+            if caller_process is None:
+                continue
+            caller_process.sum_prompt_tokens(result.usage.prompt_tokens)
+            caller_process.sum_completion_tokens(result.usage.completion_tokens)
+            caller_process.sum_cached_prompt_tokens(result.usage.cached_prompt_tokens)
+            caller_process.sum_cache_creation_prompt_tokens(
+                result.usage.cache_creation_prompt_tokens
+            )
+            caller_process.sum_successful_requests(result.usage.successful_requests)
+
     def supports_stop_words(self) -> bool:
         """Check if the LLM supports stop words.
 
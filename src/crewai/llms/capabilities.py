@@ -0,0 +1,172 @@
+"""Process-wide registry of model capabilities."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+CapabilityKey = Tuple[str, Optional[str], Optional[str]]
+
+CAPABILITY_FIELDS = (
+    "supports_function_calling",
+    "supports_stop_words",
+    "context_window",
+)
+
+# Path of a JSON file preloaded into the registry on first use.
+CAPABILITIES_FILE_ENV = "CREWAI_MODEL_CAPABILITIES_FILE"
+
+
+class ModelCapabilities(BaseModel):
+    """Capabilities of a model. Fields left as None are not known yet."""
+
+    supports_function_calling: Optional[bool] = None
+    supports_stop_words: Optional[bool] = None
+    context_window: Optional[int] = None
+
+
+class ModelCapabilityRegistry:
+    """Memoizes model capabilities keyed on (model, provider, base_url).
+
+    Capabilities are computed once per key, the first time they are asked
+    for. Overrides, set directly or preloaded from a JSON file, take
+    precedence and are never computed. An override without a provider or
+    base_url applies to every deployment of the model that has no more
+    specific override. Concurrent misses on the same capability of a key
+    wait for a single computation, while other keys are resolved meanwhile.
+
+    The JSON file holds a list of objects with a "model" and optionally a
+    "provider", a "base_url" and any of the capability fields. The file
+    named by the CREWAI_MODEL_CAPABILITIES_FILE environment variable is
+    loaded automatically on first use.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[CapabilityKey, ModelCapabilities] = {}
+        self._overrides: Dict[CapabilityKey, ModelCapabilities] = {}
+        self._lock = threading.RLock()
+        self._compute_locks: Dict[Tuple[CapabilityKey, str], threading.Lock] = {}
+        self._env_file_loaded = False
+
+    def resolve(
+        self,
+        key: CapabilityKey,
+        capability: str,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """Return a capability for a key, computing and storing it on a miss.
+
+        compute runs outside the registry lock, so a slow lookup only holds
+        up callers asking for the same capability of the same key.
+        """
+        with self._lock:
+            self._load_env_file()
+            value = self._lookup(key, capability)
+            if value is not None:
+                return value
+            compute_lock = self._compute_locks.setdefault(
+                (key, capability), threading.Lock()
+            )
+
+        with compute_lock:
+            with self._lock:
+                value = self._lookup(key, capability)
+            if value is not None:
+                return value
+
+            value = compute()
+            with self._lock:
+                entry = self._entries.setdefault(key, ModelCapabilities())
+                setattr(entry, capability, value)
+            return value
+
+    def override(
+        self,
+        model: str,
+        provider: Optional[str] = None,
+        base_url: Optional[str] = None,
+        **capabilities: Any,
+    ) -> None:
+        """Set capabilities for a model, replacing computed or preloaded values."""
+        unknown = set(capabilities) - set(CAPABILITY_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown model capabilities: {sorted(unknown)}")
+
+        with self._lock:
+            entry = self._overrides.setdefault(
+                (model, provider, base_url), ModelCapabilities()
+            )
+            for capability, value in capabilities.items():
+                setattr(entry, capability, value)
+
+    def load(self, path: Union[str, Path]) -> None:
+        """Preload capabilities from a JSON file."""
+        with open(path, "r", encoding="utf-8") as file:
+            entries: List[Dict[str, Any]] = json.load(file)
+
+        for entry in entries:
+            entry = dict(entry)
+            self.override(
+                entry.pop("model"),
+                provider=entry.pop("provider", None),
+                base_url=entry.pop("base_url", None),
+                **entry,
+            )
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """Write every known entry to a JSON file that load can read back.
+
+        Overrides are written after computed entries so that they still win
+        once the file is loaded.
+        """
+        with self._lock:
+            known = [*self._entries.items(), *self._overrides.items()]
+            entries = [
+                {
+                    "model": model,
+                    "provider": provider,
+                    "base_url": base_url,
+                    **capabilities.model_dump(exclude_none=True),
+                }
+                for (model, provider, base_url), capabilities in known
+            ]
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(entries, file, indent=2)
+
+    def clear(self) -> None:
+        """Forget every entry, including preloaded ones."""
+        with self._lock:
+            self._entries.clear()
+            self._overrides.clear()
+            self._compute_locks.clear()
+            self._env_file_loaded = False
+
+    def _lookup(self, key: CapabilityKey, capability: str) -> Any:
+        model, provider, base_url = key
+        candidates = [
+            (model, provider, base_url),
+            (model, provider, None),
+            (model, None, None),
+        ]
+        for candidate in candidates:
+            entry = self._overrides.get(candidate)
+            if entry is not None and getattr(entry, capability) is not None:
+                return getattr(entry, capability)
+
+        entry = self._entries.get(key)
+        return getattr(entry, capability) if entry is not None else None
+
+    def _load_env_file(self) -> None:
+        if self._env_file_loaded:
+            return
+        self._env_file_loaded = True
+        path = os.environ.get(CAPABILITIES_FILE_ENV)
+        if path:
+            self.load(path)
+
+
+model_capability_registry = ModelCapabilityRegistry()
@@ -0,0 +1,370 @@
+import gzip
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+import yaml
+
+from crewai.llms.base_llm import BaseLLM
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.llm_events import (
+    LLMCallCompletedEvent,
+    LLMCallStartedEvent,
+    LLMCallType,
+)
+
+RECORDED_LATENCY = "recorded"
+
+LatencySpec = Union[float, str, Callable[[Dict[str, Any]], float]]
+
+
+class ReplayLLM(BaseLLM):
+    """LLM backend that replays completions from a cassette, without network.
+
+    Reads the VCR cassettes used by the test suite, as well as cassettes
+    written by ReplayLLM itself in record mode. Replaying a crew with a
+    fixed latency separates the framework's own overhead from provider
+    latency.
+
+    Each call is matched against the recorded chat completion requests by
+    its messages. When no recorded request has the same messages, the next
+    unused interaction is replayed instead, unless strict is set.
+
+    Args:
+        cassette: Path to the cassette YAML file.
+        llm: LLM whose calls are recorded. Required in record mode.
+        record: Record calls to llm and append them to the cassette, instead
+            of replaying it.
+        latency: Delay injected before each replayed response. Either a
+            number of seconds, "recorded" to reuse the latency measured while
+            recording, or a callable receiving the recorded interaction.
+        strict: Raise instead of falling back to the next interaction when
+            a call does not match any recorded request.
+        model: Model name reported by this LLM. Defaults to the model of the
+            wrapped LLM, or of the first recorded request.
+    """
+
+    def __init__(
+        self,
+        cassette: str,
+        llm: Optional[BaseLLM] = None,
+        record: bool = False,
+        latency: LatencySpec = 0.0,
+        strict: bool = False,
+        model: Optional[str] = None,
+    ):
+        if record and llm is None:
+            raise ValueError("An llm to record is required in record mode")
+
+        self.cassette = cassette
+        self.llm = llm
+        self.record = record
+        self.latency = latency
+        self.strict = strict
+        self._lock = threading.Lock()
+        self._interactions = self._load_interactions()
+        self._used: Set[int] = set()
+        self._cassette_ready = False
+
+        if model is None:
+            model = getattr(llm, "model", None) or next(
+                (
+                    interaction["model"]
+                    for interaction in self._interactions
+                    if interaction.get("model")
+                ),
+                "replay",
+            )
+        super().__init__(model=model, temperature=getattr(llm, "temperature", None))
+        if llm is not None:
+            self.stop = llm.stop
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+
+        if self.record:
+            return self._record_call(
+                messages, tools, callbacks, available_functions, from_task, from_agent
+            )
+
+        # The events read the task and agent from their init kwargs
+        source: Dict[str, Any] = {"from_task": from_task, "from_agent": from_agent}
+        assert hasattr(crewai_event_bus, "emit")
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallStartedEvent(
+                messages=messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                **source,
+            ),
+        )
+
+        interaction = self._next_interaction(messages)
+        delay = self._latency_for(interaction)
+        if delay > 0:
+            time.sleep(delay)
+
+        self._log_usage(callbacks, interaction.get("usage"))
+        result, call_type = self._build_result(interaction, available_functions)
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallCompletedEvent(
+                response=result,
+                call_type=call_type,
+                **source,
+            ),
+        )
+        return result
+
+    def supports_function_calling(self) -> bool:
+        if self.llm is not None and hasattr(self.llm, "supports_function_calling"):
+            return self.llm.supports_function_calling()
+        return False
+
+    def supports_stop_words(self) -> bool:
+        if self.llm is not None:
+            return self.llm.supports_stop_words()
+        return True
+
+    def get_context_window_size(self) -> int:
+        if self.llm is not None:
+            return self.llm.get_context_window_size()
+        return super().get_context_window_size()
+
+    def _record_call(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[dict]],
+        callbacks: Optional[List[Any]],
+        available_functions: Optional[Dict[str, Any]],
+        from_task: Optional[Any],
+        from_agent: Optional[Any],
+    ) -> Union[str, Any]:
+        from crewai.agents.agent_builder.utilities.base_token_process import (
+            TokenProcess,
+        )
+        from crewai.utilities.token_counter_callback import TokenCalcHandler
+
+        assert self.llm is not None
+        token_process = TokenProcess()
+        started_at = time.monotonic()
+        result = self.llm.call(
+            messages,
+            tools=tools,
+            callbacks=[*(callbacks or []), TokenCalcHandler(token_process)],
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+        )
+        elapsed = time.monotonic() - started_at
+
+        usage = token_process.get_summary()
+        interaction = {
+            "request": {
+                "method": "POST",
+                "uri": f"replay://{self.model}",
+                "body": json.dumps({"model": self.model, "messages": messages}),
+            },
+            "response": {
+                "status_code": 200,
+                "elapsed": elapsed,
+                "content": json.dumps(
+                    {
+                        "object": "chat.completion",
+                        "model": self.model,
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {
+                                    "role": "assistant",
+                                    "content": str(result),
+                                },
+                            }
+                        ],
+                        "usage": {
+                            "prompt_tokens": usage.prompt_tokens,
+                            "completion_tokens": usage.completion_tokens,
+                            "total_tokens": usage.total_tokens,
+                        },
+                    }
+                ),
+            },
+        }
+        parsed = _parse_interaction(interaction)
+        with self._lock:
+            self._append_to_cassette(interaction)
+            if parsed is not None:
+                self._interactions.append(parsed)
+        return result
+
+    def _next_interaction(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        key = _messages_key(messages)
+        with self._lock:
+            unused = [
+                index
+                for index in range(len(self._interactions))
+                if index not in self._used
+            ]
+            match = next(
+                (i for i in unused if self._interactions[i]["key"] == key), None
+            )
+            if match is None:
+                if self.strict or not unused:
+                    raise ValueError(
+                        f"No recorded interaction left in {self.cassette} "
+                        "matching the call messages"
+                    )
+                match = unused[0]
+            self._used.add(match)
+            return self._interactions[match]
+
+    def _latency_for(self, interaction: Dict[str, Any]) -> float:
+        if callable(self.latency):
+            return float(self.latency(interaction))
+        if self.latency == RECORDED_LATENCY:
+            return float(interaction.get("elapsed") or 0.0)
+        return float(self.latency)
+
+    @staticmethod
+    def _log_usage(callbacks: Optional[List[Any]], usage: Optional[Any]) -> None:
+        if not usage:
+            return
+
+        from litellm.types.utils import Usage
+
+        usage_obj = Usage(
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0),
+        )
+        for callback in callbacks or []:
+            if hasattr(callback, "log_success_event"):
+                callback.log_success_event(
+                    kwargs={},
+                    response_obj={"usage": usage_obj},
+                    start_time=0,
+                    end_time=0,
+                )
+
+    @staticmethod
+    def _build_result(
+        interaction: Dict[str, Any],
+        available_functions: Optional[Dict[str, Any]],
+    ) -> Tuple[Any, LLMCallType]:
+        tool_calls = interaction.get("tool_calls")
+        if tool_calls and available_functions:
+            function = tool_calls[0].get("function", {})
+            name = function.get("name")
+            if name in available_functions:
+                arguments = json.loads(function.get("arguments") or "{}")
+                return available_functions[name](**arguments), LLMCallType.TOOL_CALL
+        return interaction.get("content") or "", LLMCallType.LLM_CALL
+
+    def _load_interactions(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.cassette):
+            if self.record:
+                return []
+            raise FileNotFoundError(f"Cassette not found: {self.cassette}")
+
+        with open(self.cassette, "r", encoding="utf-8") as file:
+            data = yaml.safe_load(file) or {}
+
+        interactions = []
+        for interaction in data.get("interactions") or []:
+            parsed = _parse_interaction(interaction)
+            if parsed is not None:
+                interactions.append(parsed)
+        return interactions
+
+    def _append_to_cassette(self, interaction: Dict[str, Any]) -> None:
+        if not self._cassette_ready:
+            self._prepare_cassette()
+        with open(self.cassette, "a", encoding="utf-8") as file:
+            yaml.safe_dump([interaction], file, sort_keys=False)
+
+    def _prepare_cassette(self) -> None:
+        """Write the cassette once with its interactions last, so that every
+        recorded interaction can then be appended to the end of the file."""
+        data: Dict[str, Any] = {}
+        if os.path.exists(self.cassette):
+            with open(self.cassette, "r", encoding="utf-8") as file:
+                data = yaml.safe_load(file) or {}
+        interactions = data.pop("interactions", None) or []
+        data.setdefault("version", 1)
+
+        directory = os.path.dirname(self.cassette)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.cassette, "w", encoding="utf-8") as file:
+            yaml.safe_dump(data, file, sort_keys=False)
+            file.write("interactions:\n")
+            if interactions:
+                yaml.safe_dump(interactions, file, sort_keys=False)
+        self._cassette_ready = True
+
+
+def _messages_key(messages: List[Dict[str, Any]]) -> str:
+    return json.dumps(
+        [
+            {"role": message.get("role"), "content": message.get("content")}
+            for message in messages
+        ],
+        sort_keys=True,
+    )
+
+
+def _parse_interaction(interaction: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Extract a chat completion from a cassette interaction.
+
+    Returns None for interactions that are not chat completions, such as
+    telemetry requests, or that cannot be decoded.
+    """
+    request = interaction.get("request", {})
+    response = interaction.get("response", {})
+    try:
+        request_body = json.loads(_decode_body(request.get("body")))
+        response_body = json.loads(
+            _decode_body(response.get("content", response.get("body")))
+        )
+    except (TypeError, ValueError):
+        return None
+
+    if not isinstance(request_body, dict) or "messages" not in request_body:
+        return None
+    if not isinstance(response_body, dict) or not response_body.get("choices"):
+        return None
+
+    message = response_body["choices"][0].get("message") or {}
+    return {
+        "key": _messages_key(request_body["messages"]),
+        "model": request_body.get("model"),
+        "content": message.get("content"),
+        "tool_calls": message.get("tool_calls"),
+        "usage": response_body.get("usage"),
+        "elapsed": response.get("elapsed"),
+    }
+
+
+def _decode_body(body: Any) -> str:
+    if isinstance(body, dict):
+        body = body.get("string")
+    if isinstance(body, bytes):
+        if body[:2] == b"\x1f\x8b":
+            body = gzip.decompress(body)
+        body = body.decode("utf-8")
+    if not isinstance(body, str):
+        raise TypeError("Unsupported cassette body")
+    return body
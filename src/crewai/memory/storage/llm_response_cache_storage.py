@@ -0,0 +1,197 @@
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from crewai.utilities.errors import DatabaseError, DatabaseOperationError
+from crewai.utilities.paths import db_storage_path
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCacheSQLiteStorage:
+    """
+    SQLite storage class for caching LLM responses across runs.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        if db_path is None:
+            db_path = str(Path(db_storage_path()) / "llm_response_cache.db")
+        self.db_path = db_path
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        """Initialize the SQLite database and create the llm_response_cache table.
+
+        Entries are keyed by (namespace, cache_key) so that different crews can
+        share a single database file without seeing each other's responses.
+
+        Raises:
+            DatabaseOperationError: If database initialization fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS llm_response_cache (
+                        namespace TEXT NOT NULL,
+                        cache_key TEXT NOT NULL,
+                        model TEXT,
+                        response TEXT NOT NULL,
+                        created_at REAL NOT NULL,
+                        last_accessed REAL NOT NULL,
+                        hits INTEGER DEFAULT 0,
+                        PRIMARY KEY (namespace, cache_key)
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_accessed
+                    ON llm_response_cache (namespace, last_accessed)
+                """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def get(
+        self, namespace: str, cache_key: str, ttl: Optional[float] = None
+    ) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss.
+
+        Expired entries are deleted on read. A hit refreshes the entry's
+        last_accessed timestamp so that eviction is least-recently-used.
+
+        Args:
+            namespace: Namespace the entry was stored under.
+            cache_key: Hash of the normalized completion parameters.
+            ttl: Maximum age in seconds. None means entries never expire.
+        """
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT response, created_at
+                    FROM llm_response_cache
+                    WHERE namespace = ? AND cache_key = ?
+                """,
+                    (namespace, cache_key),
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+
+                response, created_at = row
+                if ttl is not None and now - created_at > ttl:
+                    cursor.execute(
+                        "DELETE FROM llm_response_cache WHERE namespace = ? AND cache_key = ?",
+                        (namespace, cache_key),
+                    )
+                    conn.commit()
+                    return None
+
+                cursor.execute(
+                    """
+                    UPDATE llm_response_cache
+                    SET last_accessed = ?, hits = hits + 1
+                    WHERE namespace = ? AND cache_key = ?
+                """,
+                    (now, namespace, cache_key),
+                )
+                conn.commit()
+                return response
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.LOAD_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def add(
+        self,
+        namespace: str,
+        cache_key: str,
+        response: str,
+        model: Optional[str] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """Store a response, then evict least-recently-used entries over max_entries.
+
+        Args:
+            namespace: Namespace to store the entry under.
+            cache_key: Hash of the normalized completion parameters.
+            response: The text response returned by the LLM.
+            model: Model name, kept for inspection only.
+            max_entries: Maximum number of entries kept per namespace.
+        """
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_response_cache
+                    (namespace, cache_key, model, response, created_at, last_accessed, hits)
+                    VALUES (?, ?, ?, ?, ?, ?, 0)
+                """,
+                    (namespace, cache_key, model, response, now, now),
+                )
+                if max_entries is not None:
+                    cursor.execute(
+                        """
+                        DELETE FROM llm_response_cache
+                        WHERE namespace = ? AND cache_key IN (
+                            SELECT cache_key FROM llm_response_cache
+                            WHERE namespace = ?
+                            ORDER BY last_accessed DESC
+                            LIMIT -1 OFFSET ?
+                        )
+                    """,
+                        (namespace, namespace, max_entries),
+                    )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def count(self, namespace: Optional[str] = None) -> int:
+        """Return the number of cached entries, optionally for one namespace."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                if namespace is None:
+                    cursor.execute("SELECT COUNT(*) FROM llm_response_cache")
+                else:
+                    cursor.execute(
+                        "SELECT COUNT(*) FROM llm_response_cache WHERE namespace = ?",
+                        (namespace,),
+                    )
+                return cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.LOAD_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def delete_all(self, namespace: Optional[str] = None) -> None:
+        """Delete cached entries, either for one namespace or all of them."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                if namespace is None:
+                    cursor.execute("DELETE FROM llm_response_cache")
+                else:
+                    cursor.execute(
+                        "DELETE FROM llm_response_cache WHERE namespace = ?",
+                        (namespace,),
+                    )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
@@ -0,0 +1,124 @@
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+from crewai.utilities.errors import DatabaseError, DatabaseOperationError
+from crewai.utilities.paths import db_storage_path
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+BucketLevels = Dict[str, Tuple[float, float]]
+
+
+class RateLimitSQLiteStorage:
+    """
+    SQLite storage class for rate limit buckets shared between processes.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        if db_path is None:
+            db_path = str(Path(db_storage_path()) / "rate_limits.db")
+        self.db_path = db_path
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        """Initialize the SQLite database and create the rate_limit_buckets table.
+
+        Each row holds the level of one bucket (for example "requests" or
+        "tokens") for a rate limit key, and the time it was last refilled.
+
+        Raises:
+            DatabaseOperationError: If database initialization fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                        limit_key TEXT NOT NULL,
+                        bucket TEXT NOT NULL,
+                        level REAL NOT NULL,
+                        updated_at REAL NOT NULL,
+                        PRIMARY KEY (limit_key, bucket)
+                    )
+                """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def update(self, limit_key: str, updater: Callable[[BucketLevels], T]) -> T:
+        """Atomically read, modify and write back the buckets of a key.
+
+        The update runs inside an immediate transaction, so concurrent
+        processes updating the same key are serialized by SQLite's lock.
+
+        Args:
+            limit_key: Key shared by every limiter drawing from the same budget.
+            updater: Receives the current levels as {bucket: (level, updated_at)},
+                mutates them in place and returns a value passed back to the caller.
+        """
+        try:
+            with sqlite3.connect(
+                self.db_path, timeout=30, isolation_level=None
+            ) as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    cursor.execute(
+                        """
+                        SELECT bucket, level, updated_at
+                        FROM rate_limit_buckets
+                        WHERE limit_key = ?
+                    """,
+                        (limit_key,),
+                    )
+                    levels: BucketLevels = {
+                        bucket: (level, updated_at)
+                        for bucket, level, updated_at in cursor.fetchall()
+                    }
+                    result = updater(levels)
+                    cursor.executemany(
+                        """
+                        INSERT OR REPLACE INTO rate_limit_buckets
+                        (limit_key, bucket, level, updated_at)
+                        VALUES (?, ?, ?, ?)
+                    """,
+                        [
+                            (limit_key, bucket, level, updated_at)
+                            for bucket, (level, updated_at) in levels.items()
+                        ],
+                    )
+                    cursor.execute("COMMIT")
+                except BaseException:
+                    cursor.execute("ROLLBACK")
+                    raise
+                return result
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def delete_all(self, limit_key: Optional[str] = None) -> None:
+        """Delete bucket state, either for one key or all of them."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                if limit_key is None:
+                    cursor.execute("DELETE FROM rate_limit_buckets")
+                else:
+                    cursor.execute(
+                        "DELETE FROM rate_limit_buckets WHERE limit_key = ?",
+                        (limit_key,),
+                    )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
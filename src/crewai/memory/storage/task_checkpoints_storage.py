@@ -0,0 +1,157 @@
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from crewai.utilities.crew_json_encoder import CrewJSONEncoder
+from crewai.utilities.errors import DatabaseError, DatabaseOperationError
+from crewai.utilities.paths import db_storage_path
+
+logger = logging.getLogger(__name__)
+
+
+class TaskCheckpointsSQLiteStorage:
+    """
+    SQLite storage for the in-flight state of the tasks of the latest kickoff.
+
+    Each task has at most one checkpoint, replaced after every step of its
+    agent loop, so that a replay can resume the task instead of restarting it.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        if db_path is None:
+            # Kept next to the task outputs of the same kickoff
+            db_path = str(Path(db_storage_path()) / "latest_kickoff_task_outputs.db")
+        self.db_path = db_path
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        """Create the latest_kickoff_task_checkpoints table if it does not exist.
+
+        Raises:
+            DatabaseOperationError: If database initialization fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS latest_kickoff_task_checkpoints (
+                        task_index INTEGER PRIMARY KEY,
+                        task_id TEXT,
+                        task_key TEXT,
+                        messages JSON,
+                        iterations INTEGER,
+                        tool_results JSON,
+                        inputs JSON,
+                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def save(
+        self,
+        task_index: int,
+        task_id: str,
+        task_key: str,
+        messages: List[Dict[str, Any]],
+        iterations: int,
+        tool_results: List[Dict[str, Any]],
+        inputs: Dict[str, Any],
+    ) -> None:
+        """Save the checkpoint of a task, replacing its previous one.
+
+        Raises:
+            DatabaseOperationError: If saving the checkpoint fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                INSERT OR REPLACE INTO latest_kickoff_task_checkpoints
+                (task_index, task_id, task_key, messages, iterations, tool_results, inputs)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                    (
+                        task_index,
+                        task_id,
+                        task_key,
+                        json.dumps(messages, cls=CrewJSONEncoder),
+                        iterations,
+                        json.dumps(tool_results, cls=CrewJSONEncoder),
+                        json.dumps(inputs, cls=CrewJSONEncoder),
+                    ),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Load all checkpoints, ordered by task_index.
+
+        Raises:
+            DatabaseOperationError: If loading checkpoints fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute(
+                    """
+                SELECT task_index, task_id, task_key, messages, iterations,
+                       tool_results, inputs, timestamp
+                FROM latest_kickoff_task_checkpoints
+                ORDER BY task_index
+                """
+                )
+                return [
+                    {
+                        "task_index": row[0],
+                        "task_id": row[1],
+                        "task_key": row[2],
+                        "messages": json.loads(row[3]),
+                        "iterations": row[4],
+                        "tool_results": json.loads(row[5]),
+                        "inputs": json.loads(row[6]),
+                        "timestamp": row[7],
+                    }
+                    for row in cursor.fetchall()
+                ]
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.LOAD_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def delete(self, task_index: int) -> None:
+        """Delete the checkpoint of a task, once the task has completed.
+
+        Raises:
+            DatabaseOperationError: If deleting the checkpoint fails due to SQLite errors.
+        """
+        self._delete(
+            "DELETE FROM latest_kickoff_task_checkpoints WHERE task_index = ?",
+            (task_index,),
+        )
+
+    def delete_all(self) -> None:
+        """Delete every checkpoint.
+
+        Raises:
+            DatabaseOperationError: If deleting checkpoints fails due to SQLite errors.
+        """
+        self._delete("DELETE FROM latest_kickoff_task_checkpoints", ())
+
+    def _delete(self, query: str, params: tuple) -> None:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(query, params)
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
@@ -0,0 +1,115 @@
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from crewai.utilities.errors import DatabaseError, DatabaseOperationError
+from crewai.utilities.paths import db_storage_path
+
+logger = logging.getLogger(__name__)
+
+
+class TaskResultsSQLiteStorage:
+    """
+    SQLite storage class for task outputs memoized across kickoffs.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        if db_path is None:
+            db_path = str(Path(db_storage_path()) / "task_results.db")
+        self.db_path = db_path
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        """Initialize the SQLite database and create the task_results table.
+
+        Entries are keyed by a hash of everything that determines the output
+        of a task, so identical tasks of different crews share an entry.
+
+        Raises:
+            DatabaseOperationError: If database initialization fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS task_results (
+                        cache_key TEXT PRIMARY KEY,
+                        output JSON NOT NULL,
+                        created_at REAL NOT NULL
+                    )
+                """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def get(self, cache_key: str, ttl: Optional[float] = None) -> Optional[str]:
+        """Return the stored output for a key, or None on a miss.
+
+        Expired entries are deleted on read.
+
+        Args:
+            cache_key: Hash of the task, agent and context.
+            ttl: Maximum age in seconds. None means entries never expire.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT output, created_at FROM task_results WHERE cache_key = ?",
+                    (cache_key,),
+                ).fetchone()
+                if row is None:
+                    return None
+
+                output, created_at = row
+                if ttl is not None and time.time() - created_at > ttl:
+                    conn.execute(
+                        "DELETE FROM task_results WHERE cache_key = ?", (cache_key,)
+                    )
+                    conn.commit()
+                    return None
+                return output
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.LOAD_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def add(self, cache_key: str, output: str) -> None:
+        """Store the JSON output of a task, replacing any previous entry.
+
+        Raises:
+            DatabaseOperationError: If saving the output fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO task_results (cache_key, output, created_at)
+                    VALUES (?, ?, ?)
+                """,
+                    (cache_key, output, time.time()),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def delete_all(self) -> None:
+        """Delete every stored output.
+
+        Raises:
+            DatabaseOperationError: If deleting outputs fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("DELETE FROM task_results")
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
@@ -0,0 +1,153 @@
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+from crewai.utilities.errors import DatabaseError, DatabaseOperationError
+from crewai.utilities.paths import db_storage_path
+
+logger = logging.getLogger(__name__)
+
+
+class ToolCacheSQLiteStorage:
+    """
+    SQLite storage class for tool results shared across crews and processes.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        if db_path is None:
+            db_path = str(Path(db_storage_path()) / "tool_cache.db")
+        self.db_path = db_path
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        """Initialize the SQLite database and create the tool_cache table.
+
+        Raises:
+            DatabaseOperationError: If database initialization fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS tool_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        tool TEXT NOT NULL,
+                        output TEXT NOT NULL,
+                        expires_at REAL,
+                        last_accessed REAL NOT NULL
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_tool_cache_last_accessed
+                    ON tool_cache (last_accessed)
+                """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def get(self, cache_key: str) -> Optional[Tuple[str, Optional[float]]]:
+        """Return the JSON encoded output for a key and its expiry, or None on a miss.
+
+        Expired entries are deleted on read. A hit refreshes the entry's
+        last_accessed timestamp so that eviction is least-recently-used.
+        """
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT output, expires_at FROM tool_cache WHERE cache_key = ?",
+                    (cache_key,),
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+
+                output, expires_at = row
+                if expires_at is not None and now >= expires_at:
+                    cursor.execute(
+                        "DELETE FROM tool_cache WHERE cache_key = ?", (cache_key,)
+                    )
+                    conn.commit()
+                    return None
+
+                cursor.execute(
+                    "UPDATE tool_cache SET last_accessed = ? WHERE cache_key = ?",
+                    (now, cache_key),
+                )
+                conn.commit()
+                return output, expires_at
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.LOAD_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def add(
+        self,
+        cache_key: str,
+        tool: str,
+        output: str,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """Store a tool output, then evict least-recently-used entries over max_entries.
+
+        Args:
+            cache_key: Canonical key of the tool call.
+            tool: Name of the tool, kept for inspection only.
+            output: JSON encoded output of the tool.
+            ttl: Seconds the entry stays valid. None means it never expires.
+            max_entries: Maximum number of entries kept in the table.
+        """
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    INSERT OR REPLACE INTO tool_cache
+                    (cache_key, tool, output, expires_at, last_accessed)
+                    VALUES (?, ?, ?, ?, ?)
+                """,
+                    (cache_key, tool, output, expires_at, now),
+                )
+                if max_entries is not None:
+                    cursor.execute(
+                        """
+                        DELETE FROM tool_cache WHERE cache_key IN (
+                            SELECT cache_key FROM tool_cache
+                            ORDER BY last_accessed DESC
+                            LIMIT -1 OFFSET ?
+                        )
+                    """,
+                        (max_entries,),
+                    )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def delete_all(self) -> None:
+        """Delete every stored tool output.
+
+        Raises:
+            DatabaseOperationError: If deleting outputs fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("DELETE FROM tool_cache")
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
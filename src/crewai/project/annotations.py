@@ -1,5 +1,6 @@
 from functools import wraps
-from typing import Callable
+from importlib import import_module
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from crewai import Crew
 from crewai.project.utils import memoize
@@ -122,6 +123,39 @@ def crew(func) -> Callable[..., Crew]:
         for _, callback in self._after_kickoff.items():
             crew.after_kickoff_callbacks.append(callback_wrapper(callback, self))
 
+        crew._factory = CrewBaseFactory(
+            module=self._crew_module,
+            class_name=self._crew_name,
+            method_name=func.__name__,
+            args=getattr(self, "_init_args", ()),
+            kwargs=getattr(self, "_init_kwargs", None),
+        )
         return crew
 
     return memoize(wrapper)
+
+
+class CrewBaseFactory:
+    """Picklable recipe that builds a crew again from its CrewBase class.
+
+    Used to rebuild the crew in worker processes, where the crew instance
+    itself cannot be sent.
+    """
+
+    def __init__(
+        self,
+        module: str,
+        class_name: str,
+        method_name: str,
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+    ):
+        self.module = module
+        self.class_name = class_name
+        self.method_name = method_name
+        self.args = args
+        self.kwargs = kwargs or {}
+
+    def __call__(self) -> Crew:
+        crew_class = getattr(import_module(self.module), self.class_name)
+        return getattr(crew_class(*self.args, **self.kwargs), self.method_name)()
@@ -32,6 +32,9 @@ def CrewBase(cls: T) -> T:
 
         def __init__(self, *args, **kwargs):
             super().__init__(*args, **kwargs)
+            # Kept so that crews can be rebuilt in worker processes
+            self._init_args = args
+            self._init_kwargs = kwargs
             self.load_configurations()
             self.map_all_agent_variables()
             self.map_all_task_variables()
@@ -288,5 +291,6 @@ def CrewBase(cls: T) -> T:
     WrappedClass.__name__ = CrewBase.__name__ + "(" + cls.__name__ + ")"
     WrappedClass.__qualname__ = CrewBase.__qualname__ + "(" + cls.__name__ + ")"
     WrappedClass._crew_name = cls.__name__
+    WrappedClass._crew_module = cls.__module__
 
     return cast(T, WrappedClass)
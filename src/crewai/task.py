@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import inspect
 import json
@@ -38,6 +39,12 @@ from crewai.security import Fingerprint, SecurityConfig
 from crewai.tasks.output_format import OutputFormat
 from crewai.tasks.task_output import TaskOutput
 from crewai.tools.base_tool import BaseTool
+from crewai.utilities.cancellation import (
+    CancellationToken,
+    cancellation_scope,
+    current_cancellation_token,
+    raise_if_cancelled,
+)
 from crewai.utilities.config import process_config
 from crewai.utilities.constants import NOT_SPECIFIED, _NotSpecified
 from crewai.utilities.guardrail import process_guardrail, GuardrailResult
@@ -51,6 +58,8 @@ from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.i18n import I18N
 from crewai.utilities.printer import Printer
 from crewai.utilities.string_utils import interpolate_only
+from crewai.utilities.task_executor import TaskExecutor, get_default_task_executor
+from crewai.utilities.task_result_cache_handler import TaskResultCacheHandler
 
 
 class Task(BaseModel):
@@ -61,6 +70,8 @@ class Task(BaseModel):
     Attributes:
         agent: Agent responsible for task execution. Represents entity performing task.
         async_execution: Boolean flag indicating asynchronous task execution.
+        cache: Whether to reuse the stored output of an identical earlier run.
+            Tasks with human_input are never cached.
         callback: Function/object executed post task completion for additional actions.
         config: Dictionary containing task-specific configuration parameters.
         context: List of Task instances providing task context or input data.
@@ -103,6 +114,10 @@ class Task(BaseModel):
         description="Whether the task should be executed asynchronously or not.",
         default=False,
     )
+    cache: Optional[bool] = Field(
+        description="Whether to reuse the stored output of an identical earlier run of the task instead of executing it. Defaults to the task_cache setting of the crew.",
+        default=None,
+    )
     output_json: Optional[Type[BaseModel]] = Field(
         description="A Pydantic model to be used to create a JSON output.",
         default=None,
@@ -224,6 +239,7 @@ class Task(BaseModel):
     _original_expected_output: Optional[str] = PrivateAttr(default=None)
     _original_output_file: Optional[str] = PrivateAttr(default=None)
     _thread: Optional[threading.Thread] = PrivateAttr(default=None)
+    _result_cache: Optional[TaskResultCacheHandler] = PrivateAttr(default=None)
 
     @model_validator(mode="before")
     @classmethod
@@ -369,134 +385,284 @@ class Task(BaseModel):
         agent: BaseAgent | None = None,
         context: Optional[str] = None,
         tools: Optional[List[BaseTool]] = None,
+        executor: Optional[TaskExecutor] = None,
     ) -> Future[TaskOutput]:
-        """Execute the task asynchronously."""
-        future: Future[TaskOutput] = Future()
-        threading.Thread(
-            daemon=True,
-            target=self._execute_task_async,
-            args=(agent, context, tools, future),
-        ).start()
-        return future
-
-    def _execute_task_async(
+        """Execute the task asynchronously.
+
+        The task runs on executor, or on the pool shared by all crews when
+        none is given. Exceptions raised by the task are set on the future.
+        """
+        executor = executor or get_default_task_executor()
+        return executor.submit(self._execute_core, agent, context, tools)
+
+    def _execute_core(
         self,
         agent: Optional[BaseAgent],
         context: Optional[str],
         tools: Optional[List[Any]],
-        future: Future[TaskOutput],
-    ) -> None:
-        """Execute the task asynchronously with context handling."""
-        result = self._execute_core(agent, context, tools)
-        future.set_result(result)
+        result: Optional[str] = None,
+    ) -> TaskOutput:
+        """Run the core execution logic of the task.
 
-    def _execute_core(
+        A result the agent already produced for this context, such as the
+        result of a speculative run, is used instead of executing the agent.
+        """
+        with cancellation_scope(self._cancellation_token_for(agent)):
+            try:
+                raise_if_cancelled()
+                agent, tools = self._start_execution(agent, context, tools)
+                cache_entry = self._read_result_cache(agent, context, tools)
+                if cache_entry is not None and cache_entry[1] is not None:
+                    self._finish_execution(cache_entry[1], cache_entry[1].raw)
+                    return cache_entry[1]
+
+                if result is None:
+                    result = agent.execute_task(
+                        task=self,
+                        context=context,
+                        tools=tools,
+                    )
+
+                task_output, retry_context = self._complete_execution(agent, result)
+                if retry_context is not None:
+                    task_output = self._execute_core(agent, retry_context, tools)
+                if cache_entry is not None:
+                    self._write_result_cache(cache_entry[0], task_output)
+                return task_output
+            except Exception as e:
+                self.end_time = datetime.datetime.now()
+                crewai_event_bus.emit(self, TaskFailedEvent(error=str(e), task=self))
+                raise e  # Re-raise the exception after emitting the event
+
+    async def aexecute(
+        self,
+        agent: Optional[BaseAgent] = None,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> TaskOutput:
+        """Execute the task natively on the running event loop."""
+        return await self._aexecute_core(agent, context, tools)
+
+    async def _aexecute_core(
         self,
         agent: Optional[BaseAgent],
         context: Optional[str],
         tools: Optional[List[Any]],
     ) -> TaskOutput:
-        """Run the core execution logic of the task."""
-        try:
-            agent = agent or self.agent
-            self.agent = agent
-            if not agent:
-                raise Exception(
-                    f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
+        """Async version of _execute_core, awaiting the agent's aexecute_task."""
+        with cancellation_scope(self._cancellation_token_for(agent)):
+            try:
+                raise_if_cancelled()
+                agent, tools = self._start_execution(agent, context, tools)
+                cache_entry = await asyncio.to_thread(
+                    self._read_result_cache, agent, context, tools
                 )
+                if cache_entry is not None and cache_entry[1] is not None:
+                    await asyncio.to_thread(
+                        self._finish_execution, cache_entry[1], cache_entry[1].raw
+                    )
+                    return cache_entry[1]
 
-            self.start_time = datetime.datetime.now()
-
-            self.prompt_context = context
-            tools = tools or self.tools or []
+                result = await agent.aexecute_task(
+                    task=self,
+                    context=context,
+                    tools=tools,
+                )
 
-            self.processed_by_agents.add(agent.role)
-            crewai_event_bus.emit(self, TaskStartedEvent(context=context, task=self))
-            result = agent.execute_task(
-                task=self,
-                context=context,
-                tools=tools,
+                task_output, retry_context = await asyncio.to_thread(
+                    self._complete_execution, agent, result
+                )
+                if retry_context is not None:
+                    task_output = await self._aexecute_core(agent, retry_context, tools)
+                if cache_entry is not None:
+                    await asyncio.to_thread(
+                        self._write_result_cache, cache_entry[0], task_output
+                    )
+                return task_output
+            except Exception as e:
+                self.end_time = datetime.datetime.now()
+                crewai_event_bus.emit(self, TaskFailedEvent(error=str(e), task=self))
+                raise e
+
+    def _cancellation_token_for(
+        self, agent: Optional[BaseAgent]
+    ) -> Optional[CancellationToken]:
+        """Return the token of the kickoff running the task, or the current one."""
+        crew = getattr(agent or self.agent, "crew", None)
+        token = getattr(crew, "_cancellation_token", None)
+        if isinstance(token, CancellationToken):
+            return token
+        return current_cancellation_token()
+
+    def _start_execution(
+        self,
+        agent: Optional[BaseAgent],
+        context: Optional[str],
+        tools: Optional[List[Any]],
+    ) -> Tuple[BaseAgent, List[Any]]:
+        """Resolve the agent and tools for a run and emit the started event."""
+        agent = agent or self.agent
+        self.agent = agent
+        if not agent:
+            raise Exception(
+                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
             )
 
-            pydantic_output, json_output = self._export_output(result)
-            task_output = TaskOutput(
-                name=self.name,
-                description=self.description,
-                expected_output=self.expected_output,
-                raw=result,
-                pydantic=pydantic_output,
-                json_dict=json_output,
-                agent=agent.role,
-                output_format=self._get_output_format(),
-            )
+        self.start_time = datetime.datetime.now()
 
-            if self._guardrail:
-                guardrail_result = process_guardrail(
-                    output=task_output,
-                    guardrail=self._guardrail,
-                    retry_count=self.retry_count,
-                )
-                if not guardrail_result.success:
-                    if self.retry_count >= self.max_retries:
-                        raise Exception(
-                            f"Task failed guardrail validation after {self.max_retries} retries. "
-                            f"Last error: {guardrail_result.error}"
-                        )
-
-                    self.retry_count += 1
-                    context = self.i18n.errors("validation_error").format(
-                        guardrail_result_error=guardrail_result.error,
-                        task_output=task_output.raw,
-                    )
-                    printer = Printer()
-                    printer.print(
-                        content=f"Guardrail blocked, retrying, due to: {guardrail_result.error}\n",
-                        color="yellow",
-                    )
-                    return self._execute_core(agent, context, tools)
+        self.prompt_context = context
+        tools = tools or self.tools or []
+
+        self.processed_by_agents.add(agent.role)
+        crewai_event_bus.emit(self, TaskStartedEvent(context=context, task=self))
+        return agent, tools
+
+    def _complete_execution(
+        self, agent: BaseAgent, result: str
+    ) -> Tuple[TaskOutput, Optional[str]]:
+        """Turn the agent's result into the task output.
+
+        Applies the guardrail, then finishes the execution with the output.
+
+        Returns:
+            The task output and, when the guardrail asks for a retry, the
+            context to retry with. The output must be discarded in that case.
+        """
+        pydantic_output, json_output = self._export_output(result)
+        task_output = TaskOutput(
+            name=self.name,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=result,
+            pydantic=pydantic_output,
+            json_dict=json_output,
+            agent=agent.role,
+            output_format=self._get_output_format(),
+        )
 
-                if guardrail_result.result is None:
+        if self._guardrail:
+            guardrail_result = process_guardrail(
+                output=task_output,
+                guardrail=self._guardrail,
+                retry_count=self.retry_count,
+            )
+            if not guardrail_result.success:
+                if self.retry_count >= self.max_retries:
                     raise Exception(
-                        "Task guardrail returned None as result. This is not allowed."
+                        f"Task failed guardrail validation after {self.max_retries} retries. "
+                        f"Last error: {guardrail_result.error}"
                     )
 
-                if isinstance(guardrail_result.result, str):
-                    task_output.raw = guardrail_result.result
-                    pydantic_output, json_output = self._export_output(
-                        guardrail_result.result
-                    )
-                    task_output.pydantic = pydantic_output
-                    task_output.json_dict = json_output
-                elif isinstance(guardrail_result.result, TaskOutput):
-                    task_output = guardrail_result.result
-
-            self.output = task_output
-            self.end_time = datetime.datetime.now()
-
-            if self.callback:
-                self.callback(self.output)
-
-            crew = self.agent.crew  # type: ignore[union-attr]
-            if crew and crew.task_callback and crew.task_callback != self.callback:
-                crew.task_callback(self.output)
-
-            if self.output_file:
-                content = (
-                    json_output
-                    if json_output
-                    else (
-                        pydantic_output.model_dump_json() if pydantic_output else result
-                    )
+                self.retry_count += 1
+                context = self.i18n.errors("validation_error").format(
+                    guardrail_result_error=guardrail_result.error,
+                    task_output=task_output.raw,
+                )
+                printer = Printer()
+                printer.print(
+                    content=f"Guardrail blocked, retrying, due to: {guardrail_result.error}\n",
+                    color="yellow",
+                )
+                return task_output, context
+
+            if guardrail_result.result is None:
+                raise Exception(
+                    "Task guardrail returned None as result. This is not allowed."
+                )
+
+            if isinstance(guardrail_result.result, str):
+                task_output.raw = guardrail_result.result
+                pydantic_output, json_output = self._export_output(
+                    guardrail_result.result
+                )
+                task_output.pydantic = pydantic_output
+                task_output.json_dict = json_output
+            elif isinstance(guardrail_result.result, TaskOutput):
+                task_output = guardrail_result.result
+
+        self._finish_execution(task_output, result)
+        return task_output, None
+
+    def _finish_execution(self, task_output: TaskOutput, result: str) -> None:
+        """Store the output, run callbacks, save the output file and emit the completed event."""
+        self.output = task_output
+        self.end_time = datetime.datetime.now()
+
+        if self.callback:
+            self.callback(self.output)
+
+        crew = self.agent.crew  # type: ignore[union-attr]
+        if crew and crew.task_callback and crew.task_callback != self.callback:
+            crew.task_callback(self.output)
+
+        if self.output_file:
+            content = (
+                task_output.json_dict
+                if task_output.json_dict
+                else (
+                    task_output.pydantic.model_dump_json()
+                    if task_output.pydantic
+                    else result
                 )
-                self._save_file(content)
-            crewai_event_bus.emit(
-                self, TaskCompletedEvent(output=task_output, task=self)
             )
-            return task_output
+            self._save_file(content)
+        crewai_event_bus.emit(
+            self, TaskCompletedEvent(output=task_output, task=self)
+        )
+
+    def _result_cache_for(self, agent: BaseAgent) -> Optional[TaskResultCacheHandler]:
+        """Return the cache of task outputs that applies to this run, if any.
+
+        Tasks with human_input are never cached, so that their review step
+        always runs.
+        """
+        if self.cache is False or self.human_input:
+            return None
+
+        crew_cache = getattr(agent.crew, "task_cache", None) if agent.crew else None
+        if isinstance(crew_cache, TaskResultCacheHandler):
+            return crew_cache
+        if self.cache:
+            if self._result_cache is None:
+                self._result_cache = TaskResultCacheHandler()
+            return self._result_cache
+        return None
+
+    def _read_result_cache(
+        self, agent: BaseAgent, context: Optional[str], tools: List[Any]
+    ) -> Optional[Tuple[str, Optional[TaskOutput]]]:
+        """Look up the output of an identical earlier run of this task.
+
+        Any failure while building the key or reading the cache is treated as
+        a miss, so that the task still runs.
+
+        Returns:
+            None if caching does not apply to this run, otherwise a tuple of
+            (cache_key, cached output or None).
+        """
+        result_cache = self._result_cache_for(agent)
+        if result_cache is None:
+            return None
+
+        try:
+            cache_key = result_cache.make_key(self, agent, context, tools)
+            cached_output = result_cache.read(cache_key, self)
+        except Exception as e:
+            self.logger.warning(f"Task result cache lookup failed: {str(e)}")
+            return None
+        if cached_output is not None:
+            cached_output.name = self.name
+        return cache_key, cached_output
+
+    def _write_result_cache(self, cache_key: str, task_output: TaskOutput) -> None:
+        """Store a task output in the result cache, never failing the task."""
+        result_cache = self._result_cache_for(self.agent)  # type: ignore[arg-type]
+        if result_cache is None:
+            return
+        try:
+            result_cache.add(cache_key, task_output)
         except Exception as e:
-            self.end_time = datetime.datetime.now()
-            crewai_event_bus.emit(self, TaskFailedEvent(error=str(e), task=self))
-            raise e  # Re-raise the exception after emitting the event
+            self.logger.warning(f"Task result cache write failed: {str(e)}")
 
     def _process_guardrail(self, task_output: TaskOutput) -> GuardrailResult:
         assert self._guardrail is not None
@@ -689,6 +855,34 @@ Follow these guidelines:
 
         return copied_task
 
+    def _fork(self, agents: Dict[int, "BaseAgent"]) -> "Task":
+        """Create a cheap copy of the Task for another run of its crew.
+
+        Unlike copy, nothing is dumped or validated again and the tools are
+        shared with this task. The execution state of the fork starts fresh.
+
+        Args:
+            agents: Forked agents, keyed by the id of the agent they fork.
+
+        Returns:
+            The forked task. Its context still refers to the original tasks.
+        """
+        return self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agent": agents.get(id(self.agent), self.agent),
+                "output": None,
+                "prompt_context": None,
+                "used_tools": 0,
+                "tools_errors": 0,
+                "delegations": 0,
+                "processed_by_agents": set(),
+                "retry_count": 0,
+                "start_time": None,
+                "end_time": None,
+            }
+        )
+
     def _export_output(
         self, result: str
     ) -> Tuple[Optional[BaseModel], Optional[Dict[str, Any]]]:
@@ -1,8 +1,10 @@
-from typing import Any, Callable
+from typing import Any, Callable, List, Optional, Union
 
 from pydantic import Field
 
+from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.task import Task
+from crewai.utilities.cancellation import CancellationToken, cancellation_scope
 from crewai.tasks.output_format import OutputFormat
 from crewai.tasks.task_output import TaskOutput
 
@@ -11,12 +13,21 @@ class ConditionalTask(Task):
     """
     A task that can be conditionally executed based on the output of another task.
     Note: This cannot be the only task you have in your crew and cannot be the first since its needs context from the previous task.
+
+    A speculative conditional task starts alongside the task before it, and
+    its result is kept only if the condition then holds. This only applies
+    when the task has an explicit context that does not include the task
+    before it, and runs on another agent.
     """
 
     condition: Callable[[TaskOutput], bool] = Field(
         default=None,
         description="Maximum number of retries for an agent to execute a task when an error occurs.",
     )
+    speculative: Union[bool, Callable[[List[TaskOutput]], bool]] = Field(
+        default=False,
+        description="Whether to start the task alongside the task before it, before its condition can be evaluated. Either a bool or a predictor receiving the task outputs available so far.",
+    )
 
     def __init__(
         self,
@@ -38,6 +49,27 @@ class ConditionalTask(Task):
         """
         return self.condition(context)
 
+    def should_speculate(self, task_outputs: List[TaskOutput]) -> bool:
+        """Whether the task is likely enough to run to be started early."""
+        if callable(self.speculative):
+            return bool(self.speculative(task_outputs))
+        return self.speculative
+
+    def speculate(
+        self,
+        agent: BaseAgent,
+        context: Optional[str],
+        tools: List[Any],
+        token: CancellationToken,
+    ) -> str:
+        """Run the agent on the task before its condition can be evaluated.
+
+        Only the agent's work is done here. The result becomes the task
+        output once the condition holds, and is dropped otherwise.
+        """
+        with cancellation_scope(token):
+            return agent.execute_task(task=self, context=context, tools=tools)
+
     def get_skipped_task_output(self):
         return TaskOutput(
             description=self.description,
@@ -0,0 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Union
+
+from pydantic import BaseModel, Field
+
+from crewai.tools.agent_tools.base_agent_tools import BaseAgentTool
+from crewai.utilities.cancellation import submit_in_context
+
+
+class DelegatedWork(BaseModel):
+    task: str = Field(..., description="The task to delegate")
+    context: str = Field(..., description="The context for the task")
+    coworker: str = Field(
+        ..., description="The role/name of the coworker to delegate to"
+    )
+
+
+class DelegateWorkBatchToolSchema(BaseModel):
+    delegations: List[DelegatedWork] = Field(
+        ..., description="The tasks to delegate, each with its coworker and context"
+    )
+
+
+class DelegateWorkBatchTool(BaseAgentTool):
+    """Tool for delegating several tasks to coworkers at once.
+
+    Tasks of different coworkers run in parallel, tasks given to the same
+    coworker run one after another since an agent executes one task at a
+    time. The results are returned together, in the order of the input.
+    """
+
+    name: str = "Delegate work to coworkers in parallel"
+    args_schema: type[BaseModel] = DelegateWorkBatchToolSchema
+
+    def _run(
+        self,
+        delegations: List[Union[DelegatedWork, Dict[str, Any]]],
+        **kwargs,
+    ) -> str:
+        work = [DelegatedWork.model_validate(item) for item in delegations]
+        if not work:
+            return ""
+
+        by_coworker: Dict[str, List[int]] = {}
+        for index, item in enumerate(work):
+            coworker = self._get_coworker(item.coworker) or ""
+            by_coworker.setdefault(self.sanitize_agent_name(coworker), []).append(
+                index
+            )
+
+        results: List[str] = [""] * len(work)
+
+        def run_for_coworker(indexes: List[int]) -> None:
+            for index in indexes:
+                item = work[index]
+                results[index] = self._execute(
+                    self._get_coworker(item.coworker), item.task, item.context
+                )
+
+        with ThreadPoolExecutor(
+            max_workers=len(by_coworker), thread_name_prefix="crewai-delegation"
+        ) as executor:
+            # Each worker runs in a copy of this context so delegated agents
+            # keep the cancellation token of the manager's task.
+            futures = [
+                submit_in_context(executor, run_for_coworker, indexes)
+                for indexes in by_coworker.values()
+            ]
+            for future in futures:
+                future.result()
+
+        return "\n\n".join(
+            f"Result of task {index + 1} ({item.coworker}): {item.task}\n{results[index]}"
+            for index, item in enumerate(work)
+        )
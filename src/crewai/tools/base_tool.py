@@ -1,6 +1,6 @@
 import asyncio
 from abc import ABC, abstractmethod
-from inspect import signature
+from inspect import iscoroutinefunction, signature
 from typing import Any, Callable, Type, get_args, get_origin, Optional, List
 
 from pydantic import (
@@ -12,7 +12,11 @@ from pydantic import (
 )
 from pydantic import BaseModel as PydanticBaseModel
 
-from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.structured_tool import CrewStructuredTool, run_coroutine_sync
+from crewai.utilities.tool_concurrency import (
+    async_tool_concurrency_slot,
+    tool_concurrency_slot,
+)
 
 class EnvVar(BaseModel):
     name: str
@@ -46,6 +50,8 @@ class BaseTool(BaseModel, ABC):
     """Maximum number of times this tool can be used. None means unlimited usage."""
     current_usage_count: int = 0
     """Current number of times this tool has been used."""
+    max_concurrency: int | None = None
+    """Maximum number of runs of this tool at the same time, across agents and crews. None means unlimited."""
 
     @field_validator("args_schema", mode="before")
     @classmethod
@@ -72,6 +78,13 @@ class BaseTool(BaseModel, ABC):
             raise ValueError("max_usage_count must be a positive integer")
         return v
 
+    @field_validator("max_concurrency", mode="before")
+    @classmethod
+    def validate_max_concurrency(cls, v: int | None) -> int | None:
+        if v is not None and v <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+        return v
+
     def model_post_init(self, __context: Any) -> None:
         self._generate_description()
 
@@ -83,11 +96,26 @@ class BaseTool(BaseModel, ABC):
         **kwargs: Any,
     ) -> Any:
         print(f"Using Tool: {self.name}")
-        result = self._run(*args, **kwargs)
+        with tool_concurrency_slot(self.name, self.max_concurrency):
+            result = self._run(*args, **kwargs)
 
-        # If _run is async, we safely run it
-        if asyncio.iscoroutine(result):
-            result = asyncio.run(result)
+            # If _run is async, we safely run it
+            if asyncio.iscoroutine(result):
+                result = run_coroutine_sync(result)
+
+        self.current_usage_count += 1
+
+        return result
+
+    async def arun(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Run the tool without blocking the event loop."""
+        print(f"Using Tool: {self.name}")
+        async with async_tool_concurrency_slot(self.name, self.max_concurrency):
+            result = await self._arun(*args, **kwargs)
 
         self.current_usage_count += 1
 
@@ -105,6 +133,21 @@ class BaseTool(BaseModel, ABC):
     ) -> Any:
         """Here goes the actual implementation of the tool."""
 
+    async def _arun(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Async implementation of the tool.
+
+        Defaults to running _run in a worker thread. Override it in I/O-bound
+        tools to await the I/O on the event loop instead of holding a thread.
+        """
+        result = await asyncio.to_thread(self._run, *args, **kwargs)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
     def to_structured_tool(self) -> CrewStructuredTool:
         """Convert this tool to a CrewStructuredTool instance."""
         self._set_args_schema()
@@ -116,6 +159,8 @@ class BaseTool(BaseModel, ABC):
             result_as_answer=self.result_as_answer,
             max_usage_count=self.max_usage_count,
             current_usage_count=self.current_usage_count,
+            max_concurrency=self.max_concurrency,
+            afunc=self._arun,
         )
 
     @classmethod
@@ -217,6 +262,11 @@ class Tool(BaseTool):
     def _run(self, *args: Any, **kwargs: Any) -> Any:
         return self.func(*args, **kwargs)
 
+    async def _arun(self, *args: Any, **kwargs: Any) -> Any:
+        if iscoroutinefunction(self.func):
+            return await self.func(*args, **kwargs)
+        return await super()._arun(*args, **kwargs)
+
     @classmethod
     def from_langchain(cls, tool: Any) -> "Tool":
         """Create a Tool instance from a CrewStructuredTool.
@@ -276,14 +326,23 @@ def to_langchain(
     return [t.to_structured_tool() if isinstance(t, BaseTool) else t for t in tools]
 
 
-def tool(*args, result_as_answer: bool = False, max_usage_count: int | None = None) -> Callable:
+def tool(
+    *args,
+    result_as_answer: bool = False,
+    max_usage_count: int | None = None,
+    max_concurrency: int | None = None,
+) -> Callable:
     """
     Decorator to create a tool from a function.
 
+    The function may be an ``async def``: agents running asynchronously then
+    await it on their event loop, while sync callers run it to completion.
+
     Args:
         *args: Positional arguments, either the function to decorate or the tool name.
         result_as_answer: Flag to indicate if the tool result should be used as the final agent answer.
         max_usage_count: Maximum number of times this tool can be used. None means unlimited usage.
+        max_concurrency: Maximum number of runs of this tool at the same time. None means unlimited.
     """
 
     def _make_with_name(tool_name: str) -> Callable:
@@ -312,6 +371,7 @@ def tool(*args, result_as_answer: bool = False, max_usage_count: int | None = No
                 result_as_answer=result_as_answer,
                 max_usage_count=max_usage_count,
                 current_usage_count=0,
+                max_concurrency=max_concurrency,
             )
 
         return _make_tool
@@ -1,14 +1,34 @@
 from __future__ import annotations
 
 import asyncio
-
 import inspect
 import textwrap
-from typing import Any, Callable, Optional, Union, get_type_hints
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Coroutine, Optional, Union, get_type_hints
 
 from pydantic import BaseModel, Field, create_model
 
+from crewai.utilities.cancellation import submit_in_context
 from crewai.utilities.logger import Logger
+from crewai.utilities.tool_concurrency import (
+    async_tool_concurrency_slot,
+    tool_concurrency_slot,
+)
+
+
+def run_coroutine_sync(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion from synchronous code.
+
+    Inside a running event loop, asyncio.run is not allowed, so the coroutine
+    then runs on a fresh loop in a worker thread while the caller waits.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return submit_in_context(executor, asyncio.run, coroutine).result()
 
 
 class CrewStructuredTool:
@@ -27,6 +47,8 @@ class CrewStructuredTool:
         result_as_answer: bool = False,
         max_usage_count: int | None = None,
         current_usage_count: int = 0,
+        max_concurrency: int | None = None,
+        afunc: Optional[Callable[..., Awaitable[Any]]] = None,
     ) -> None:
         """Initialize the structured tool.
 
@@ -38,6 +60,8 @@ class CrewStructuredTool:
             result_as_answer: Whether to return the output directly
             max_usage_count: Maximum number of times this tool can be used. None means unlimited usage.
             current_usage_count: Current number of times this tool has been used.
+            max_concurrency: Maximum number of runs of this tool at the same time. None means unlimited.
+            afunc: Optional async implementation used by ainvoke instead of func
         """
         self.name = name
         self.description = description
@@ -47,6 +71,8 @@ class CrewStructuredTool:
         self.result_as_answer = result_as_answer
         self.max_usage_count = max_usage_count
         self.current_usage_count = current_usage_count
+        self.max_concurrency = max_concurrency
+        self.afunc = afunc
 
         # Validate the function signature matches the schema
         self._validate_function_signature()
@@ -209,6 +235,9 @@ class CrewStructuredTool:
     ) -> Any:
         """Asynchronously invoke the tool.
 
+        Async implementations are awaited on the running loop. Sync functions
+        are offloaded to a worker thread so they do not block it.
+
         Args:
             input: The input arguments
             config: Optional configuration
@@ -219,15 +248,16 @@ class CrewStructuredTool:
         """
         parsed_args = self._parse_args(input)
 
-        if inspect.iscoroutinefunction(self.func):
-            return await self.func(**parsed_args, **kwargs)
-        else:
-            # Run sync functions in a thread pool
-            import asyncio
+        async with async_tool_concurrency_slot(self.name, self.max_concurrency):
+            if self.afunc is not None:
+                return await self.afunc(**parsed_args, **kwargs)
+            if inspect.iscoroutinefunction(self.func):
+                return await self.func(**parsed_args, **kwargs)
 
-            return await asyncio.get_event_loop().run_in_executor(
-                None, lambda: self.func(**parsed_args, **kwargs)
-            )
+            result = await asyncio.to_thread(self.func, **parsed_args, **kwargs)
+            if asyncio.iscoroutine(result):
+                return await result
+            return result
 
     def _run(self, *args, **kwargs) -> Any:
         """Legacy method for compatibility."""
@@ -242,16 +272,13 @@ class CrewStructuredTool:
         """Main method for tool execution."""
         parsed_args = self._parse_args(input)
 
-        if inspect.iscoroutinefunction(self.func):
-            result = asyncio.run(self.func(**parsed_args, **kwargs))
-            return result
-
-        result = self.func(**parsed_args, **kwargs)
+        with tool_concurrency_slot(self.name, self.max_concurrency):
+            result = self.func(**parsed_args, **kwargs)
 
-        if asyncio.iscoroutine(result):
-            return asyncio.run(result)
+            if asyncio.iscoroutine(result):
+                return run_coroutine_sync(result)
 
-        return result
+            return result
 
     @property
     def args(self) -> dict:
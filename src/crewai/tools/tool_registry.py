@@ -0,0 +1,94 @@
+"""Lookup structures over the tools of an agent, built once per executor."""
+
+from difflib import SequenceMatcher
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from crewai.utilities.agent_utils import (
+    get_tool_names,
+    render_text_description_and_args,
+)
+
+# Minimum similarity for a misspelled tool name to still select a tool.
+FUZZY_MATCH_THRESHOLD = 0.85
+
+
+def normalize_tool_name(name: str) -> str:
+    return name.casefold().strip()
+
+
+class ToolRegistry:
+    """Precomputed views of a list of tools, shared by the actions of an executor.
+
+    Rendering the tool descriptions, building the JSON schemas of the tool
+    arguments and matching a requested tool name against every tool are
+    done once, instead of for every action of the agent. Exact names,
+    compared case-insensitively and with underscores read as spaces, are
+    found with a dict lookup. Other names are compared with SequenceMatcher
+    against the tool names, whose matching tables are built up front.
+
+    Args:
+        tools: Tools available to the agent, usually CrewStructuredTools.
+    """
+
+    def __init__(self, tools: Sequence[Any]) -> None:
+        self.tools: List[Any] = list(tools)
+        self.tools_description = render_text_description_and_args(self.tools)
+        self.tools_names = get_tool_names(self.tools)
+        self._tool_ids: Tuple[int, ...] = tuple(id(tool) for tool in self.tools)
+        self._by_exact_name: Dict[str, Any] = {tool.name: tool for tool in self.tools}
+        self._by_name: Dict[str, Any] = {}
+        for tool in self.tools:
+            self._by_name.setdefault(normalize_tool_name(tool.name), tool)
+        self._matchers: List[Tuple[SequenceMatcher, Any]] = []
+        for tool in self.tools:
+            matcher = SequenceMatcher(None)
+            # SequenceMatcher caches what it learns about seq2 between queries
+            matcher.set_seq2(tool.name.lower().strip())
+            self._matchers.append((matcher, tool))
+        self._accepted_args: Dict[int, Optional[FrozenSet[str]]] = {}
+
+    def matches(self, tools: Sequence[Any]) -> bool:
+        """Whether the registry was built for exactly these tools."""
+        return tuple(id(tool) for tool in tools) == self._tool_ids
+
+    def get(self, name: str, exact: bool = False) -> Optional[Any]:
+        """Return the tool with this name, ignoring case and underscores unless exact."""
+        if exact:
+            return self._by_exact_name.get(name)
+        normalized = normalize_tool_name(name)
+        tool = self._by_name.get(normalized)
+        if tool is None:
+            tool = self._by_name.get(normalized.replace("_", " "))
+        return tool
+
+    def select(self, name: str) -> Optional[Any]:
+        """Return the tool with this name or, failing that, the closest name.
+
+        Returns None when no tool name is at least FUZZY_MATCH_THRESHOLD
+        similar to the requested one.
+        """
+        tool = self._by_name.get(normalize_tool_name(name))
+        if tool is not None:
+            return tool
+
+        query = name.lower().strip()
+        best_tool, best_ratio = None, 0.0
+        for matcher, candidate in self._matchers:
+            matcher.set_seq1(query)
+            ratio = matcher.ratio()
+            if ratio > best_ratio:
+                best_tool, best_ratio = candidate, ratio
+        return best_tool if best_ratio > FUZZY_MATCH_THRESHOLD else None
+
+    def accepted_args(self, tool: Any) -> Optional[FrozenSet[str]]:
+        """Return the argument names of a tool's schema, or None without one."""
+        key = id(tool)
+        if key not in self._accepted_args:
+            try:
+                accepted: Optional[FrozenSet[str]] = frozenset(
+                    tool.args_schema.model_json_schema()["properties"].keys()
+                )
+            except Exception:
+                accepted = None
+            self._accepted_args[key] = accepted
+        return self._accepted_args[key]
@@ -2,10 +2,9 @@ import ast
 import datetime
 import json
 import time
-from difflib import SequenceMatcher
 from json import JSONDecodeError
 from textwrap import dedent
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import json5
 from json_repair import repair_json
@@ -15,10 +14,11 @@ from crewai.task import Task
 from crewai.telemetry import Telemetry
 from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.tools.tool_calling import InstructorToolCalling, ToolCalling
+from crewai.tools.tool_registry import ToolRegistry
 from crewai.utilities import I18N, Converter, Printer
-from crewai.utilities.agent_utils import (
-    get_tool_names,
-    render_text_description_and_args,
+from crewai.utilities.cancellation import (
+    ExecutionCancelledException,
+    raise_if_cancelled,
 )
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.tool_usage_events import (
@@ -52,6 +52,15 @@ class ToolUsageErrorException(Exception):
         super().__init__(self.message)
 
 
+class _PendingToolUse(NamedTuple):
+    """State of a tool run between its checks and its result."""
+
+    started_at: float
+    from_cache: bool
+    result: Any
+    available_tool: Any
+
+
 class ToolUsage:
     """
     Class that represents the usage of a tool by an agent.
@@ -64,6 +73,7 @@ class ToolUsage:
       tools_description: Description of the tools available for the agent.
       tools_names: Names of the tools available for the agent.
       function_calling_llm: Language model to be used for the tool usage.
+      registry: Precomputed lookups over the tools, shared across the actions of an executor.
     """
 
     def __init__(
@@ -75,6 +85,7 @@ class ToolUsage:
         agent: Optional[Union["BaseAgent", "LiteAgent"]] = None,
         action: Any = None,
         fingerprint_context: Optional[Dict[str, str]] = None,
+        registry: Optional[ToolRegistry] = None,
     ) -> None:
         self._i18n: I18N = agent.i18n if agent else I18N()
         self._printer: Printer = Printer()
@@ -83,8 +94,13 @@ class ToolUsage:
         self._max_parsing_attempts: int = 3
         self._remember_format_after_usages: int = 3
         self.agent = agent
-        self.tools_description = render_text_description_and_args(tools)
-        self.tools_names = get_tool_names(tools)
+        self.registry = (
+            registry
+            if registry is not None and registry.matches(tools)
+            else ToolRegistry(tools)
+        )
+        self.tools_description = self.registry.tools_description
+        self.tools_names = self.registry.tools_names
         self.tools_handler = tools_handler
         self.tools = tools
         self.task = task
@@ -107,6 +123,43 @@ class ToolUsage:
     def use(
         self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
     ) -> str:
+        tool = self._prepare_use(calling)
+        if isinstance(tool, str):
+            return tool
+
+        if self._is_add_image_tool(tool):
+            try:
+                result = self._use(tool_string=tool_string, tool=tool, calling=calling)
+                return result
+
+            except Exception as e:
+                return self._report_use_error(e)
+
+        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
+
+    async def ause(
+        self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
+    ) -> str:
+        """Async version of use that awaits the tool instead of blocking on it."""
+        tool = self._prepare_use(calling)
+        if isinstance(tool, str):
+            return tool
+
+        if self._is_add_image_tool(tool):
+            try:
+                return await self._ause(
+                    tool_string=tool_string, tool=tool, calling=calling
+                )
+            except Exception as e:
+                return self._report_use_error(e)
+
+        return f"{await self._ause(tool_string=tool_string, tool=tool, calling=calling)}"
+
+    def _prepare_use(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Union[str, Any]:
+        """Return the tool to run for a calling, or the error to report instead."""
+        raise_if_cancelled()
         if isinstance(calling, ToolUsageErrorException):
             error = calling.message
             if self.agent and self.agent.verbose:
@@ -116,39 +169,98 @@ class ToolUsage:
             return error
 
         try:
-            tool = self._select_tool(calling.tool_name)
+            return self._select_tool(calling.tool_name)
         except Exception as e:
-            error = getattr(e, "message", str(e))
-            if self.task:
-                self.task.increment_tools_errors()
-            if self.agent and self.agent.verbose:
-                self._printer.print(content=f"\n\n{error}\n", color="red")
-            return error
+            return self._report_use_error(e)
 
-        if (
+    def _is_add_image_tool(self, tool: Any) -> bool:
+        return (
             isinstance(tool, CrewStructuredTool)
             and tool.name == self._i18n.tools("add_image")["name"]  # type: ignore
-        ):
-            try:
-                result = self._use(tool_string=tool_string, tool=tool, calling=calling)
-                return result
+        )
+
+    def _report_use_error(self, e: Exception) -> str:
+        error = getattr(e, "message", str(e))
+        if self.task:
+            self.task.increment_tools_errors()
+        if self.agent and self.agent.verbose:
+            self._printer.print(content=f"\n\n{error}\n", color="red")
+        return error
 
+    def _use(
+        self,
+        tool_string: str,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> str:
+        pending = self._start_use(tool, calling)
+        if isinstance(pending, str):
+            return pending
+
+        if pending.result is None:
+            try:
+                self._count_delegations(calling)
+                arguments, fallback = self._tool_arguments(tool, calling)
+                try:
+                    result = tool.invoke(input=arguments)
+                except Exception:
+                    if fallback is None:
+                        raise
+                    result = tool.invoke(input=fallback)
+            except ExecutionCancelledException:
+                # Raised by tools that run agents, such as delegation tools
+                raise
             except Exception as e:
-                error = getattr(e, "message", str(e))
-                if self.task:
-                    self.task.increment_tools_errors()
-                if self.agent and self.agent.verbose:
-                    self._printer.print(content=f"\n\n{error}\n", color="red")
-                return error
+                error = self._handle_use_error(tool, calling, e)
+                if error is not None:
+                    return error  # type: ignore # No return value expected
+                return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
 
-        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
+            pending = pending._replace(result=result)
+            self._cache_result(calling, pending)
+        return self._finish_use(tool, calling, pending)
 
-    def _use(
+    async def _ause(
         self,
         tool_string: str,
         tool: CrewStructuredTool,
         calling: Union[ToolCalling, InstructorToolCalling],
     ) -> str:
+        pending = self._start_use(tool, calling)
+        if isinstance(pending, str):
+            return pending
+
+        if pending.result is None:
+            try:
+                self._count_delegations(calling)
+                arguments, fallback = self._tool_arguments(tool, calling)
+                try:
+                    result = await tool.ainvoke(input=arguments)
+                except Exception:
+                    if fallback is None:
+                        raise
+                    result = await tool.ainvoke(input=fallback)
+            except ExecutionCancelledException:
+                raise
+            except Exception as e:
+                error = self._handle_use_error(tool, calling, e)
+                if error is not None:
+                    return error
+                return await self.ause(calling=calling, tool_string=tool_string)
+
+            pending = pending._replace(result=result)
+            self._cache_result(calling, pending)
+        return self._finish_use(tool, calling, pending)
+
+    def _start_use(
+        self, tool: Any, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Union[str, "_PendingToolUse"]:
+        """Run the checks and bookkeeping that precede a tool run.
+
+        Returns the message to give the agent instead of running the tool, or
+        the state of the run, whose result is already set on a cache hit or
+        when the usage limit was reached.
+        """
         if self._check_tool_repeated_usage(calling=calling):  # type: ignore # _check_tool_repeated_usage of "ToolUsage" does not return a value (it only ever returns None)
             try:
                 result = self._i18n.errors("task_repeated_usage").format(
@@ -180,7 +292,7 @@ class ToolUsage:
                 event_data.update(self.agent.fingerprint)
 
             crewai_event_bus.emit(self,ToolUsageStartedEvent(**event_data))
-            
+
         started_at = time.time()
         from_cache = False
         result = None  # type: ignore
@@ -211,82 +323,126 @@ class ToolUsage:
                 if self.task:
                     self.task.increment_tools_errors()
 
-        if result is None:
-            try:
-                if calling.tool_name in [
-                    "Delegate work to coworker",
-                    "Ask question to coworker",
-                ]:
+        return _PendingToolUse(
+            started_at=started_at,
+            from_cache=from_cache,
+            result=result,
+            available_tool=available_tool,
+        )
+
+    def _count_delegations(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> None:
+        if calling.tool_name in [
+            "Delegate work to coworker",
+            "Ask question to coworker",
+        ]:
+            coworker = (
+                calling.arguments.get("coworker") if calling.arguments else None
+            )
+            if self.task:
+                self.task.increment_delegations(coworker)
+        elif calling.tool_name == "Delegate work to coworkers in parallel":
+            delegations = (
+                calling.arguments.get("delegations") if calling.arguments else None
+            )
+            if self.task and isinstance(delegations, list):
+                for delegation in delegations:
                     coworker = (
-                        calling.arguments.get("coworker") if calling.arguments else None
-                    )
-                    if self.task:
-                        self.task.increment_delegations(coworker)
-
-                if calling.arguments:
-                    try:
-                        acceptable_args = tool.args_schema.model_json_schema()[
-                            "properties"
-                        ].keys()  # type: ignore
-                        arguments = {
-                            k: v
-                            for k, v in calling.arguments.items()
-                            if k in acceptable_args
-                        }
-                        # Add fingerprint metadata if available
-                        arguments = self._add_fingerprint_metadata(arguments)
-                        result = tool.invoke(input=arguments)
-                    except Exception:
-                        arguments = calling.arguments
-                        # Add fingerprint metadata if available
-                        arguments = self._add_fingerprint_metadata(arguments)
-                        result = tool.invoke(input=arguments)
-                else:
-                    # Add fingerprint metadata even to empty arguments
-                    arguments = self._add_fingerprint_metadata({})
-                    result = tool.invoke(input=arguments)
-            except Exception as e:
-                self.on_tool_error(tool=tool, tool_calling=calling, e=e)
-                self._run_attempts += 1
-                if self._run_attempts > self._max_parsing_attempts:
-                    self._telemetry.tool_usage_error(llm=self.function_calling_llm)
-                    error_message = self._i18n.errors("tool_usage_exception").format(
-                        error=e, tool=tool.name, tool_inputs=tool.description
+                        delegation.get("coworker")
+                        if isinstance(delegation, dict)
+                        else None
                     )
-                    error = ToolUsageErrorException(
-                        f"\n{error_message}.\nMoving on then. {self._i18n.slice('format').format(tool_names=self.tools_names)}"
-                    ).message
-                    if self.task:
-                        self.task.increment_tools_errors()
-                    if self.agent and self.agent.verbose:
-                        self._printer.print(
-                            content=f"\n\n{error_message}\n", color="red"
-                        )
-                    return error  # type: ignore # No return value expected
+                    self.task.increment_delegations(coworker)
 
-                if self.task:
-                    self.task.increment_tools_errors()
-                return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
+    def _tool_arguments(
+        self, tool: Any, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Return the arguments to run the tool with, and those to retry with.
 
-            if self.tools_handler:
-                should_cache = True
-                if (
-                    hasattr(available_tool, "cache_function")
-                    and available_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
-                ):
-                    should_cache = available_tool.cache_function(  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
-                        calling.arguments, result
-                    )
+        Arguments the tool's schema does not accept are dropped. If the tool
+        then fails, it is retried once with every argument of the calling.
+        """
+        if not calling.arguments:
+            # Add fingerprint metadata even to empty arguments
+            return self._add_fingerprint_metadata({}), None
+
+        # Add fingerprint metadata if available
+        all_arguments = self._add_fingerprint_metadata(calling.arguments)
+        acceptable_args = self.registry.accepted_args(tool)
+        if acceptable_args is None:
+            return all_arguments, None
+        arguments = {
+            k: v for k, v in calling.arguments.items() if k in acceptable_args
+        }
+        return self._add_fingerprint_metadata(arguments), all_arguments
 
-                self.tools_handler.on_tool_use(
-                    calling=calling, output=result, should_cache=should_cache
+    def _handle_use_error(
+        self,
+        tool: Any,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        e: Exception,
+    ) -> Optional[str]:
+        """Record a failed tool run.
+
+        Returns the error to give the agent once the attempts are exhausted,
+        or None when the tool should be tried again.
+        """
+        self.on_tool_error(tool=tool, tool_calling=calling, e=e)
+        self._run_attempts += 1
+        if self._run_attempts > self._max_parsing_attempts:
+            self._telemetry.tool_usage_error(llm=self.function_calling_llm)
+            error_message = self._i18n.errors("tool_usage_exception").format(
+                error=e, tool=tool.name, tool_inputs=tool.description
+            )
+            error = ToolUsageErrorException(
+                f"\n{error_message}.\nMoving on then. {self._i18n.slice('format').format(tool_names=self.tools_names)}"
+            ).message
+            if self.task:
+                self.task.increment_tools_errors()
+            if self.agent and self.agent.verbose:
+                self._printer.print(
+                    content=f"\n\n{error_message}\n", color="red"
                 )
+            return error
+
+        if self.task:
+            self.task.increment_tools_errors()
+        return None
+
+    def _cache_result(
+        self,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        pending: "_PendingToolUse",
+    ) -> None:
+        if self.tools_handler:
+            available_tool = pending.available_tool
+            should_cache = True
+            if (
+                hasattr(available_tool, "cache_function")
+                and available_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
+            ):
+                should_cache = available_tool.cache_function(  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
+                    calling.arguments, pending.result
+                )
+
+            self.tools_handler.on_tool_use(
+                calling=calling, output=pending.result, should_cache=should_cache
+            )
+
+    def _finish_use(
+        self,
+        tool: Any,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        pending: "_PendingToolUse",
+    ) -> str:
+        available_tool = pending.available_tool
         self._telemetry.tool_usage(
             llm=self.function_calling_llm,
             tool_name=tool.name,
             attempts=self._run_attempts,
         )
-        result = self._format_result(result=result)  # type: ignore # "_format_result" of "ToolUsage" does not return a value (it only ever returns None)
+        result = self._format_result(result=pending.result)  # type: ignore # "_format_result" of "ToolUsage" does not return a value (it only ever returns None)
         data = {
             "result": result,
             "tool_name": tool.name,
@@ -296,8 +452,8 @@ class ToolUsage:
         self.on_tool_use_finished(
             tool=tool,
             tool_calling=calling,
-            from_cache=from_cache,
-            started_at=started_at,
+            from_cache=pending.from_cache,
+            started_at=pending.started_at,
             result=result,
         )
 
@@ -370,22 +526,9 @@ class ToolUsage:
         return None
 
     def _select_tool(self, tool_name: str) -> Any:
-        order_tools = sorted(
-            self.tools,
-            key=lambda tool: SequenceMatcher(
-                None, tool.name.lower().strip(), tool_name.lower().strip()
-            ).ratio(),
-            reverse=True,
-        )
-        for tool in order_tools:
-            if (
-                tool.name.lower().strip() == tool_name.lower().strip()
-                or SequenceMatcher(
-                    None, tool.name.lower().strip(), tool_name.lower().strip()
-                ).ratio()
-                > 0.85
-            ):
-                return tool
+        tool = self.registry.select(tool_name)
+        if tool is not None:
+            return tool
         if self.task:
             self.task.increment_tools_errors()
         tool_selection_data: Dict[str, Any] = {
@@ -9,6 +9,7 @@ class UsageMetrics(BaseModel):
         total_tokens: Total number of tokens used.
         prompt_tokens: Number of tokens used in prompts.
         cached_prompt_tokens: Number of cached prompt tokens used.
+        cache_creation_prompt_tokens: Number of prompt tokens written to the provider's prompt cache.
         completion_tokens: Number of tokens used in completions.
         successful_requests: Number of successful requests made.
     """
@@ -20,6 +21,10 @@ class UsageMetrics(BaseModel):
     cached_prompt_tokens: int = Field(
         default=0, description="Number of cached prompt tokens used."
     )
+    cache_creation_prompt_tokens: int = Field(
+        default=0,
+        description="Number of prompt tokens written to the provider's prompt cache.",
+    )
     completion_tokens: int = Field(
         default=0, description="Number of tokens used in completions."
     )
@@ -37,5 +42,6 @@ class UsageMetrics(BaseModel):
         self.total_tokens += usage_metrics.total_tokens
         self.prompt_tokens += usage_metrics.prompt_tokens
         self.cached_prompt_tokens += usage_metrics.cached_prompt_tokens
+        self.cache_creation_prompt_tokens += usage_metrics.cache_creation_prompt_tokens
         self.completion_tokens += usage_metrics.completion_tokens
         self.successful_requests += usage_metrics.successful_requests
@@ -172,6 +172,38 @@ def get_llm_response(
     return answer
 
 
+async def aget_llm_response(
+    llm: Union[LLM, BaseLLM],
+    messages: List[Dict[str, str]],
+    callbacks: List[Any],
+    printer: Printer,
+    from_task: Optional[Any] = None,
+    from_agent: Optional[Any] = None,
+) -> str:
+    """Async version of get_llm_response, awaiting the LLM's acall."""
+    try:
+        answer = await llm.acall(
+            messages,
+            callbacks=callbacks,
+            from_task=from_task,
+            from_agent=from_agent,
+        )
+    except Exception as e:
+        printer.print(
+            content=f"Error during LLM call: {e}",
+            color="red",
+        )
+        raise e
+    if not answer:
+        printer.print(
+            content="Received None or empty response from LLM call.",
+            color="red",
+        )
+        raise ValueError("Invalid response from LLM call - None or empty.")
+
+    return answer
+
+
 def process_llm_response(
     answer: str, use_stop_words: bool
 ) -> Union[AgentAction, AgentFinish]:
@@ -349,15 +381,14 @@ def summarize_messages(
     for i in range(0, len(messages_string), cut_size):
         messages_groups.append({"content": messages_string[i : i + cut_size]})
 
-    summarized_contents = []
-
     total_groups = len(messages_groups)
-    for idx, group in enumerate(messages_groups, 1):
-        Printer().print(
-            content=f"Summarizing {idx}/{total_groups}...",
-            color="yellow",
-        )
-        summary = llm.call(
+    Printer().print(
+        content=f"Summarizing {total_groups} message group(s)...",
+        color="yellow",
+    )
+    # Groups are independent, so summarize them concurrently
+    batch = llm.batch_call(
+        [
             [
                 format_message_for_llm(
                     i18n.slice("summarizer_system_message"), role="system"
@@ -365,12 +396,14 @@ def summarize_messages(
                 format_message_for_llm(
                     i18n.slice("summarize_instruction").format(group=group["content"]),
                 ),
-            ],
-            callbacks=callbacks,
-        )
-        summarized_contents.append({"content": str(summary)})
+            ]
+            for group in messages_groups
+        ],
+        callbacks=callbacks,
+    )
+    batch.raise_first_error()
 
-    merged_summary = " ".join(content["content"] for content in summarized_contents)
+    merged_summary = " ".join(str(summary) for summary in batch.responses)
 
     messages.clear()
     messages.append(
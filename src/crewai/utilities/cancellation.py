@@ -0,0 +1,134 @@
+"""Cooperative cancellation of crew, task and agent executions."""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ExecutionCancelledException(Exception):
+    """Raised by work that was stopped through its CancellationToken."""
+
+
+class ExecutionDeadlineExceededException(ExecutionCancelledException, TimeoutError):
+    """Raised by work that ran past the deadline of its CancellationToken."""
+
+
+class CancellationToken:
+    """Tells running work that it should stop.
+
+    Threads cannot be interrupted, so the executor stack checks the token of
+    the current execution between steps: before each task, at every
+    iteration of the agent loop, around each LLM request and tool call, and
+    between streamed chunks. LLM requests are given no more than the time
+    left before the deadline as their HTTP timeout.
+
+    A child token is cancelled along with its parent and never outlives the
+    parent's deadline.
+
+    Args:
+        timeout: Seconds from now after which the token counts as cancelled.
+        parent: Token whose cancellation also cancels this one.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        parent: Optional["CancellationToken"] = None,
+    ) -> None:
+        self.parent = parent
+        self.deadline: Optional[float] = (
+            time.monotonic() + timeout if timeout is not None else None
+        )
+        self._event = threading.Event()
+        self._reason = "Execution was cancelled"
+
+    def cancel(self, reason: Optional[str] = None) -> None:
+        """Cancel the token and every child token."""
+        if reason:
+            self._reason = reason
+        self._event.set()
+
+    def child(self, timeout: Optional[float] = None) -> "CancellationToken":
+        """Return a token cancelled with this one, optionally with a shorter deadline."""
+        return CancellationToken(timeout=timeout, parent=self)
+
+    @property
+    def cancelled(self) -> bool:
+        try:
+            self.raise_if_cancelled()
+        except ExecutionCancelledException:
+            return True
+        return False
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the nearest deadline, or None without one."""
+        remaining = (
+            max(self.deadline - time.monotonic(), 0.0)
+            if self.deadline is not None
+            else None
+        )
+        parent_remaining = self.parent.remaining() if self.parent else None
+        if remaining is None or parent_remaining is None:
+            return remaining if parent_remaining is None else parent_remaining
+        return min(remaining, parent_remaining)
+
+    def raise_if_cancelled(self) -> None:
+        """Raise if this token or one of its parents was cancelled or ran out of time.
+
+        Raises:
+            ExecutionCancelledException: If the token was cancelled.
+            ExecutionDeadlineExceededException: If the deadline has passed.
+        """
+        if self._event.is_set():
+            raise ExecutionCancelledException(self._reason)
+        if self.parent is not None:
+            self.parent.raise_if_cancelled()
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise ExecutionDeadlineExceededException(
+                "Execution deadline exceeded before the work could complete"
+            )
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar(
+    "crewai_cancellation_token", default=None
+)
+
+
+def current_cancellation_token() -> Optional[CancellationToken]:
+    """Return the token of the execution running in this context, if any."""
+    return _current_token.get()
+
+
+@contextmanager
+def cancellation_scope(token: Optional[CancellationToken]) -> Iterator[None]:
+    """Make token the current token for the duration of the block."""
+    reset = _current_token.set(token)
+    try:
+        yield
+    finally:
+        _current_token.reset(reset)
+
+
+def raise_if_cancelled() -> None:
+    """Raise if the current execution was cancelled or ran out of time."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def submit_in_context(
+    executor: Executor, fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> "Future[T]":
+    """Submit fn to executor, running it in a copy of the caller's context.
+
+    The worker thread then sees the caller's cancellation token, which a
+    plain submit would lose.
+    """
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fn, *args, **kwargs)
@@ -67,9 +67,10 @@ class CrewAIEventsBus:
             source: The object emitting the event
             event: The event instance to emit
         """
-        for event_type, handlers in self._handlers.items():
+        # Handlers may be registered or removed by other threads meanwhile
+        for event_type, handlers in list(self._handlers.items()):
             if isinstance(event, event_type):
-                for handler in handlers:
+                for handler in list(handlers):
                     try:
                         handler(source, event)
                     except Exception as e:
@@ -89,6 +90,14 @@ class CrewAIEventsBus:
             cast(Callable[[Any, EventTypes], None], handler)
         )
 
+    def unregister_handler(
+        self, event_type: Type[EventTypes], handler: Callable[[Any, EventTypes], None]
+    ) -> None:
+        """Remove a handler registered for a specific event type"""
+        handlers = self._handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
     @contextmanager
     def scoped_handlers(self):
         """
@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel
 
+from crewai.types.usage_metrics import UsageMetrics
 from crewai.utilities.events.base_events import BaseEvent
 
 class LLMEventBase(BaseEvent):
@@ -52,14 +53,21 @@ class LLMCallStartedEvent(LLMEventBase):
     tools: Optional[List[dict]] = None
     callbacks: Optional[List[Any]] = None
     available_functions: Optional[Dict[str, Any]] = None
+    cached: bool = False
 
 
 class LLMCallCompletedEvent(LLMEventBase):
-    """Event emitted when a LLM call completes"""
+    """Event emitted when a LLM call completes
+
+    Attributes:
+        usage: Token usage of this call alone, when the provider reported it.
+    """
 
     type: str = "llm_call_completed"
     response: Any
     call_type: LLMCallType
+    cached: bool = False
+    usage: Optional[UsageMetrics] = None
 
 
 class LLMCallFailedEvent(LLMEventBase):
@@ -0,0 +1,113 @@
+"""Handles persistent caching of LLM responses."""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+from crewai.memory.storage.llm_response_cache_storage import (
+    LLMResponseCacheSQLiteStorage,
+)
+
+# Parameters that affect how a request is transported, not what the model
+# answers. They are left out of the cache key so that, for example, rotating
+# an API key or toggling streaming does not invalidate cached responses.
+NON_SEMANTIC_PARAMS = frozenset(
+    {
+        "api_key",
+        "api_base",
+        "base_url",
+        "api_version",
+        "timeout",
+        "stream",
+        "stream_options",
+    }
+)
+
+DEFAULT_NAMESPACE = "default"
+
+
+class LLMResponseCacheHandler:
+    """Opt-in cache for LLM responses, persisted in SQLite.
+
+    Args:
+        ttl: Maximum age of an entry in seconds. None means entries never expire.
+        max_entries: Maximum number of entries kept per namespace. The least
+            recently used entries are evicted first. None means unbounded.
+        namespace: Fixed namespace for all entries. When None, the namespace is
+            derived from the crew that issued the call: its name, if any, and
+            the key of its agents and tasks.
+        db_path: Path to the SQLite database. Defaults to the CrewAI storage dir.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = 1000,
+        namespace: Optional[str] = None,
+        db_path: Optional[str] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.namespace = namespace
+        self.storage = LLMResponseCacheSQLiteStorage(db_path=db_path)
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """Return a stable hash of the completion parameters."""
+        normalized = {
+            k: _normalize_value(v)
+            for k, v in params.items()
+            if k not in NON_SEMANTIC_PARAMS
+        }
+        payload = json.dumps(normalized, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def resolve_namespace(
+        self, from_task: Optional[Any] = None, from_agent: Optional[Any] = None
+    ) -> str:
+        """Return the namespace for a call, scoped to the calling crew if any.
+
+        The crew key is always part of the namespace, so that crews sharing a
+        name, or the default one, never read each other's responses, while a
+        crew rebuilt with the same agents and tasks still finds its entries.
+        """
+        if self.namespace:
+            return self.namespace
+
+        agent = from_agent or getattr(from_task, "agent", None)
+        crew = getattr(agent, "crew", None)
+        if crew is None:
+            return DEFAULT_NAMESPACE
+        name = getattr(crew, "name", None)
+        return f"{name}:{crew.key}" if name else crew.key
+
+    def read(self, namespace: str, cache_key: str) -> Optional[str]:
+        return self.storage.get(namespace, cache_key, ttl=self.ttl)
+
+    def add(
+        self,
+        namespace: str,
+        cache_key: str,
+        response: str,
+        model: Optional[str] = None,
+    ) -> None:
+        self.storage.add(
+            namespace, cache_key, response, model=model, max_entries=self.max_entries
+        )
+
+    def reset(self, namespace: Optional[str] = None) -> None:
+        self.storage.delete_all(namespace)
+
+
+def _normalize_value(value: Any) -> Any:
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return value.model_json_schema()
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, dict):
+        return {str(k): _normalize_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_value(v) for v in value]
+    return value
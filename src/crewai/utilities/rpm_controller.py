@@ -1,77 +1,133 @@
 import threading
 import time
-from typing import Optional
+import warnings
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from crewai.utilities.logger import Logger
 
-"""Controls request rate limiting for API calls."""
+"""Controls request and token rate limiting for API calls."""
+
+T = TypeVar("T")
+
+REQUESTS_BUCKET = "requests"
+TOKENS_BUCKET = "tokens"
 
 
 class RPMController(BaseModel):
-    """Manages requests per minute limiting."""
+    """Token-bucket limiter for requests and tokens per minute.
+
+    Each limit is a bucket that holds up to one minute of budget and refills
+    continuously. A request reserves its slot up front and, when the bucket is
+    empty, waits only until its reservation is covered instead of a full
+    minute. Token counts are only known once a call returns, so they are
+    recorded afterwards and delay the requests that follow.
+
+    Controllers with a shared_key keep their buckets in SQLite, so every crew
+    and worker process using the same key draws from one budget.
+    """
 
     max_rpm: Optional[int] = Field(default=None)
+    max_tpm: Optional[int] = Field(default=None)
+    shared_key: Optional[str] = Field(
+        default=None,
+        description="Key of a budget shared with other controllers and processes.",
+    )
+    db_path: Optional[str] = Field(
+        default=None,
+        description="SQLite database holding shared budgets. Defaults to the CrewAI storage dir.",
+    )
     logger: Logger = Field(default_factory=lambda: Logger(verbose=False))
-    _current_rpm: int = PrivateAttr(default=0)
-    _timer: Optional[threading.Timer] = PrivateAttr(default=None)
-    _lock: Optional[threading.Lock] = PrivateAttr(default=None)
-    _shutdown_flag: bool = PrivateAttr(default=False)
+    _levels: Dict[str, Tuple[float, float]] = PrivateAttr(default_factory=dict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _storage: Any = PrivateAttr(default=None)
 
     @model_validator(mode="after")
-    def reset_counter(self):
-        if self.max_rpm is not None:
-            if not self._shutdown_flag:
-                self._lock = threading.Lock()
-                self._reset_request_count()
+    def set_storage(self):
+        if self.shared_key is not None and self._storage is None:
+            from crewai.memory.storage.rate_limit_storage import (
+                RateLimitSQLiteStorage,
+            )
+
+            self._storage = RateLimitSQLiteStorage(db_path=self.db_path)
         return self
 
-    def check_or_wait(self):
-        if self.max_rpm is None:
+    def check_or_wait(self) -> bool:
+        """Reserve a request, waiting until the budget allows it."""
+        if self.max_rpm is None and self.max_tpm is None:
             return True
 
-        def _check_and_increment():
-            if self.max_rpm is not None and self._current_rpm < self.max_rpm:
-                self._current_rpm += 1
-                return True
-            elif self.max_rpm is not None:
-                self.logger.log(
-                    "info", "Max RPM reached, waiting for next minute to start."
-                )
-                self._wait_for_next_minute()
-                self._current_rpm = 1
-                return True
-            return True
+        rpm_delay, tpm_delay = self._update(self._reserve_request)
+        if rpm_delay > 0:
+            self.logger.log("info", "Max RPM reached, waiting for request budget.")
+        elif tpm_delay > 0:
+            self.logger.log("info", "Max TPM reached, waiting for token budget.")
+
+        delay = max(rpm_delay, tpm_delay)
+        if delay > 0:
+            self._wait_for_next_minute(delay)
+        return True
 
-        if self._lock:
-            with self._lock:
-                return _check_and_increment()
-        else:
-            return _check_and_increment()
+    def record_tokens(self, tokens: int) -> None:
+        """Charge tokens used by a completed call against the TPM budget."""
+        if self.max_tpm is None or tokens <= 0:
+            return
+        max_tpm = self.max_tpm
+        self._update(lambda levels: _take(levels, TOKENS_BUCKET, max_tpm, tokens))
 
     def stop_rpm_counter(self):
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
-
-    def _wait_for_next_minute(self):
-        time.sleep(60)
-        self._current_rpm = 0
-
-    def _reset_request_count(self):
-        def _reset():
-            self._current_rpm = 0
-            if not self._shutdown_flag:
-                self._timer = threading.Timer(60.0, self._reset_request_count)
-                self._timer.start()
-
-        if self._lock:
-            with self._lock:
-                _reset()
-        else:
-            _reset()
-
-        if self._timer:
-            self._shutdown_flag = True
-            self._timer.cancel()
+        """Deprecated: buckets refill continuously, so there is no timer to stop."""
+        warnings.warn(
+            "RPMController.stop_rpm_counter is deprecated and does nothing, "
+            "as buckets refill without a timer. It will be removed in a future version.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+    def reset(self) -> None:
+        """Refill all buckets, including the shared ones."""
+        with self._lock:
+            self._levels.clear()
+        if self._storage is not None:
+            self._storage.delete_all(self.shared_key)
+
+    def _wait_for_next_minute(self, delay: float = 60.0):
+        time.sleep(delay)
+
+    def _reserve_request(
+        self, levels: Dict[str, Tuple[float, float]]
+    ) -> Tuple[float, float]:
+        rpm_delay = tpm_delay = 0.0
+        if self.max_rpm is not None:
+            rpm_delay = _take(levels, REQUESTS_BUCKET, self.max_rpm, 1)
+        if self.max_tpm is not None:
+            tpm_delay = _take(levels, TOKENS_BUCKET, self.max_tpm, 0)
+        return rpm_delay, tpm_delay
+
+    def _update(self, updater: Callable[[Dict[str, Tuple[float, float]]], T]) -> T:
+        if self._storage is not None:
+            return self._storage.update(self.shared_key, updater)
+        with self._lock:
+            return updater(self._levels)
+
+
+def _take(
+    levels: Dict[str, Tuple[float, float]],
+    bucket: str,
+    per_minute: int,
+    amount: float,
+) -> float:
+    """Refill a bucket, take amount from it and return the seconds to wait.
+
+    The level may go negative: the deficit is the queue of reservations made
+    ahead of the bucket's refill, and the returned delay is the time until
+    the refill covers it.
+    """
+    now = time.time()
+    rate = per_minute / 60.0
+    level, updated_at = levels.get(bucket, (float(per_minute), now))
+    level = min(float(per_minute), level + max(0.0, now - updated_at) * rate)
+    level -= amount
+    levels[bucket] = (level, now)
+    return -level / rate if level < 0 else 0.0
@@ -0,0 +1,103 @@
+"""Bounded worker pool for tasks executed with async_execution."""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+# Number of workers of the shared pool, used by crews without max_async_workers.
+MAX_ASYNC_WORKERS_ENV = "CREWAI_MAX_ASYNC_WORKERS"
+DEFAULT_MAX_ASYNC_WORKERS = 16
+
+
+class TaskExecutorMetrics(BaseModel):
+    """Snapshot of the load of a TaskExecutor.
+
+    Attributes:
+        max_workers: Number of worker threads of the pool.
+        queue_depth: Tasks submitted and waiting for a free worker.
+        active_workers: Tasks currently running.
+        completed_tasks: Tasks that finished, successfully or not.
+        failed_tasks: Tasks that raised an exception.
+    """
+
+    max_workers: int
+    queue_depth: int = 0
+    active_workers: int = 0
+    completed_tasks: int = 0
+    failed_tasks: int = 0
+
+
+class TaskExecutor:
+    """Runs asynchronous tasks on a fixed number of worker threads.
+
+    Tasks beyond max_workers wait in a queue instead of each getting a thread
+    of their own. The returned futures carry the result of the task, the
+    exception it raised, or its cancellation while still queued.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or _default_max_workers()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="crewai-task"
+        )
+        self._lock = threading.Lock()
+        self._metrics = TaskExecutorMetrics(max_workers=self.max_workers)
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Queue fn to run on the pool and return its future."""
+        with self._lock:
+            self._metrics.queue_depth += 1
+        future = self._executor.submit(self._run, fn, *args, **kwargs)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def metrics(self) -> TaskExecutorMetrics:
+        """Return the current queue depth, active workers and task counts."""
+        with self._lock:
+            return self._metrics.model_copy()
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            self._metrics.queue_depth -= 1
+            self._metrics.active_workers += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._metrics.active_workers -= 1
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            if future.cancelled():
+                # Cancelled while queued: _run never started
+                self._metrics.queue_depth -= 1
+                return
+            self._metrics.completed_tasks += 1
+            if future.exception() is not None:
+                self._metrics.failed_tasks += 1
+
+
+_default_executor: Optional[TaskExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def get_default_task_executor() -> TaskExecutor:
+    """Return the pool shared by every crew without a pool of its own."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = TaskExecutor()
+        return _default_executor
+
+
+def _default_max_workers() -> int:
+    value = os.environ.get(MAX_ASYNC_WORKERS_ENV)
+    return int(value) if value else DEFAULT_MAX_ASYNC_WORKERS
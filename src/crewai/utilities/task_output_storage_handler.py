@@ -6,6 +6,9 @@ from pydantic import BaseModel, Field
 from crewai.memory.storage.kickoff_task_outputs_storage import (
     KickoffTaskOutputsSQLiteStorage,
 )
+from crewai.memory.storage.task_checkpoints_storage import (
+    TaskCheckpointsSQLiteStorage,
+)
 from crewai.task import Task
 
 """Handles storage and retrieval of task execution outputs."""
@@ -29,13 +32,17 @@ class ExecutionLog(BaseModel):
 class TaskOutputStorageHandler:
     def __init__(self) -> None:
         self.storage = KickoffTaskOutputsSQLiteStorage()
+        self.checkpoints = TaskCheckpointsSQLiteStorage()
 
     def update(self, task_index: int, log: Dict[str, Any]):
         saved_outputs = self.load()
         if saved_outputs is None:
             raise ValueError("Logs cannot be None")
 
-        if log.get("was_replayed", False):
+        # A task that was in flight when the run stopped has no output to replace
+        if log.get("was_replayed", False) and any(
+            saved.get("task_index") == task_index for saved in saved_outputs
+        ):
             replayed = {
                 "task_id": str(log["task"].id),
                 "expected_output": log["task"].expected_output,
@@ -60,8 +67,34 @@ class TaskOutputStorageHandler:
     ):
         self.storage.add(task, output, task_index, was_replayed, inputs)
 
+    def save_checkpoint(
+        self,
+        task_index: int,
+        task: Task,
+        messages: List[Dict[str, Any]],
+        iterations: int,
+        tool_results: List[Dict[str, Any]],
+        inputs: Optional[Dict[str, Any]] = None,
+    ):
+        self.checkpoints.save(
+            task_index,
+            str(task.id),
+            task.key,
+            messages,
+            iterations,
+            tool_results,
+            inputs or {},
+        )
+
+    def clear_checkpoint(self, task_index: int):
+        self.checkpoints.delete(task_index)
+
+    def load_checkpoints(self) -> List[Dict[str, Any]]:
+        return self.checkpoints.load()
+
     def reset(self):
         self.storage.delete_all()
+        self.checkpoints.delete_all()
 
     def load(self) -> Optional[List[Dict[str, Any]]]:
         return self.storage.load()
@@ -0,0 +1,117 @@
+"""Handles memoization of task outputs across kickoffs."""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from crewai.memory.storage.task_results_storage import TaskResultsSQLiteStorage
+from crewai.tasks.task_output import TaskOutput
+
+# LLM attributes that change what the model answers. Transport settings such
+# as API keys, timeouts or hedging are left out of the key on purpose.
+LLM_CONFIG_FIELDS = (
+    "model",
+    "temperature",
+    "top_p",
+    "n",
+    "stop",
+    "max_tokens",
+    "max_completion_tokens",
+    "presence_penalty",
+    "frequency_penalty",
+    "logit_bias",
+    "response_format",
+    "seed",
+    "reasoning_effort",
+    "additional_params",
+)
+
+
+class TaskResultCacheHandler:
+    """Opt-in, content-addressed cache of task outputs, persisted in SQLite.
+
+    A task output is stored under a hash of the interpolated task, the
+    context it was given, the agent that ran it, its LLM configuration and
+    its tools. A later run of an identical task returns the stored output
+    without calling the agent.
+
+    Args:
+        ttl: Maximum age of an entry in seconds. None means entries never expire.
+        db_path: Path to the SQLite database. Defaults to the CrewAI storage dir.
+    """
+
+    def __init__(
+        self, ttl: Optional[float] = None, db_path: Optional[str] = None
+    ) -> None:
+        self.ttl = ttl
+        self.storage = TaskResultsSQLiteStorage(db_path=db_path)
+
+    @staticmethod
+    def make_key(
+        task: Any, agent: Any, context: Optional[str], tools: List[Any]
+    ) -> str:
+        """Return a stable hash of everything that determines a task's output."""
+        payload = {
+            "description": task.description,
+            "expected_output": task.expected_output,
+            "context": context,
+            "output_json": _schema(task.output_json),
+            "output_pydantic": _schema(task.output_pydantic),
+            "agent": {
+                "role": agent.role,
+                "goal": agent.goal,
+                "backstory": agent.backstory,
+            },
+            "llm": _llm_config(getattr(agent, "llm", None)),
+            "tools": sorted(
+                (
+                    {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "args": _schema(getattr(tool, "args_schema", None)),
+                    }
+                    for tool in tools
+                ),
+                key=lambda tool: tool["name"],
+            ),
+        }
+        serialized = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def read(self, cache_key: str, task: Any) -> Optional[TaskOutput]:
+        """Return the stored output for a key, or None on a miss."""
+        stored = self.storage.get(cache_key, ttl=self.ttl)
+        if stored is None:
+            return None
+
+        data: Dict[str, Any] = json.loads(stored)
+        pydantic_output = data.pop("pydantic", None)
+        output = TaskOutput(**data)
+        if pydantic_output is not None and task.output_pydantic:
+            output.pydantic = task.output_pydantic.model_validate(pydantic_output)
+        return output
+
+    def add(self, cache_key: str, output: TaskOutput) -> None:
+        data = output.model_dump(mode="json", exclude={"pydantic", "summary"})
+        data["pydantic"] = (
+            output.pydantic.model_dump(mode="json") if output.pydantic else None
+        )
+        self.storage.add(cache_key, json.dumps(data))
+
+    def reset(self) -> None:
+        self.storage.delete_all()
+
+
+def _schema(model: Any) -> Optional[Dict[str, Any]]:
+    if model is None or not hasattr(model, "model_json_schema"):
+        return None
+    return model.model_json_schema()
+
+
+def _llm_config(llm: Any) -> Any:
+    if llm is None or isinstance(llm, str):
+        return llm
+    return {
+        "class": type(llm).__name__,
+        **{field: getattr(llm, field, None) for field in LLM_CONFIG_FIELDS},
+    }
@@ -1,15 +1,23 @@
 import warnings
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.types.utils import Usage
 
 from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
 
+if TYPE_CHECKING:
+    from crewai.utilities.rpm_controller import RPMController
+
 
 class TokenCalcHandler(CustomLogger):
-    def __init__(self, token_cost_process: Optional[TokenProcess]):
+    def __init__(
+        self,
+        token_cost_process: Optional[TokenProcess],
+        rpm_controller: Optional["RPMController"] = None,
+    ):
         self.token_cost_process = token_cost_process
+        self.rpm_controller = rpm_controller
 
     def log_success_event(
         self,
@@ -18,14 +26,15 @@ class TokenCalcHandler(CustomLogger):
         start_time: float,
         end_time: float,
     ) -> None:
-        if self.token_cost_process is None:
-            return
-
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", UserWarning)
             if isinstance(response_obj, dict) and "usage" in response_obj:
                 usage: Usage = response_obj["usage"]
-                if usage:
+                if usage and self.rpm_controller is not None:
+                    self.rpm_controller.record_tokens(
+                        getattr(usage, "total_tokens", 0) or 0
+                    )
+                if usage and self.token_cost_process is not None:
                     self.token_cost_process.sum_successful_requests(1)
                     if hasattr(usage, "prompt_tokens"):
                         self.token_cost_process.sum_prompt_tokens(usage.prompt_tokens)
@@ -41,3 +50,10 @@ class TokenCalcHandler(CustomLogger):
                         self.token_cost_process.sum_cached_prompt_tokens(
                             usage.prompt_tokens_details.cached_tokens
                         )
+                    cache_creation_tokens = getattr(
+                        usage, "cache_creation_input_tokens", 0
+                    )
+                    if cache_creation_tokens:
+                        self.token_cost_process.sum_cache_creation_prompt_tokens(
+                            cache_creation_tokens
+                        )
@@ -0,0 +1,63 @@
+"""Process-wide limits on the number of concurrent runs of a tool."""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+
+_semaphores: Dict[Tuple[str, int], threading.BoundedSemaphore] = {}
+_semaphores_lock = threading.Lock()
+
+
+def _semaphore(tool_name: str, limit: int) -> threading.BoundedSemaphore:
+    with _semaphores_lock:
+        return _semaphores.setdefault(
+            (tool_name, limit), threading.BoundedSemaphore(limit)
+        )
+
+
+@contextmanager
+def tool_concurrency_slot(tool_name: str, limit: Optional[int]) -> Iterator[None]:
+    """Hold one of the limit slots of a tool for the duration of the block.
+
+    Runs of tools with the same name and limit share their slots across
+    agents, crews and threads, so a rate-limited API behind a tool is not
+    called more than limit times at once. A limit of None does not wait.
+    """
+    if limit is None:
+        yield
+        return
+
+    with _semaphore(tool_name, limit):
+        yield
+
+
+@asynccontextmanager
+async def async_tool_concurrency_slot(
+    tool_name: str, limit: Optional[int]
+) -> AsyncIterator[None]:
+    """Async variant of tool_concurrency_slot that waits without blocking the loop.
+
+    Async and sync runs of a tool draw from the same slots.
+    """
+    if limit is None:
+        yield
+        return
+
+    semaphore = _semaphore(tool_name, limit)
+    if not semaphore.acquire(blocking=False):
+        acquire = asyncio.ensure_future(asyncio.to_thread(semaphore.acquire))
+        try:
+            await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            # The waiting thread cannot be stopped; hand its slot back once it gets one
+            acquire.add_done_callback(
+                lambda future: semaphore.release()
+                if not future.cancelled() and future.exception() is None
+                else None
+            )
+            raise
+    try:
+        yield
+    finally:
+        semaphore.release()
@@ -19,6 +19,8 @@ from pydantic import BaseModel, Field
 
 from crewai_tools.printer import Printer
 
+from .interpreter_pool import InterpreterPool
+
 
 class CodeInterpreterSchema(BaseModel):
     """Schema for defining inputs to the CodeInterpreterTool.
@@ -142,6 +144,14 @@ class CodeInterpreterTool(BaseTool):
     user_dockerfile_path: Optional[str] = None
     user_docker_base_url: Optional[str] = None
     unsafe_mode: bool = False
+    worker_pool: Optional[InterpreterPool] = Field(
+        default=None,
+        description="Warm interpreter processes that run the code instead of Docker or exec.",
+    )
+    session_id: Optional[str] = Field(
+        default=None,
+        description="Runs in the worker pool with the same session_id share their variables.",
+    )
 
     @staticmethod
     def _get_installed_package_path() -> str:
@@ -202,7 +212,11 @@ class CodeInterpreterTool(BaseTool):
         """
         code = kwargs.get("code", self.code)
         libraries_used = kwargs.get("libraries_used", [])
+        if code is None:
+            return "An error occurred: no code was provided to run."
 
+        if self.worker_pool is not None:
+            return self.run_code_in_worker_pool(code, libraries_used)
         if self.unsafe_mode:
             return self.run_code_unsafe(code, libraries_used)
         else:
@@ -344,6 +358,51 @@ class CodeInterpreterTool(BaseTool):
         except Exception as e:
             return f"An error occurred: {str(e)}"
 
+    def run_code_in_worker_pool(self, code: str, libraries_used: List[str]) -> str:
+        """Runs Python code in a warm subprocess of the worker pool.
+
+        In safe mode the code runs with the restrictions of SandboxPython and
+        libraries are not installed. In unsafe mode the libraries are
+        installed on the host, once per pool, and the code is unrestricted.
+        Either way the code runs outside the agent process, within the time
+        and memory limits of the pool.
+
+        Args:
+            code: The Python code to execute as a string.
+            libraries_used: A list of Python library names to install before execution.
+
+        Returns:
+            The value of the 'result' variable from the executed code, or what
+            it printed if it set none, or an error message if execution failed.
+            Without a worker pool the code runs as it would without one.
+        """
+        pool = self.worker_pool
+        if pool is None:
+            if self.unsafe_mode:
+                return self.run_code_unsafe(code, libraries_used)
+            return self.run_code_safety(code, libraries_used)
+
+        Printer.print("Running code in interpreter worker pool", color="bold_blue")
+        if self.unsafe_mode:
+            try:
+                pool.install_libraries(libraries_used)
+            except RuntimeError as e:
+                return f"An error occurred: {e}"
+            execution = pool.run(code, session_id=self.session_id)
+        else:
+            execution = pool.run(
+                code,
+                session_id=self.session_id,
+                blocked_modules=SandboxPython.BLOCKED_MODULES,
+                unsafe_builtins=SandboxPython.UNSAFE_BUILTINS,
+            )
+
+        if execution.error is not None:
+            return f"An error occurred: {execution.error}"
+        if execution.result is not None:
+            return execution.result
+        return execution.output or "No result variable found."
+
     def run_code_unsafe(self, code: str, libraries_used: List[str]) -> str:
         """Runs code directly on the host machine without any safety restrictions.
 
@@ -0,0 +1,321 @@
+"""Pool of warm Python worker processes for the CodeInterpreterTool.
+
+Starting a Docker container, or installing the libraries of the code on every
+call, costs seconds per run. The pool instead keeps a few interpreter
+subprocesses running, with common libraries already imported, and hands each
+run to an idle one. Runs are bounded in wall-clock time and memory, and never
+execute in the process of the agent.
+"""
+
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import weakref
+from typing import IO, Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from pydantic import BaseModel
+
+_WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "interpreter_worker.py")
+
+
+class CodeExecutionResult(BaseModel):
+    """Outcome of a run in an InterpreterPool.
+
+    Attributes:
+        output: Everything the code printed to stdout and stderr.
+        result: The 'result' variable set by the code, as a string, if any.
+        error: Description of the error that stopped the code, if any.
+    """
+
+    output: str = ""
+    result: Optional[str] = None
+    error: Optional[str] = None
+
+
+class _WorkerProcess:
+    """A running interpreter_worker.py and the thread reading its responses."""
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", _WORKER_SCRIPT, json.dumps(config)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+        if self.process.stdin is None or self.process.stdout is None:
+            self.process.kill()
+            raise RuntimeError("Could not open the pipes of the interpreter process")
+        self.stdin: IO[str] = self.process.stdin
+        self.stdout: IO[str] = self.process.stdout
+        self.runs = 0
+        self.busy = False
+        self.sessions: Set[str] = set()
+        self.responses: "queue.Queue[Optional[str]]" = queue.Queue()
+        threading.Thread(target=self._read_responses, daemon=True).start()
+
+    def _read_responses(self) -> None:
+        for line in self.stdout:
+            self.responses.put(line)
+        # None marks the end of the process
+        self.responses.put(None)
+
+    def request(self, payload: Dict[str, Any], timeout: Optional[float]) -> Dict:
+        """Sends a request and waits for its response.
+
+        Raises:
+            TimeoutError: If no response arrived within timeout seconds.
+            EOFError: If the process exited before responding.
+        """
+        try:
+            self.stdin.write(json.dumps(payload) + "\n")
+            self.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise EOFError("The interpreter process is not running") from e
+
+        try:
+            line = self.responses.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError from None
+        if line is None:
+            raise EOFError("The interpreter process exited unexpectedly")
+        return json.loads(line)
+
+    def stop(self) -> None:
+        if self.process.poll() is None:
+            self.process.kill()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+
+
+def _stop_workers(workers: List[_WorkerProcess]) -> None:
+    for worker in list(workers):
+        worker.stop()
+
+
+class InterpreterPool:
+    """Warm, resource-limited Python subprocesses that run untrusted code.
+
+    The worker processes are started when the pool is created, import
+    preload_modules right away and are reused across runs, so a run only
+    pays for sending the code over a pipe. A run that exceeds run_timeout
+    seconds has its worker killed and replaced. Each worker is limited to
+    memory_limit_mb of address space on platforms with the resource module,
+    and is replaced after max_runs_per_worker runs so state leaked by the
+    code does not accumulate.
+
+    Runs sharing a session_id keep their variables between runs and always
+    go to the same worker. A worker holding sessions is not recycled until
+    they are closed with close_session. Sessions are lost, and start over
+    empty, if their worker times out or dies.
+
+    A pool can be shared by several tools and agents, and is safe to use
+    from multiple threads. Runs wait for a free worker when all are busy.
+
+    Args:
+        size: Number of worker processes.
+        preload_modules: Modules imported by every worker before its first run.
+            Modules that are not installed are skipped.
+        run_timeout: Wall-clock seconds a run may take. None means no limit.
+        memory_limit_mb: Address space limit of each worker. None means no limit.
+        max_runs_per_worker: Runs after which a worker without sessions is
+            replaced by a fresh one. None means workers are never recycled.
+    """
+
+    DEFAULT_PRELOAD_MODULES = (
+        "collections",
+        "datetime",
+        "itertools",
+        "json",
+        "math",
+        "random",
+        "re",
+        "statistics",
+        "numpy",
+        "pandas",
+    )
+
+    def __init__(
+        self,
+        size: int = 2,
+        preload_modules: Sequence[str] = DEFAULT_PRELOAD_MODULES,
+        run_timeout: Optional[float] = 30.0,
+        memory_limit_mb: Optional[int] = 1024,
+        max_runs_per_worker: Optional[int] = 100,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        self.size = size
+        self.run_timeout = run_timeout
+        self.max_runs_per_worker = max_runs_per_worker
+        self._config = {
+            "preload_modules": list(preload_modules),
+            "memory_limit_mb": memory_limit_mb,
+        }
+        self._condition = threading.Condition()
+        self._closed = False
+        self._installed_libraries: Set[str] = set()
+        self._sessions: Dict[str, _WorkerProcess] = {}
+        self._workers: List[_WorkerProcess] = [
+            _WorkerProcess(self._config) for _ in range(size)
+        ]
+        self._finalizer = weakref.finalize(self, _stop_workers, self._workers)
+
+    def __enter__(self) -> "InterpreterPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def run(
+        self,
+        code: str,
+        session_id: Optional[str] = None,
+        blocked_modules: Optional[Iterable[str]] = None,
+        unsafe_builtins: Optional[Iterable[str]] = None,
+    ) -> CodeExecutionResult:
+        """Runs Python code in a worker of the pool.
+
+        Args:
+            code: The Python code to execute as a string.
+            session_id: Runs with the same session_id share their variables.
+            blocked_modules: Modules the code may not import. When given, the
+                code runs with restricted builtins, as in SandboxPython.
+            unsafe_builtins: Built-in functions hidden from restricted code.
+
+        Returns:
+            The printed output, 'result' variable and error of the run.
+        """
+        payload: Dict[str, Any] = {"code": code, "session_id": session_id}
+        if blocked_modules is not None:
+            payload["blocked_modules"] = sorted(blocked_modules)
+            payload["unsafe_builtins"] = sorted(unsafe_builtins or ())
+
+        worker = self._acquire(session_id)
+        try:
+            response = worker.request(payload, timeout=self.run_timeout)
+        except TimeoutError:
+            self._replace(worker)
+            return CodeExecutionResult(
+                error=f"Code execution timed out after {self.run_timeout} seconds"
+            )
+        except EOFError as e:
+            self._replace(worker)
+            return CodeExecutionResult(
+                error=f"{e}, possibly after running out of memory"
+            )
+
+        self._release(worker)
+        return CodeExecutionResult(**response)
+
+    def install_libraries(self, libraries: Iterable[str]) -> None:
+        """Installs libraries with pip, once per pool, for the workers to import.
+
+        Running workers pick up the new libraries on their next run. A library
+        is only recorded as installed once pip succeeds, so a failed install
+        is retried on the next call.
+
+        Raises:
+            RuntimeError: If pip fails to install the libraries.
+        """
+        with self._condition:
+            missing = [
+                library
+                for library in libraries
+                if library and library not in self._installed_libraries
+            ]
+        if not missing:
+            return
+        try:
+            subprocess.run(
+                [sys.executable, "-m", "pip", "install", *missing],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(
+                f"Failed to install {', '.join(missing)}: {(e.stderr or '').strip()}"
+            ) from e
+        with self._condition:
+            self._installed_libraries.update(missing)
+
+    def close_session(self, session_id: str) -> None:
+        """Drops the variables of a session, letting its worker be recycled."""
+        with self._condition:
+            if session_id not in self._sessions:
+                return
+        worker = self._acquire(session_id)
+        try:
+            worker.request({"close_session": session_id}, timeout=self.run_timeout)
+        except (TimeoutError, EOFError):
+            self._replace(worker)
+            return
+        with self._condition:
+            worker.sessions.discard(session_id)
+            self._sessions.pop(session_id, None)
+            worker.busy = False
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Stops every worker. Runs started afterwards raise RuntimeError."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._finalizer()
+
+    def _acquire(self, session_id: Optional[str]) -> _WorkerProcess:
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("The interpreter pool is closed")
+
+                worker = self._sessions.get(session_id) if session_id else None
+                if worker is None:
+                    # Leave workers holding sessions for their own runs if possible
+                    idle = [w for w in self._workers if not w.busy]
+                    idle.sort(key=lambda w: len(w.sessions))
+                    worker = idle[0] if idle else None
+                elif worker.busy:
+                    worker = None
+
+                if worker is not None:
+                    worker.busy = True
+                    if session_id is not None:
+                        worker.sessions.add(session_id)
+                        self._sessions[session_id] = worker
+                    return worker
+                self._condition.wait()
+
+    def _release(self, worker: _WorkerProcess) -> None:
+        with self._condition:
+            worker.runs += 1
+            recycle = (
+                self.max_runs_per_worker is not None
+                and worker.runs >= self.max_runs_per_worker
+                and not worker.sessions
+            )
+            if not recycle:
+                worker.busy = False
+                self._condition.notify_all()
+        if recycle:
+            self._replace(worker)
+
+    def _replace(self, worker: _WorkerProcess) -> None:
+        worker.stop()
+        with self._condition:
+            for session_id in worker.sessions:
+                self._sessions.pop(session_id, None)
+            if worker in self._workers:
+                self._workers.remove(worker)
+                if not self._closed:
+                    self._workers.append(_WorkerProcess(self._config))
+            self._condition.notify_all()
@@ -0,0 +1,139 @@
+"""Worker process of the InterpreterPool.
+
+This script is started by InterpreterPool with the interpreter running the
+pool, and must only depend on the standard library. It reads one JSON
+request per line from stdin, runs the code and writes one JSON response per
+line to stdout. The output of the code itself is captured, so it can never
+be mixed with the responses.
+"""
+
+import builtins
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+
+def _limit_memory(memory_limit_mb: Optional[int]) -> None:
+    """Caps the address space of the process, where the platform supports it."""
+    if not memory_limit_mb:
+        return
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+
+    limit = memory_limit_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        pass
+
+
+def _preload(modules: Iterable[str]) -> None:
+    """Imports the given modules ahead of the first run, ignoring missing ones."""
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass
+
+
+def _restricted_builtins(
+    blocked_modules: FrozenSet[str], unsafe_builtins: FrozenSet[str]
+) -> Dict[str, Any]:
+    """Builds the builtins of a sandboxed run, mirroring SandboxPython."""
+
+    def restricted_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if name.split(".")[0] in blocked_modules:
+            raise ImportError(f"Importing '{name}' is not allowed.")
+        return __import__(name, globals, locals, fromlist or (), level)
+
+    safe_builtins = {
+        k: v for k, v in builtins.__dict__.items() if k not in unsafe_builtins
+    }
+    safe_builtins["__import__"] = restricted_import
+    return safe_builtins
+
+
+class _Worker:
+    def __init__(self) -> None:
+        self.sessions: Dict[str, Dict[str, Any]] = {}
+        self._sandboxes: Dict[Tuple[FrozenSet[str], FrozenSet[str]], Dict] = {}
+
+    def namespace(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        session_id = request.get("session_id")
+        if session_id is not None and session_id in self.sessions:
+            return self.sessions[session_id]
+
+        namespace: Dict[str, Any] = {"__name__": "__main__"}
+        if request.get("blocked_modules") is not None:
+            key = (
+                frozenset(request["blocked_modules"]),
+                frozenset(request.get("unsafe_builtins") or ()),
+            )
+            if key not in self._sandboxes:
+                self._sandboxes[key] = _restricted_builtins(*key)
+            namespace["__builtins__"] = self._sandboxes[key]
+
+        if session_id is not None:
+            self.sessions[session_id] = namespace
+        return namespace
+
+    def run(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if "close_session" in request:
+            self.sessions.pop(request["close_session"], None)
+            return {"closed": True}
+
+        # Pick up libraries installed since the worker started
+        importlib.invalidate_caches()
+        namespace = self.namespace(request)
+        # Every run reports its own result, even within a session
+        namespace.pop("result", None)
+        output = io.StringIO()
+        error = None
+        try:
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(
+                output
+            ):
+                exec(compile(request["code"], "<code>", "exec"), namespace)
+        except (Exception, SystemExit) as e:
+            error = str(e) or type(e).__name__
+
+        has_result = "result" in namespace and error is None
+        return {
+            "output": output.getvalue(),
+            "result": str(namespace["result"]) if has_result else None,
+            "error": error,
+        }
+
+
+def main() -> None:
+    config = json.loads(sys.argv[1])
+
+    # Keep private copies of the pipes to the pool, and point the standard
+    # descriptors elsewhere so that nothing the code does can write into them
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    responses = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+
+    _limit_memory(config.get("memory_limit_mb"))
+    _preload(config.get("preload_modules", ()))
+
+    worker = _Worker()
+    for line in requests:
+        try:
+            response = worker.run(json.loads(line))
+        except MemoryError:
+            response = {"output": "", "result": None, "error": "Out of memory"}
+        responses.write(json.dumps(response) + "\n")
+        responses.flush()
+
+
+if __name__ == "__main__":
+    main()
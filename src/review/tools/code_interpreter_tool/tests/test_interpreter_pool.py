@@ -0,0 +1,87 @@
+import pytest
+
+from crewai_tools.tools.code_interpreter_tool.code_interpreter_tool import (
+    CodeInterpreterTool,
+    SandboxPython,
+)
+from crewai_tools.tools.code_interpreter_tool.interpreter_pool import InterpreterPool
+
+
+@pytest.fixture
+def pool():
+    with InterpreterPool(
+        size=2, preload_modules=["json"], run_timeout=2, max_runs_per_worker=3
+    ) as pool:
+        yield pool
+
+
+def test_pool_returns_result_or_printed_output(pool):
+    assert pool.run("result = 1 + 1").result == "2"
+
+    execution = pool.run("print('hello')")
+    assert execution.output == "hello\n"
+    assert execution.result is None
+
+    assert pool.run("raise ValueError('bad input')").error == "bad input"
+
+
+def test_pool_applies_sandbox_restrictions(pool):
+    execution = pool.run(
+        "import os",
+        blocked_modules=SandboxPython.BLOCKED_MODULES,
+        unsafe_builtins=SandboxPython.UNSAFE_BUILTINS,
+    )
+    assert execution.error == "Importing 'os' is not allowed."
+
+
+def test_sessions_keep_their_variables(pool):
+    pool.run("x = 41", session_id="analysis")
+
+    assert pool.run("result = x + 1", session_id="analysis").result == "42"
+    assert "not defined" in pool.run("result = x").error
+
+    pool.close_session("analysis")
+    assert "not defined" in pool.run("result = x", session_id="analysis").error
+
+
+def test_timed_out_workers_are_replaced(pool):
+    execution = pool.run("while True: pass")
+
+    assert execution.error == "Code execution timed out after 2 seconds"
+    assert pool.run("result = 'still working'").result == "still working"
+
+
+def test_workers_are_recycled_after_max_runs(pool):
+    pids = {worker.process.pid for worker in pool._workers}
+    for _ in range(6):
+        pool.run("result = 1")
+
+    assert pids.isdisjoint(worker.process.pid for worker in pool._workers)
+
+
+def test_tool_runs_code_in_worker_pool(pool):
+    tool = CodeInterpreterTool(worker_pool=pool, session_id="agent")
+
+    tool.run(code="total = 20", libraries_used=[])
+    assert tool.run(code="result = total * 2", libraries_used=[]) == "40"
+    assert (
+        tool.run(code="import subprocess", libraries_used=[])
+        == "An error occurred: Importing 'subprocess' is not allowed."
+    )
+
+
+def test_failed_library_installs_are_retried(pool):
+    import subprocess
+    from unittest.mock import patch
+
+    failure = subprocess.CalledProcessError(1, "pip", stderr="No matching distribution")
+    with patch("subprocess.run", side_effect=failure):
+        with pytest.raises(RuntimeError, match="No matching distribution"):
+            pool.install_libraries(["missing-lib"])
+    assert "missing-lib" not in pool._installed_libraries
+
+    with patch("subprocess.run") as run:
+        pool.install_libraries(["missing-lib"])
+        pool.install_libraries(["missing-lib"])
+    run.assert_called_once()
+    assert run.call_args.kwargs["check"] is True
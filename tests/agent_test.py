@@ -688,7 +688,7 @@ def test_agent_respect_the_max_rpm_set(capsys):
         )
         assert output == "42"
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting for request budget." in captured.out
         moveon.assert_called()
 
 
@@ -726,7 +726,7 @@ def test_agent_respect_the_max_rpm_set_over_crew_rpm(capsys):
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." not in captured.out
+        assert "Max RPM reached, waiting for request budget." not in captured.out
         moveon.assert_not_called()
 
 
@@ -786,7 +786,7 @@ def test_agent_without_max_rpm_respects_crew_rpm(capsys):
         crew.kickoff()
         captured = capsys.readouterr()
         assert "get_final_answer" in captured.out
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting for request budget." in captured.out
         moveon.assert_called_once()
 
 
@@ -2000,6 +2000,49 @@ def test_crew_agent_executor_litellm_auth_error():
     assert exc_info.value.model == "gpt-4"
 
 
+def test_crew_agent_executor_stops_streaming_once_step_is_complete():
+    from crewai.agents.tools_handler import ToolsHandler
+
+    llm = LLM(model="gpt-4o-mini", stream=True)
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm=llm,
+    )
+    task = Task(
+        description="Test task",
+        expected_output="Test output",
+        agent=agent,
+    )
+    executor = CrewAgentExecutor(
+        agent=agent,
+        task=task,
+        llm=llm,
+        crew=None,
+        prompt={"system": "You are a test agent", "user": "Execute the task: {input}"},
+        max_iter=5,
+        tools=[],
+        tools_names="",
+        stop_words=["\nObservation:"],
+        tools_description="",
+        tools_handler=ToolsHandler(),
+    )
+    pieces = ["Thought: done\nFinal Answer: 42", "\nObservation:", " never read"]
+    consumed = []
+
+    def chunks():
+        for piece in pieces:
+            consumed.append(piece)
+            yield {"choices": [{"delta": {"content": piece}}]}
+
+    with patch("litellm.completion", return_value=chunks()):
+        result = executor.invoke({"input": "test input", "tool_names": "", "tools": ""})
+
+    assert result["output"] == "42"
+    assert len(consumed) == 2
+
+
 def test_litellm_anthropic_error_handling():
     """Test that AnthropicError from LiteLLM is handled correctly and not retried."""
     from litellm.llms.anthropic.common_utils import AnthropicError
@@ -0,0 +1,73 @@
+import time
+
+import pytest
+
+from crewai.agents.cache import CacheHandler
+
+
+@pytest.fixture
+def db_path(tmp_path) -> str:
+    return str(tmp_path / "tool_cache.db")
+
+
+def test_cache_key_ignores_argument_order_and_encoding():
+    cache = CacheHandler()
+    cache.add("search", {"query": "ai", "limit": 5}, "results")
+
+    assert cache.read("search", {"limit": 5, "query": "ai"}) == "results"
+    assert cache.read("search", '{"limit": 5, "query": "ai"}') == "results"
+    assert cache.read("search", "{'query': 'ai', 'limit': 5}") == "results"
+    assert cache.read("search", {"query": "ai", "limit": 6}) is None
+    assert cache.read("lookup", {"query": "ai", "limit": 5}) is None
+
+    metrics = cache.metrics()
+    assert (metrics.hits, metrics.misses, metrics.size) == (3, 2, 1)
+
+
+def test_cache_evicts_least_recently_used_and_expired_results():
+    cache = CacheHandler(max_size=2, tool_ttls={"clock": 0.05})
+    cache.add("search", {"query": "a"}, "a")
+    cache.add("search", {"query": "b"}, "b")
+    cache.read("search", {"query": "a"})
+    cache.add("search", {"query": "c"}, "c")
+
+    assert cache.read("search", {"query": "b"}) is None
+    assert cache.read("search", {"query": "a"}) == "a"
+    assert cache.metrics().evictions == 1
+
+    cache.add("clock", {}, "12:00")
+    assert cache.read("clock", {}) == "12:00"
+    time.sleep(0.1)
+    assert cache.read("clock", {}) is None
+
+
+def test_persisted_results_are_shared_between_caches(db_path):
+    CacheHandler(persist=True, db_path=db_path).add(
+        "multiplier", {"first_number": 2, "second_number": 6}, 12
+    )
+    CacheHandler(persist=True, db_path=db_path, ttl=0.05).add(
+        "clock", {}, "12:00"
+    )
+
+    other = CacheHandler(persist=True, db_path=db_path)
+    assert other.read("multiplier", {"second_number": 6, "first_number": 2}) == 12
+    time.sleep(0.1)
+    assert other.read("clock", {}) is None
+
+    other.reset()
+    assert CacheHandler(persist=True, db_path=db_path).read(
+        "multiplier", {"first_number": 2, "second_number": 6}
+    ) is None
+
+
+def test_failing_sqlite_tier_falls_back_to_memory(db_path):
+    import os
+
+    cache = CacheHandler(persist=True, db_path=db_path)
+    os.remove(db_path)
+    os.mkdir(db_path)
+
+    cache.add("search", {"query": "ai"}, "results")
+
+    assert cache.read("search", {"query": "ai"}) == "results"
+    assert cache.read("search", {"query": "ml"}) is None
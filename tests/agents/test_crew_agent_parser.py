@@ -371,3 +371,19 @@ class MockAgent:
 
 
 # TODO: ADD TEST TO MAKE SURE ** REMOVAL DOESN'T MESS UP ANYTHING
+
+
+def test_find_step_end_waits_for_open_action_input():
+    text = 'Thought: search\nAction: search\nAction Input: {"query": "{x"'
+
+    assert CrewAgentParser.find_step_end(text) is None
+    assert CrewAgentParser.find_step_end(text + "}\n") == len(text) + 1
+
+
+def test_find_step_end_final_answer_needs_stop_word():
+    text = "Thought: done\nFinal Answer: {\"a\": 1}"
+
+    assert CrewAgentParser.find_step_end(text, ["\nObservation:"]) is None
+    assert CrewAgentParser.find_step_end(
+        text + "\nObservation: x", ["\nObservation:"]
+    ) == len(text)
@@ -3,11 +3,18 @@ import os
 import tempfile
 from pathlib import Path
 
+import litellm
 import pytest
 from dotenv import load_dotenv
 
+from crewai.llms.capabilities import model_capability_registry
+
 load_result = load_dotenv(override=True)
 
+# litellm.acompletion sends requests through aiohttp by default, which VCR
+# cannot intercept. Keep async calls on httpx so cassettes replay them.
+litellm.disable_aiohttp_transport = True
+
 
 @pytest.fixture(autouse=True)
 def setup_test_environment():
@@ -42,6 +49,14 @@ def setup_test_environment():
         # Cleanup is handled automatically when tempfile context exits
 
 
+@pytest.fixture(autouse=True)
+def reset_model_capability_registry():
+    """Keep capabilities memoized by one test, often from mocks, out of the next."""
+    model_capability_registry.clear()
+    yield
+    model_capability_registry.clear()
+
+
 @pytest.fixture(scope="module")
 def vcr_config(request) -> dict:
     return {
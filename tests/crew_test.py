@@ -28,6 +28,7 @@ from crewai.tasks.output_format import OutputFormat
 from crewai.tasks.task_output import TaskOutput
 from crewai.types.usage_metrics import UsageMetrics
 from crewai.utilities import Logger
+from crewai.utilities.constants import NOT_SPECIFIED
 from crewai.utilities.events import (
     CrewTrainCompletedEvent,
     CrewTrainStartedEvent,
@@ -994,7 +995,7 @@ def test_api_calls_throttling(capsys):
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting for request budget." in captured.out
         moveon.assert_called()
 
 
@@ -1456,12 +1457,44 @@ async def test_kickoff_async_basic_functionality_and_output():
     )
 
     expected_output = "This is a sample output from kickoff."
-    with patch.object(Crew, "kickoff", return_value=expected_output) as mock_kickoff:
+    with patch.object(
+        Crew, "_arun_sequential_process", return_value=expected_output
+    ) as mock_run, patch.object(Crew, "kickoff") as mock_kickoff:
         result = await crew.kickoff_async(inputs)
 
         assert isinstance(result, str), "Result should be a string"
         assert result == expected_output, "Result should match expected output"
-        mock_kickoff.assert_called_once_with(inputs)
+        mock_run.assert_awaited_once()
+        mock_kickoff.assert_not_called()
+        assert task.description == "Give me an analysis around dog."
+
+
+@pytest.mark.asyncio
+async def test_kickoff_async_awaits_llm_natively():
+    """kickoff_async should drive the agents through LLM.acall, not LLM.call."""
+    agent = Agent(
+        role="Researcher",
+        goal="Express hot takes on dogs.",
+        backstory="You have a lot of experience with dogs.",
+        llm=LLM(model="gpt-4o-mini"),
+    )
+    task = Task(
+        description="Give me an analysis around dogs.",
+        expected_output="1 bullet point about dogs.",
+        agent=agent,
+    )
+    crew = Crew(agents=[agent], tasks=[task])
+
+    with patch.object(
+        LLM,
+        "acall",
+        return_value="Thought: I now know the final answer\nFinal Answer: Dogs are great.",
+    ) as mock_acall, patch.object(LLM, "call") as mock_call:
+        result = await crew.kickoff_async()
+
+    assert result.raw == "Dogs are great."
+    mock_acall.assert_awaited_once()
+    mock_call.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -4756,3 +4789,665 @@ def test_reset_agent_knowledge_with_only_agent_knowledge(researcher, writer):
         mock_reset_agent_knowledge.assert_called_once_with(
             [mock_ks_research, mock_ks_writer]
         )
+
+
+def test_dag_process_runs_independent_tasks_in_parallel(researcher, writer):
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+    research = Task(
+        description="Research AI agents",
+        expected_output="Research notes",
+        agent=researcher,
+        context=[],
+    )
+    strategy = Task(
+        description="Define the brand strategy",
+        expected_output="Brand strategy",
+        agent=writer,
+        context=[],
+    )
+    article = Task(
+        description="Write the article",
+        expected_output="Article",
+        agent=writer,
+    )
+    crew = Crew(
+        agents=[researcher, writer],
+        tasks=[research, strategy, article],
+        process=Process.dag,
+    )
+
+    def execute_task(task, context=None, tools=None):
+        if task is not article:
+            # Both independent tasks must be running at the same time to pass
+            barrier.wait()
+        return f"{task.description} done"
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task) as execute:
+        result = crew.kickoff()
+
+    assert result.raw == "Write the article done"
+    assert [output.raw for output in result.tasks_output] == [
+        "Research AI agents done",
+        "Define the brand strategy done",
+        "Write the article done",
+    ]
+    article_context = next(
+        call.kwargs["context"]
+        for call in execute.call_args_list
+        if call.kwargs["task"] is article
+    )
+    assert "Research AI agents done" in article_context
+    assert "Define the brand strategy done" in article_context
+
+
+def test_dag_process_respects_agent_exclusivity_and_max_concurrency(
+    researcher, writer
+):
+    import threading
+    import time
+
+    lock = threading.Lock()
+    running = defaultdict(int)
+    peaks = defaultdict(int)
+
+    def execute_task(task, context=None, tools=None):
+        with lock:
+            for key in (task.agent.role, "total"):
+                running[key] += 1
+                peaks[key] = max(peaks[key], running[key])
+        time.sleep(0.05)
+        with lock:
+            for key in (task.agent.role, "total"):
+                running[key] -= 1
+        return "ok"
+
+    def independent_task(agent, index):
+        return Task(
+            description=f"Task {index}",
+            expected_output="ok",
+            agent=agent,
+            context=[],
+        )
+
+    crew = Crew(
+        agents=[researcher, writer],
+        tasks=[independent_task(researcher, 0), independent_task(researcher, 1)],
+        process=Process.dag,
+    )
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        crew.kickoff()
+    assert peaks["Researcher"] == 1
+
+    peaks.clear()
+    crew = Crew(
+        agents=[researcher, writer],
+        tasks=[independent_task(researcher, 0), independent_task(writer, 1)],
+        process=Process.dag,
+        max_concurrency=1,
+    )
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        crew.kickoff()
+    assert peaks["total"] == 1
+
+
+def test_dag_process_skips_conditional_task_on_dependency_output(researcher, writer):
+    research = Task(
+        description="Research AI agents",
+        expected_output="Research notes",
+        agent=researcher,
+    )
+    review = ConditionalTask(
+        description="Review the research",
+        expected_output="Review",
+        agent=writer,
+        condition=lambda output: "needs review" in output.raw,
+    )
+    crew = Crew(
+        agents=[researcher, writer],
+        tasks=[research, review],
+        process=Process.dag,
+    )
+
+    with patch.object(Agent, "execute_task", return_value="all good") as execute:
+        result = crew.kickoff()
+
+    execute.assert_called_once()
+    assert result.tasks_output[1].raw == ""
+
+
+def test_dag_process_stops_other_tasks_when_one_fails(researcher, writer):
+    import time
+
+    from crewai.utilities.cancellation import raise_if_cancelled
+
+    steps = []
+
+    def execute_task(task, context=None, tools=None):
+        if task.agent is researcher:
+            time.sleep(0.1)
+            raise ValueError("research failed")
+        # A long agent loop, checking for cancellation at every step
+        for _ in range(100):
+            raise_if_cancelled()
+            steps.append(task)
+            time.sleep(0.05)
+        return "done"
+
+    tasks = [
+        Task(description="Research", expected_output="ok", agent=researcher, context=[]),
+        Task(description="Write", expected_output="ok", agent=writer, context=[]),
+    ]
+    crew = Crew(agents=[researcher, writer], tasks=tasks, process=Process.dag)
+
+    started_at = time.monotonic()
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        with pytest.raises(ValueError, match="research failed"):
+            crew.kickoff()
+
+    assert time.monotonic() - started_at < 1
+    assert len(steps) < 10
+
+
+@pytest.mark.asyncio
+async def test_dag_process_kickoff_async(researcher, writer):
+    import asyncio
+
+    both_started = asyncio.Event()
+    started = []
+
+    async def aexecute_task(task, context=None, tools=None):
+        started.append(task)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=5)
+        return f"{task.description} done"
+
+    tasks = [
+        Task(description="First", expected_output="ok", agent=researcher, context=[]),
+        Task(description="Second", expected_output="ok", agent=writer, context=[]),
+    ]
+    crew = Crew(agents=[researcher, writer], tasks=tasks, process=Process.dag)
+
+    with patch.object(Agent, "aexecute_task", side_effect=aexecute_task):
+        result = await crew.kickoff_async()
+
+    assert [output.raw for output in result.tasks_output] == [
+        "First done",
+        "Second done",
+    ]
+
+
+def test_crew_runs_async_tasks_on_its_own_bounded_pool(researcher, writer):
+    tasks = [
+        Task(
+            description=f"Async task {i}",
+            expected_output="ok",
+            agent=researcher,
+            async_execution=True,
+        )
+        for i in range(2)
+    ]
+    final = Task(description="Final task", expected_output="ok", agent=writer)
+    crew = Crew(
+        agents=[researcher, writer],
+        tasks=[*tasks, final],
+        max_async_workers=1,
+    )
+
+    with patch.object(Agent, "execute_task", return_value="ok"):
+        crew.kickoff()
+
+    metrics = crew.async_task_metrics
+    assert metrics.max_workers == 1
+    assert metrics.completed_tasks == 2
+    assert metrics.queue_depth == 0
+    with pytest.raises(RuntimeError):
+        crew._task_executor.submit(lambda: None)
+
+
+def test_kickoff_for_each_with_max_workers_runs_forks_in_parallel():
+    import threading
+
+    agent = Agent(
+        role="{topic} Researcher",
+        goal="Express hot takes on {topic}.",
+        backstory="You have a lot of experience with {topic}.",
+    )
+    task = Task(
+        description="Give me an analysis around {topic}.",
+        expected_output="1 bullet point about {topic} that's under 15 words.",
+        agent=agent,
+    )
+    crew = Crew(agents=[agent], tasks=[task])
+    barrier = threading.Barrier(2, timeout=5)
+
+    def execute_task(task, context=None, tools=None):
+        # Inputs of the first pair must run at the same time to pass
+        if "dog" in task.description or "cat" in task.description:
+            barrier.wait()
+        return task.description
+
+    inputs = [{"topic": "dog"}, {"topic": "cat"}, {"topic": "apple"}]
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        results = crew.kickoff_for_each(inputs=inputs, max_workers=2)
+
+    assert [result.raw for result in results] == [
+        "Give me an analysis around dog.",
+        "Give me an analysis around cat.",
+        "Give me an analysis around apple.",
+    ]
+    assert task.description == "Give me an analysis around {topic}."
+    assert task.output is None
+    assert isinstance(crew.usage_metrics, UsageMetrics)
+
+
+def test_kickoff_for_each_iter_forks_lazily():
+    agent = Agent(
+        role="{topic} Researcher",
+        goal="Express hot takes on {topic}.",
+        backstory="You have a lot of experience with {topic}.",
+    )
+    task = Task(
+        description="Give me an analysis around {topic}.",
+        expected_output="1 bullet point about {topic} that's under 15 words.",
+        agent=agent,
+    )
+    crew = Crew(agents=[agent], tasks=[task])
+    inputs = ({"topic": f"topic {i}"} for i in range(10))
+
+    with (
+        patch.object(Agent, "execute_task", return_value="ok"),
+        patch.object(Crew, "_fork", autospec=True, side_effect=Crew._fork) as fork,
+    ):
+        results = crew.kickoff_for_each_iter(inputs, max_workers=2)
+        index, output = next(results)
+        assert output.raw == "ok"
+        assert fork.call_count <= 3
+
+        remaining = dict(results)
+
+    assert sorted([index, *remaining]) == list(range(10))
+    assert fork.call_count == 10
+
+
+def test_crew_fork_shares_configuration_but_not_execution_state(researcher, writer):
+    research = Task(
+        description="Research {topic}",
+        expected_output="Notes",
+        agent=researcher,
+    )
+    article = Task(
+        description="Write about {topic}",
+        expected_output="Article",
+        agent=writer,
+        context=[research],
+    )
+    crew = Crew(agents=[researcher, writer], tasks=[research, article], max_rpm=10)
+
+    fork = crew._fork()
+
+    assert fork.id != crew.id
+    assert [agent.role for agent in fork.agents] == ["Researcher", "Senior Writer"]
+    assert fork.agents[0] is not researcher
+    assert fork.agents[0].tools is researcher.tools
+    assert fork.agents[0]._token_process is not researcher._token_process
+    assert fork.agents[0].tools_handler is not researcher.tools_handler
+    assert fork.agents[0].tools_results is not researcher.tools_results
+    assert fork.agents[0]._rpm_controller is crew._rpm_controller
+    assert fork.tasks[0].agent is fork.agents[0]
+    assert fork.tasks[1].context == [fork.tasks[0]]
+    assert article.context == [research]
+    assert fork._resume_checkpoints is not crew._resume_checkpoints
+    assert not fork._log_task_outputs
+
+
+def test_agent_fork_does_not_share_run_state():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    agent.tools_results.append({"result": "Notes", "result_as_answer": True})
+    agent._times_executed = 2
+
+    fork = agent._fork()
+    fork.tools_results.append({"result": "Other", "result_as_answer": True})
+
+    assert fork.tools_results == [{"result": "Other", "result_as_answer": True}]
+    assert agent.tools_results == [{"result": "Notes", "result_as_answer": True}]
+    assert fork._times_executed == 0
+    assert agent._times_executed == 2
+
+
+def test_crew_fork_shares_agent_rate_limiter():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher", max_rpm=5)
+    task = Task(description="Research", expected_output="Notes", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task])
+
+    fork = crew._fork()
+
+    assert agent._rpm_controller is not None
+    assert fork.agents[0]._rpm_controller is agent._rpm_controller
+
+
+def test_crew_fork_does_not_log_task_outputs(researcher):
+    task = Task(description="Research", expected_output="Notes", agent=researcher)
+    crew = Crew(agents=[researcher], tasks=[task])
+    fork = crew._fork()
+
+    with patch.object(TaskOutputStorageHandler, "update") as update, patch.object(
+        TaskOutputStorageHandler, "reset"
+    ) as reset, patch.object(
+        Agent, "execute_task", return_value="Notes"
+    ):
+        fork.kickoff()
+
+    update.assert_not_called()
+    reset.assert_not_called()
+
+
+def _build_topic_crew():
+    agent = Agent(
+        role="{topic} Researcher",
+        goal="Express hot takes on {topic}.",
+        backstory="You have a lot of experience with {topic}.",
+    )
+    task = Task(
+        description="Give me an analysis around {topic}.",
+        expected_output="1 bullet point about {topic} that's under 15 words.",
+        agent=agent,
+    )
+    return Crew(agents=[agent], tasks=[task])
+
+
+def test_kickoff_for_each_process_runs_inputs_in_worker_processes():
+    import os
+
+    def execute_task(task, context=None, tools=None):
+        task.agent._token_process.sum_prompt_tokens(10)
+        return f"{task.description} in {os.getpid()}"
+
+    crew = _build_topic_crew()
+    inputs = [{"topic": "dog"}, {"topic": "cat"}, {"topic": "apple"}]
+    # Worker processes are forked, so they inherit the patch
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        results = crew.kickoff_for_each_process(
+            inputs, processes=2, crew_factory=_build_topic_crew
+        )
+
+    assert [result.raw.split(" in ")[0] for result in results] == [
+        "Give me an analysis around dog.",
+        "Give me an analysis around cat.",
+        "Give me an analysis around apple.",
+    ]
+    assert all(result.raw.split(" in ")[1] != str(os.getpid()) for result in results)
+    assert crew.usage_metrics.prompt_tokens == 30
+
+
+def test_kickoff_for_each_process_requires_a_factory():
+    with pytest.raises(ValueError, match="crew_factory"):
+        _build_topic_crew().kickoff_for_each_process([{"topic": "dog"}])
+
+
+def test_replay_resumes_in_flight_task_from_checkpoint(researcher):
+    from crewai.tools import tool
+
+    lookups = []
+
+    @tool
+    def lookup(query: str) -> str:
+        """Look up a fact."""
+        lookups.append(query)
+        return "The sky is blue"
+
+    task = Task(
+        description="Find out the color of the sky",
+        expected_output="A color",
+        agent=researcher,
+        tools=[lookup],
+    )
+    crew = Crew(agents=[researcher], tasks=[task])
+    action = (
+        "Thought: I should look it up\n"
+        "Action: lookup\n"
+        'Action Input: {"query": "sky color"}'
+    )
+
+    responses = iter([action])
+
+    def crash_after_first_step(messages, **kwargs):
+        response = next(responses, None)
+        if response is None:
+            raise RuntimeError("process killed")
+        return response
+
+    with patch.object(LLM, "call", side_effect=crash_after_first_step):
+        with pytest.raises(RuntimeError):
+            crew.kickoff()
+
+    checkpoints = crew._task_output_handler.load_checkpoints()
+    assert [c["task_id"] for c in checkpoints] == [str(task.id)]
+    assert checkpoints[0]["iterations"] == 1
+    assert checkpoints[0]["tool_results"][0]["result"] == "The sky is blue"
+
+    replayed_messages = []
+
+    def final_answer(messages, **kwargs):
+        replayed_messages.extend(messages)
+        return "Thought: I know it\nFinal Answer: Blue"
+
+    with patch.object(LLM, "call", side_effect=final_answer) as call:
+        result = crew.replay(str(task.id))
+
+    assert result.raw == "Blue"
+    call.assert_called_once()
+    assert lookups == ["sky color"]
+    assert any("The sky is blue" in m["content"] for m in replayed_messages)
+    assert crew._task_output_handler.load_checkpoints() == []
+
+
+def test_replay_resumes_checkpoint_on_a_freshly_built_crew():
+    from crewai.tools import tool
+
+    lookups = []
+
+    @tool
+    def lookup(query: str) -> str:
+        """Look up a fact."""
+        lookups.append(query)
+        return "The sky is blue"
+
+    def build_crew():
+        agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+        task = Task(
+            description="Find out the color of the sky",
+            expected_output="A color",
+            agent=agent,
+            tools=[lookup],
+        )
+        return Crew(agents=[agent], tasks=[task]), task
+
+    crew, task = build_crew()
+    action = (
+        "Thought: I should look it up\n"
+        "Action: lookup\n"
+        'Action Input: {"query": "sky color"}'
+    )
+    responses = iter([action])
+
+    def crash_after_first_step(messages, **kwargs):
+        response = next(responses, None)
+        if response is None:
+            raise RuntimeError("process killed")
+        return response
+
+    with patch.object(LLM, "call", side_effect=crash_after_first_step):
+        with pytest.raises(RuntimeError):
+            crew.kickoff()
+
+    fresh_crew, fresh_task = build_crew()
+    replayed_messages = []
+
+    def final_answer(messages, **kwargs):
+        replayed_messages.extend(messages)
+        return "Thought: I know it\nFinal Answer: Blue"
+
+    with patch.object(LLM, "call", side_effect=final_answer) as call:
+        result = fresh_crew.replay(str(task.id))
+
+    assert result.raw == "Blue"
+    call.assert_called_once()
+    assert lookups == ["sky color"]
+    assert fresh_task.agent.crew is fresh_crew
+    assert any("The sky is blue" in m["content"] for m in replayed_messages)
+    assert fresh_crew._task_output_handler.load_checkpoints() == []
+
+
+def _build_streaming_crew():
+    from crewai.llms.base_llm import BaseLLM
+    from crewai.utilities.events import crewai_event_bus
+    from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+    from crewai.utilities.events.task_events import TaskStartedEvent
+
+    other_task = Task(description="Unrelated", expected_output="Nothing")
+
+    class ChunkingLLM(BaseLLM):
+        def __init__(self):
+            super().__init__(model="chunking-model")
+
+        def call(
+            self,
+            messages,
+            tools=None,
+            callbacks=None,
+            available_functions=None,
+            from_task=None,
+            from_agent=None,
+        ):
+            # Events of other crews must not leak into the stream
+            crewai_event_bus.emit(
+                other_task, TaskStartedEvent(context=None, task=other_task)
+            )
+            for chunk in ["Final Answer: ", from_task.description]:
+                crewai_event_bus.emit(
+                    self, LLMStreamChunkEvent(chunk=chunk, from_task=from_task)
+                )
+            return f"Final Answer: {from_task.description}"
+
+    writer = Agent(
+        role="Writer", goal="Write", backstory="Writes", llm=ChunkingLLM()
+    )
+    tasks = [
+        Task(description=description, expected_output="Text", agent=writer)
+        for description in ["Outline", "Draft"]
+    ]
+    return Crew(agents=[writer], tasks=tasks)
+
+
+def _stream_summary(items):
+    return [
+        (item.type, getattr(item, "chunk", None))
+        if not isinstance(item, CrewOutput)
+        else ("crew_output", item.raw)
+        for item in items
+    ]
+
+
+EXPECTED_STREAM = [
+    ("task_started", None),
+    ("llm_stream_chunk", "Final Answer: "),
+    ("llm_stream_chunk", "Outline"),
+    ("task_completed", None),
+    ("task_started", None),
+    ("llm_stream_chunk", "Final Answer: "),
+    ("llm_stream_chunk", "Draft"),
+    ("task_completed", None),
+    ("crew_output", "Draft"),
+]
+
+
+def test_kickoff_stream_yields_progress_of_its_own_kickoff():
+    items = list(_build_streaming_crew().kickoff_stream())
+
+    assert _stream_summary(items) == EXPECTED_STREAM
+    assert items[3].output.raw == "Outline"
+
+
+@pytest.mark.asyncio
+async def test_kickoff_stream_async_yields_progress_of_its_own_kickoff():
+    items = [item async for item in _build_streaming_crew().kickoff_stream_async()]
+
+    assert _stream_summary(items) == EXPECTED_STREAM
+
+
+def test_closing_kickoff_stream_cancels_the_kickoff():
+    crew = _build_streaming_crew()
+    stream = crew.kickoff_stream()
+
+    assert next(stream).type == "task_started"
+    stream.close()
+
+    assert crew._cancellation_token.cancelled
+
+
+def _build_speculative_crew(condition, context=[]):
+    import time
+
+    events = []
+
+    def execute_task(agent, task, context=None, tools=None):
+        events.append(("start", task.description))
+        time.sleep(0.2)
+        events.append(("end", task.description))
+        return f"{task.description} done"
+
+    researcher = Agent(role="Researcher", goal="Research", backstory="Curious")
+    writer = Agent(role="Writer", goal="Write", backstory="Eloquent")
+    callback = MagicMock()
+    research = Task(description="Research", expected_output="Notes", agent=researcher)
+    follow_up = ConditionalTask(
+        description="Follow up",
+        expected_output="Text",
+        agent=writer,
+        condition=condition,
+        context=context,
+        speculative=True,
+        callback=callback,
+    )
+    crew = Crew(agents=[researcher, writer], tasks=[research, follow_up])
+    return crew, execute_task, events, callback
+
+
+def test_speculative_conditional_task_runs_alongside_its_predecessor():
+    crew, execute_task, events, callback = _build_speculative_crew(lambda _: True)
+
+    with patch.object(Agent, "execute_task", autospec=True, side_effect=execute_task):
+        result = crew.kickoff()
+
+    assert events.index(("start", "Follow up")) < events.index(("end", "Research"))
+    assert result.raw == "Follow up done"
+    callback.assert_called_once()
+
+
+def test_speculative_conditional_task_is_discarded_when_condition_fails():
+    crew, execute_task, events, callback = _build_speculative_crew(lambda _: False)
+
+    with patch.object(
+        Agent, "execute_task", autospec=True, side_effect=execute_task
+    ) as execute:
+        result = crew.kickoff()
+
+    assert execute.call_count == 2
+    assert result.tasks_output[1].raw == ""
+    callback.assert_not_called()
+
+
+def test_conditional_task_depending_on_its_predecessor_is_not_speculated():
+    crew, execute_task, events, _ = _build_speculative_crew(
+        lambda _: False, context=NOT_SPECIFIED
+    )
+
+    with patch.object(
+        Agent, "execute_task", autospec=True, side_effect=execute_task
+    ) as execute:
+        crew.kickoff()
+
+    execute.assert_called_once()
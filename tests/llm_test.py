@@ -1,12 +1,16 @@
 import os
+import time
 from time import sleep
 from unittest.mock import MagicMock, patch
 
 import pytest
+from litellm.types.utils import ChatCompletionDeltaToolCall, Function
 from pydantic import BaseModel
 
 from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
 from crewai.llm import CONTEXT_WINDOW_USAGE_RATIO, LLM
+from crewai.llms.base_llm import BaseLLM
+from crewai.llms.capabilities import ModelCapabilityRegistry
 from crewai.utilities.events import (
     LLMCallCompletedEvent,
     LLMStreamChunkEvent,
@@ -664,3 +668,636 @@ def test_handle_streaming_tool_calls_no_tools(mock_emit):
         expected_completed_llm_call=1,
         expected_final_chunk_result=response,
     )
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_uses_acompletion():
+    llm = LLM(model="gpt-4o-mini")
+
+    mock_message = MagicMock()
+    mock_message.content = "Async response"
+    mock_message.tool_calls = []
+    mock_choice = MagicMock()
+    mock_choice.message = mock_message
+    mock_response = MagicMock()
+    mock_response.choices = [mock_choice]
+    mock_response.usage = None
+
+    with patch("litellm.acompletion", return_value=mock_response) as mocked_acompletion, patch(
+        "litellm.completion"
+    ) as mocked_completion:
+        result = await llm.acall("Hello, world!")
+
+    assert result == "Async response"
+    mocked_acompletion.assert_awaited_once()
+    mocked_completion.assert_not_called()
+    assert mocked_acompletion.call_args.kwargs["messages"] == [
+        {"role": "user", "content": "Hello, world!"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_streaming_runs_tools_off_the_event_loop():
+    import threading
+
+    llm = LLM(model="gpt-4o-mini", stream=True)
+    loop_thread = threading.get_ident()
+    tool_threads = []
+
+    def get_weather(location):
+        tool_threads.append(threading.get_ident())
+        return f"Sunny in {location}"
+
+    tool_call = ChatCompletionDeltaToolCall(
+        index=0,
+        function=Function(name="get_weather", arguments='{"location": "Paris"}'),
+    )
+
+    async def chunks():
+        yield MagicMock(
+            choices=[MagicMock(delta={"content": None, "tool_calls": [tool_call]})],
+            usage=None,
+        )
+
+    with patch("litellm.acompletion", return_value=chunks()):
+        result = await llm.acall(
+            "Weather?", available_functions={"get_weather": get_weather}
+        )
+
+    assert result == "Sunny in Paris"
+    assert tool_threads and tool_threads[0] != loop_thread
+
+
+class _EchoLLM(BaseLLM):
+    def __init__(self):
+        super().__init__(model="echo")
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, from_task=None, from_agent=None):
+        content = messages if isinstance(messages, str) else messages[-1]["content"]
+        if content == "boom":
+            raise ValueError("boom")
+        sleep(0.01 * (3 - int(content)) if content.isdigit() else 0)
+        return f"echo {content}"
+
+
+def test_batch_call_preserves_order_and_reports_failures():
+    llm = _EchoLLM()
+
+    result = llm.batch_call(["0", "1", "boom", "2"], max_concurrency=3)
+
+    assert result.responses == ["echo 0", "echo 1", None, "echo 2"]
+    assert list(result.errors) == [2]
+    assert isinstance(result.errors[2], ValueError)
+    with pytest.raises(ValueError, match="boom"):
+        result.raise_first_error()
+
+
+@pytest.mark.asyncio
+async def test_abatch_call_preserves_order_and_reports_failures():
+    llm = _EchoLLM()
+
+    result = await llm.abatch_call(["0", "boom", "1"], max_concurrency=2)
+
+    assert result.responses == ["echo 0", None, "echo 1"]
+    assert list(result.errors) == [1]
+
+
+def test_batch_call_aggregates_token_usage_once():
+    llm = LLM(model="gpt-4o-mini")
+    token_process = TokenProcess()
+
+    mock_message = MagicMock()
+    mock_message.content = "Summary"
+    mock_message.tool_calls = []
+    mock_choice = MagicMock()
+    mock_choice.message = mock_message
+    mock_response = MagicMock()
+    mock_response.choices = [mock_choice]
+    mock_response.usage = MagicMock(
+        prompt_tokens=5, completion_tokens=3, prompt_tokens_details=None
+    )
+
+    rpm_controller = MagicMock()
+
+    with patch("litellm.completion", return_value=mock_response):
+        result = llm.batch_call(
+            ["a", "b", "c"],
+            callbacks=[TokenCalcHandler(token_process, rpm_controller)],
+        )
+
+    assert result.responses == ["Summary"] * 3
+    assert result.usage.successful_requests == 3
+    assert result.usage.total_tokens == 24
+    assert token_process.successful_requests == 3
+    assert token_process.prompt_tokens == 15
+    assert token_process.completion_tokens == 9
+    rpm_controller.record_tokens.assert_called_once_with(24)
+
+
+def test_batch_call_workers_keep_the_callers_cancellation_token():
+    from crewai.utilities.cancellation import (
+        CancellationToken,
+        cancellation_scope,
+        raise_if_cancelled,
+    )
+
+    class CheckingLLM(_EchoLLM):
+        def call(self, messages, **kwargs):
+            raise_if_cancelled()
+            return super().call(messages, **kwargs)
+
+    token = CancellationToken()
+    token.cancel("stop")
+    with cancellation_scope(token):
+        result = CheckingLLM().batch_call(["0", "1"])
+
+    assert result.responses == [None, None]
+    assert all("stop" in str(error) for error in result.errors.values())
+
+
+def test_summarize_messages_batches_groups():
+    from crewai.utilities import I18N
+    from crewai.utilities.agent_utils import summarize_messages
+
+    llm = _EchoLLM()
+    llm.get_context_window_size = lambda: 10
+    messages = [{"role": "user", "content": "x" * 25}]
+
+    with patch.object(
+        _EchoLLM, "batch_call", wraps=llm.batch_call
+    ) as mock_batch_call:
+        summarize_messages(messages, llm=llm, callbacks=[], i18n=I18N())
+
+    mock_batch_call.assert_called_once()
+    assert len(mock_batch_call.call_args.args[0]) == 3
+    assert len(messages) == 1
+
+
+def _content_chunks(pieces, consumed):
+    for piece in pieces:
+        consumed.append(piece)
+        yield {"choices": [{"delta": {"content": piece}}]}
+
+
+def test_streaming_stops_once_react_action_is_complete():
+    llm = LLM(model="gpt-4o-mini", stream=True)
+    llm.stop = ["\nObservation:"]
+    pieces = [
+        "Thought: I should search\nAction: search\n",
+        'Action Input: {"query": "a}',
+        '"}',
+        "\nObservation: made up",
+    ]
+    consumed = []
+
+    with patch(
+        "litellm.completion", return_value=_content_chunks(pieces, consumed)
+    ):
+        result = llm.call("Hello", from_agent=MagicMock())
+
+    assert result == (
+        'Thought: I should search\nAction: search\nAction Input: {"query": "a}"}'
+    )
+    assert len(consumed) == 3
+
+
+def test_streaming_cuts_final_answer_at_stop_word():
+    llm = LLM(model="gpt-4o-mini", stream=True)
+    llm.stop = ["\nObservation:"]
+    pieces = ["Thought: done\nFinal Answer: 42", "\nObservation:", " never read"]
+    consumed = []
+
+    with patch(
+        "litellm.completion", return_value=_content_chunks(pieces, consumed)
+    ):
+        result = llm.call("Hello", from_agent=MagicMock())
+
+    assert result == "Thought: done\nFinal Answer: 42"
+    assert len(consumed) == 2
+
+
+@pytest.fixture
+def capability_registry():
+    registry = ModelCapabilityRegistry()
+    with patch("crewai.llm.model_capability_registry", registry):
+        yield registry
+
+
+def test_capabilities_are_computed_once_per_deployment(capability_registry):
+    with patch(
+        "crewai.llm.get_supported_openai_params", return_value=["stop"]
+    ) as supported_params:
+        assert LLM(model="gpt-4o-mini").supports_stop_words()
+        assert LLM(model="gpt-4o-mini").supports_stop_words()
+        supported_params.assert_called_once()
+
+        LLM(model="gpt-4o-mini", base_url="http://proxy").supports_stop_words()
+        assert supported_params.call_count == 2
+
+
+def test_capability_overrides_take_precedence(capability_registry, tmp_path):
+    capabilities_file = tmp_path / "capabilities.json"
+    capabilities_file.write_text(
+        '[{"model": "my-model", "supports_stop_words": false, "context_window": 10000}]'
+    )
+    capability_registry.load(capabilities_file)
+    capability_registry.override(
+        "my-model", base_url="http://fast", context_window=20000
+    )
+
+    with patch("crewai.llm.get_supported_openai_params") as supported_params:
+        assert LLM(model="my-model").supports_stop_words() is False
+        supported_params.assert_not_called()
+
+    assert LLM(model="my-model").get_context_window_size() == int(
+        10000 * CONTEXT_WINDOW_USAGE_RATIO
+    )
+    assert LLM(
+        model="my-model", base_url="http://fast"
+    ).get_context_window_size() == int(20000 * CONTEXT_WINDOW_USAGE_RATIO)
+
+
+def test_capability_computation_does_not_block_other_keys(capability_registry):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    first_started = threading.Event()
+    release_first = threading.Event()
+    computed = []
+
+    def slow_compute():
+        computed.append("slow")
+        first_started.set()
+        release_first.wait(5)
+        return True
+
+    slow_key = ("slow-model", None, None)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        slow = executor.submit(
+            capability_registry.resolve, slow_key, "supports_stop_words", slow_compute
+        )
+        assert first_started.wait(5)
+        waiting = executor.submit(
+            capability_registry.resolve, slow_key, "supports_stop_words", slow_compute
+        )
+        other = executor.submit(
+            capability_registry.resolve,
+            ("fast-model", None, None),
+            "supports_stop_words",
+            lambda: False,
+        )
+        assert other.result(timeout=5) is False
+        assert not waiting.done()
+
+        release_first.set()
+        assert slow.result(timeout=5) is True
+        assert waiting.result(timeout=5) is True
+
+    assert computed == ["slow"]
+
+
+def test_anthropic_prompt_prefix_is_marked_for_caching():
+    anthropic_llm = LLM(model="anthropic/claude-3-sonnet", prompt_caching=True)
+    messages = [
+        {"role": "system", "content": "You are a researcher."},
+        {"role": "user", "content": "Current Task: research"},
+        {"role": "assistant", "content": "Thought: searching\nObservation: done"},
+    ]
+
+    params = anthropic_llm._prepare_completion_params(messages)
+
+    system, task, last = params["messages"][1:]
+    assert system["content"] == [
+        {
+            "type": "text",
+            "text": "You are a researcher.",
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+    assert task == messages[1]
+    assert last["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert messages[0]["content"] == "You are a researcher."
+
+
+def test_prompt_caching_is_opt_in_and_skips_other_providers(system_message):
+    anthropic_llm = LLM(model="anthropic/claude-3-sonnet")
+    openai_llm = LLM(model="gpt-4o", prompt_caching=True)
+
+    assert anthropic_llm._prepare_completion_params([system_message])["messages"][
+        1
+    ] == system_message
+    assert openai_llm._prepare_completion_params([system_message])["messages"] == [
+        system_message
+    ]
+
+
+def test_token_calc_handler_tracks_prompt_cache_usage():
+    from litellm.types.utils import Usage
+
+    token_process = TokenProcess()
+    handler = TokenCalcHandler(token_process)
+    handler.log_success_event(
+        kwargs={},
+        response_obj={
+            "usage": Usage(
+                prompt_tokens=100,
+                completion_tokens=10,
+                total_tokens=110,
+                cache_creation_input_tokens=20,
+                cache_read_input_tokens=70,
+            )
+        },
+        start_time=0,
+        end_time=0,
+    )
+
+    summary = token_process.get_summary()
+    assert summary.cached_prompt_tokens == 70
+    assert summary.cache_creation_prompt_tokens == 20
+
+
+def _text_response(content):
+    mock_message = MagicMock()
+    mock_message.content = content
+    mock_message.tool_calls = []
+    mock_choice = MagicMock()
+    mock_choice.message = mock_message
+    mock_response = MagicMock()
+    mock_response.choices = [mock_choice]
+    mock_response.usage = None
+    return mock_response
+
+
+def test_llm_falls_back_in_order_on_failure():
+    failing_fallback = LLM(model="gpt-4o")
+    llm = LLM(model="gpt-4o-mini", fallbacks=[failing_fallback, _EchoLLM()])
+
+    with patch("litellm.completion", side_effect=RuntimeError("provider down")) as completion:
+        assert llm.call("1") == "echo 1"
+
+    assert [c.kwargs["model"] for c in completion.call_args_list] == [
+        "gpt-4o-mini",
+        "gpt-4o",
+    ]
+
+
+def test_llm_does_not_fall_back_on_context_window_errors():
+    from litellm.exceptions import ContextWindowExceededError
+
+    from crewai.utilities.exceptions.context_window_exceeding_exception import (
+        LLMContextLengthExceededException,
+    )
+
+    llm = LLM(model="gpt-4o-mini", fallbacks=[_EchoLLM()])
+
+    with patch(
+        "litellm.completion",
+        side_effect=ContextWindowExceededError(
+            "context length exceeded", model="gpt-4o-mini", llm_provider="openai"
+        ),
+    ):
+        with pytest.raises(LLMContextLengthExceededException):
+            llm.call("1")
+
+
+def test_llm_hedges_slow_requests():
+    llm = LLM(model="gpt-4o-mini", hedge_llm=_EchoLLM(), hedge_after=0.05)
+
+    def slow_completion(**kwargs):
+        sleep(0.5)
+        return _text_response("primary")
+
+    with patch("litellm.completion", side_effect=slow_completion):
+        assert llm.call("2") == "echo 2"
+
+
+def test_hedged_calls_are_not_queued_behind_each_other():
+    from concurrent.futures import ThreadPoolExecutor
+
+    # The hedge model is hedged as well, and the losing requests keep running
+    inner = LLM(model="gpt-4o-mini", hedge_llm=_EchoLLM(), hedge_after=0.05)
+    llm = LLM(model="gpt-4o-mini", hedge_llm=inner, hedge_after=0.05)
+
+    def slow_completion(**kwargs):
+        sleep(1)
+        return _text_response("primary")
+
+    with patch("litellm.completion", side_effect=slow_completion):
+        started_at = time.monotonic()
+        with ThreadPoolExecutor(max_workers=40) as executor:
+            results = list(executor.map(llm.call, ["2"] * 40))
+        elapsed = time.monotonic() - started_at
+
+    assert results == ["echo 2"] * 40
+    assert elapsed < 0.9
+
+
+def test_llm_does_not_hedge_calls_that_may_run_tools():
+    hedge_llm = MagicMock()
+    llm = LLM(model="gpt-4o-mini", hedge_llm=hedge_llm, hedge_after=0.01)
+
+    def slow_completion(**kwargs):
+        sleep(0.1)
+        return _text_response("primary")
+
+    with patch("litellm.completion", side_effect=slow_completion):
+        result = llm.call("2", available_functions={"lookup": lambda: "found"})
+
+    assert result == "primary"
+    hedge_llm.call.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_cancels_losing_hedged_request():
+    import asyncio
+
+    cancelled = asyncio.Event()
+
+    async def slow_acompletion(**kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return _text_response("primary")
+
+    llm = LLM(model="gpt-4o-mini", hedge_llm=_EchoLLM(), hedge_after=0.05)
+
+    with patch("litellm.acompletion", side_effect=slow_acompletion):
+        assert await llm.acall("2") == "echo 2"
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+def test_hedge_delay_follows_latency_percentile():
+    llm = LLM(
+        model="gpt-4o-mini",
+        hedge_llm=_EchoLLM(),
+        hedge_after=1.0,
+        hedge_percentile=90,
+    )
+    assert llm._hedge_delay() == 1.0
+
+    llm._latencies.extend(0.1 * i for i in range(1, 21))
+    assert llm._hedge_delay() == pytest.approx(1.9)
+
+
+def _usage_response(content, prompt_tokens, completion_tokens):
+    from litellm.types.utils import Usage
+
+    response = _text_response(content)
+    response.usage = Usage(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+    )
+    return response
+
+
+def test_llm_call_does_not_mutate_litellm_callbacks():
+    import litellm
+
+    llm = LLM(model="gpt-4o-mini")
+    handler = TokenCalcHandler(token_cost_process=TokenProcess())
+    callbacks_before = list(litellm.callbacks)
+    success_callbacks_before = list(litellm.success_callback)
+
+    with patch("litellm.completion", return_value=_usage_response("hi", 10, 5)):
+        llm.call("Hello", callbacks=[handler])
+
+    assert litellm.callbacks == callbacks_before
+    assert litellm.success_callback == success_callbacks_before
+    assert handler.token_cost_process.get_summary().total_tokens == 15
+
+
+def test_concurrent_llm_calls_keep_usage_separate():
+    from concurrent.futures import ThreadPoolExecutor
+
+    llm = LLM(model="gpt-4o-mini")
+
+    def completion(**kwargs):
+        sleep(0.05)
+        prompt = kwargs["messages"][-1]["content"]
+        return _usage_response(prompt, int(prompt), 1)
+
+    def call(prompt_tokens):
+        handler = TokenCalcHandler(token_cost_process=TokenProcess())
+        llm.call(str(prompt_tokens), callbacks=[handler])
+        return handler.token_cost_process.get_summary()
+
+    with patch("litellm.completion", side_effect=completion):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            summaries = list(executor.map(call, [10, 20, 30, 40]))
+
+    assert [s.prompt_tokens for s in summaries] == [10, 20, 30, 40]
+    assert all(s.successful_requests == 1 for s in summaries)
+
+
+def test_llm_call_attributes_usage_to_agent_once(mock_emit):
+    agent = MagicMock()
+    agent._token_process = TokenProcess()
+    llm = LLM(model="gpt-4o-mini")
+
+    with patch("litellm.completion", return_value=_usage_response("hi", 10, 5)):
+        llm.call("Hello", from_agent=agent)
+        llm.call(
+            "Hello",
+            callbacks=[TokenCalcHandler(agent._token_process)],
+            from_agent=agent,
+        )
+
+    summary = agent._token_process.get_summary()
+    assert summary.successful_requests == 2
+    assert summary.total_tokens == 30
+
+    completed = [
+        call.kwargs["event"]
+        for call in mock_emit.call_args_list
+        if isinstance(call.kwargs["event"], LLMCallCompletedEvent)
+    ]
+    assert [event.usage.total_tokens for event in completed] == [15, 15]
+
+
+def _tool_call(name, arguments):
+    tool_call = MagicMock()
+    tool_call.function.name = name
+    tool_call.function.arguments = arguments
+    return tool_call
+
+
+def test_llm_runs_all_tool_calls_of_a_turn_concurrently():
+    from crewai.tools import tool
+
+    def search(query: str) -> str:
+        sleep(0.3)
+        return f"results for {query}"
+
+    @tool("fetch", max_concurrency=1)
+    def fetch(url: str) -> str:
+        """Fetch a page."""
+        sleep(0.2)
+        return f"page at {url}"
+
+    llm = LLM(model="gpt-4o-mini")
+    tool_calls = [
+        _tool_call("search", '{"query": "ai"}'),
+        _tool_call("fetch", '{"url": "a"}'),
+        _tool_call("fetch", '{"url": "b"}'),
+        _tool_call("missing", "{}"),
+    ]
+
+    started_at = time.monotonic()
+    result = llm._handle_tool_call(
+        tool_calls, available_functions={"search": search, "fetch": fetch.run}
+    )
+    elapsed = time.monotonic() - started_at
+
+    # search overlaps with both fetches, which share a single slot
+    assert 0.4 <= elapsed < 0.6
+    assert result.index("results for ai") < result.index("page at a")
+    assert result.index("page at a") < result.index("page at b")
+    assert "Error: tool 'missing' is not available" in result
+    assert llm._handle_tool_call(
+        tool_calls[:1], available_functions={"search": search}
+    ) == "results for ai"
+
+
+def test_llm_call_runs_native_tool_calls_only_with_available_functions():
+    ran = []
+
+    def search(query: str) -> str:
+        ran.append(query)
+        return f"results for {query}"
+
+    response = _text_response("Let me search")
+    response.choices[0].message.tool_calls = [
+        _tool_call("search", '{"query": "ai"}'),
+        _tool_call("search", '{"query": "ml"}'),
+    ]
+    llm = LLM(model="gpt-4o-mini")
+
+    with patch("litellm.completion", return_value=response):
+        assert llm.call("Search") == "Let me search"
+        assert ran == []
+
+        result = llm.call("Search", available_functions={"search": search})
+
+    assert sorted(ran) == ["ai", "ml"]
+    assert result.index("results for ai") < result.index("results for ml")
+
+
+def test_streaming_closes_stream_cut_short():
+    llm = LLM(model="gpt-4o-mini", stream=True)
+    llm.stop = ["\nObservation:"]
+    stream = MagicMock()
+    stream.__iter__.return_value = iter(
+        [
+            {"choices": [{"delta": {"content": "Thought: done\nFinal Answer: 42"}}]},
+            {"choices": [{"delta": {"content": "\nObservation:"}}]},
+        ]
+    )
+
+    with patch("litellm.completion", return_value=stream):
+        result = llm.call("Hello", from_agent=MagicMock())
+
+    assert result == "Thought: done\nFinal Answer: 42"
+    stream.close.assert_called_once()
@@ -270,4 +270,18 @@ def test_internal_crew_with_mcp():
         assert crew.reporting_analyst().tools == [simple_tool, another_simple_tool]
         assert crew.researcher().tools == [simple_tool]
 
-    adapter_mock.assert_called_once_with({"host": "localhost", "port": 8000})
\ No newline at end of file
+    adapter_mock.assert_called_once_with({"host": "localhost", "port": 8000})
+
+def test_crew_base_crew_can_be_rebuilt_from_its_factory():
+    import pickle
+
+    crew = InternalCrew().crew()
+    factory = pickle.loads(pickle.dumps(crew._factory))
+
+    rebuilt = factory()
+
+    assert rebuilt is not crew
+    assert [task.description for task in rebuilt.tasks] == [
+        task.description for task in crew.tasks
+    ]
+    assert len(rebuilt.before_kickoff_callbacks) == len(crew.before_kickoff_callbacks)
@@ -0,0 +1,96 @@
+from unittest.mock import patch
+
+import pytest
+
+from crewai import Agent, Task
+from crewai.llms.base_llm import BaseLLM
+from crewai.llms.replay_llm import ReplayLLM
+
+AGENT_EXECUTION_CASSETTE = "tests/cassettes/test_agent_execution.yaml"
+
+
+class EchoLLM(BaseLLM):
+    def __init__(self):
+        super().__init__(model="echo-model")
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+    ):
+        return f"echo: {messages[-1]['content']}"
+
+
+def test_replay_llm_replays_vcr_cassette_offline():
+    llm = ReplayLLM(AGENT_EXECUTION_CASSETTE)
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        allow_delegation=False,
+        llm=llm,
+    )
+    task = Task(
+        description="How much is 1 + 1?",
+        agent=agent,
+        expected_output="the result of the math operation.",
+    )
+
+    with patch("litellm.completion") as mocked_completion:
+        output = agent.execute_task(task)
+
+    mocked_completion.assert_not_called()
+    assert output == "1 + 1 is 2"
+    assert llm.model == "gpt-4o"
+    assert agent._token_process.get_summary().total_tokens == 184
+
+
+def test_replay_llm_injects_latency():
+    llm = ReplayLLM(AGENT_EXECUTION_CASSETTE, latency=0.25)
+
+    with patch("crewai.llms.replay_llm.time.sleep") as sleep:
+        llm.call("Unrecorded prompt")
+
+    sleep.assert_called_once_with(0.25)
+
+
+def test_replay_llm_strict_mode_rejects_unknown_calls():
+    llm = ReplayLLM(AGENT_EXECUTION_CASSETTE, strict=True)
+
+    with pytest.raises(ValueError):
+        llm.call("Unrecorded prompt")
+
+
+def test_replay_llm_records_and_replays(tmp_path):
+    cassette = str(tmp_path / "echo.yaml")
+    recorder = ReplayLLM(cassette, llm=EchoLLM(), record=True)
+    assert recorder.call("first") == "echo: first"
+    assert recorder.call("second") == "echo: second"
+
+    player = ReplayLLM(cassette, latency="recorded", strict=True)
+    assert player.model == "echo-model"
+    assert player.call("second") == "echo: second"
+    assert player.call("first") == "echo: first"
+
+
+def test_replay_llm_appends_recordings_to_an_existing_cassette(tmp_path):
+    import shutil
+
+    cassette = str(tmp_path / "agent.yaml")
+    shutil.copy(AGENT_EXECUTION_CASSETTE, cassette)
+    recorded = len(ReplayLLM(cassette)._interactions)
+
+    ReplayLLM(cassette, llm=EchoLLM(), record=True).call("first")
+    recorder = ReplayLLM(cassette, llm=EchoLLM(), record=True)
+    recorder.call("second")
+    with patch.object(ReplayLLM, "_prepare_cassette") as prepare:
+        recorder.call("third")
+    prepare.assert_not_called()
+
+    player = ReplayLLM(cassette, strict=True)
+    assert len(player._interactions) == recorded + 3
+    assert player.call("third") == "echo: third"
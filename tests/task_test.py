@@ -206,6 +206,27 @@ def test_async_execution():
         execute.assert_called_once_with(task=task, context=None, tools=[])
 
 
+def test_async_execution_propagates_exceptions():
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
+        allow_delegation=False,
+    )
+
+    task = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        async_execution=True,
+        agent=researcher,
+    )
+
+    with patch.object(Agent, "execute_task", side_effect=RuntimeError("boom")):
+        execution = task.execute_async(agent=researcher)
+        with pytest.raises(RuntimeError, match="boom"):
+            execution.result(timeout=5)
+
+
 def test_multiple_output_type_error():
     class Output(BaseModel):
         field: str
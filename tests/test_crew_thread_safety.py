@@ -129,7 +129,7 @@ class TestCrewThreadSafety:
             ), f"Should run in thread pool for {result['crew_id']}"
 
     @pytest.mark.asyncio
-    @patch("crewai.Agent.execute_task")
+    @patch("crewai.Agent.aexecute_task")
     async def test_async_crews_thread_safety(self, mock_execute_task, crew_factory):
         mock_execute_task.return_value = "Task completed"
         num_crews = 5
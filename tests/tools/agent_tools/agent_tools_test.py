@@ -1,9 +1,18 @@
 """Test Agent creation and execution basic functionality."""
 
+import threading
+import time
+from unittest.mock import patch
+
 import pytest
 
 from crewai.agent import Agent
+from crewai.crew import Crew
+from crewai.process import Process
+from crewai.task import Task
+from crewai.tasks.task_output import TaskOutput
 from crewai.tools.agent_tools.agent_tools import AgentTools
+from crewai.tools.agent_tools.delegate_work_batch_tool import DelegateWorkBatchTool
 
 researcher = Agent(
     role="researcher",
@@ -131,3 +140,79 @@ def test_ask_question_to_wrong_agent():
         result
         == "\nError executing tool. coworker mentioned not found, it must be one of the following options:\n- researcher\n"
     )
+
+
+def test_delegate_work_batch_runs_coworkers_in_parallel():
+    writer = Agent(
+        role="writer",
+        goal="write engaging articles",
+        backstory="You're a seasoned writer",
+        allow_delegation=False,
+    )
+    batch_tool = AgentTools(
+        agents=[researcher, writer], parallel_delegation=True
+    ).tools()[2]
+    assert isinstance(batch_tool, DelegateWorkBatchTool)
+
+    running = set()
+    overlaps = []
+    lock = threading.Lock()
+
+    def execute_task(agent, task, context=None, tools=None):
+        with lock:
+            assert agent.role not in running
+            running.add(agent.role)
+            overlaps.append(len(running))
+        time.sleep(0.2)
+        with lock:
+            running.discard(agent.role)
+        return f"{agent.role} did: {task.description}"
+
+    with patch.object(Agent, "execute_task", autospec=True, side_effect=execute_task):
+        started_at = time.monotonic()
+        result = batch_tool.run(
+            delegations=[
+                {"coworker": "researcher", "task": "find sources", "context": "AI"},
+                {"coworker": "writer", "task": "draft intro", "context": "AI"},
+                {"coworker": "Researcher", "task": "check facts", "context": "AI"},
+            ]
+        )
+        elapsed = time.monotonic() - started_at
+
+    assert max(overlaps) == 2
+    assert elapsed < 0.55
+    assert result.index("researcher did: find sources") < result.index(
+        "writer did: draft intro"
+    )
+    assert result.index("writer did: draft intro") < result.index(
+        "researcher did: check facts"
+    )
+
+
+def test_hierarchical_crew_with_parallel_delegation_gives_manager_batch_tool():
+    writer = Agent(
+        role="writer",
+        goal="write engaging articles",
+        backstory="You're a seasoned writer",
+    )
+    task = Task(description="Write an article", expected_output="An article")
+    crew = Crew(
+        agents=[researcher, writer],
+        tasks=[task],
+        process=Process.hierarchical,
+        manager_llm="gpt-4o",
+        parallel_delegation=True,
+    )
+    output = TaskOutput(description="Write an article", raw="article", agent="manager")
+    task.output = output
+
+    with patch.object(Task, "execute_sync", return_value=output) as execute_sync:
+        crew.kickoff()
+
+    tool_names = [tool.name for tool in execute_sync.call_args.kwargs["tools"]]
+    assert "Delegate work to coworkers in parallel" in tool_names
+    assert "Delegate work to coworker" in tool_names
+    assert any(
+        tool.name == "Delegate work to coworkers in parallel"
+        for tool in crew.manager_agent.tools
+    )
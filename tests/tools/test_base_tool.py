@@ -192,3 +192,67 @@ def test_run_does_not_call_asyncio_run_for_sync_tools():
         mock_run.assert_not_called()
         assert sync_result == "Processed test synchronously"
 
+
+
+def test_async_tool_decorator_is_awaited_by_arun():
+    @tool("Async Lookup")
+    async def async_lookup(query: str) -> str:
+        """Look something up asynchronously."""
+        await asyncio.sleep(0)
+        return f"found {query}"
+
+    async def main():
+        return (
+            await async_lookup.arun(query="crewai"),
+            await async_lookup.to_structured_tool().ainvoke({"query": "agents"}),
+            # Sync runs from inside a running loop must not call asyncio.run on it
+            async_lookup.run(query="tools"),
+        )
+
+    assert asyncio.run(main()) == ("found crewai", "found agents", "found tools")
+
+
+def test_async_agent_loop_awaits_arun_and_offloads_sync_tools():
+    from crewai.agents.parser import AgentAction
+    from crewai.utilities.i18n import I18N
+    from crewai.utilities.tool_utils import aexecute_tool_and_check_finality
+
+    class NativeAsyncTool(BaseTool):
+        name: str = "Native Async"
+        description: str = "Runs natively on the event loop."
+
+        def _run(self, query: str) -> str:
+            raise AssertionError("the sync path should not be used")
+
+        async def _arun(self, query: str) -> str:
+            await asyncio.sleep(0)
+            return f"async {query}"
+
+    sync_tool = SyncTool()
+
+    def action(tool_name: str, tool_input: str) -> AgentAction:
+        return AgentAction(
+            thought="",
+            tool=tool_name,
+            tool_input=tool_input,
+            text=f"Action: {tool_name}\nAction Input: {tool_input}",
+        )
+
+    async def main():
+        tools = [NativeAsyncTool().to_structured_tool(), sync_tool.to_structured_tool()]
+        return await asyncio.gather(
+            aexecute_tool_and_check_finality(
+                agent_action=action("Native Async", '{"query": "hi"}'),
+                tools=tools,
+                i18n=I18N(),
+            ),
+            aexecute_tool_and_check_finality(
+                agent_action=action(sync_tool.name, '{"input_text": "hi"}'),
+                tools=tools,
+                i18n=I18N(),
+            ),
+        )
+
+    native, offloaded = asyncio.run(main())
+    assert native.result == "async hi"
+    assert offloaded.result == "Processed hi synchronously"
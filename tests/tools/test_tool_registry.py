@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+from crewai.agents.parser import AgentAction
+from crewai.tools import tool
+from crewai.tools.tool_registry import ToolRegistry
+from crewai.utilities.i18n import I18N
+from crewai.utilities.tool_utils import execute_tool_and_check_finality
+
+
+@tool("Web Search")
+def web_search(query: str) -> str:
+    """Search the web."""
+    return f"results for {query}"
+
+
+@tool("Read File")
+def read_file(path: str) -> str:
+    """Read a file."""
+    return f"contents of {path}"
+
+
+def _registry() -> ToolRegistry:
+    return ToolRegistry(
+        [web_search.to_structured_tool(), read_file.to_structured_tool()]
+    )
+
+
+def test_registry_selects_tools_by_exact_and_fuzzy_name():
+    registry = _registry()
+
+    assert registry.select("web search").name == "Web Search"
+    assert registry.get("WEB_SEARCH").name == "Web Search"
+    assert registry.get("Web search", exact=True) is None
+    assert registry.select("Web Serch").name == "Web Search"
+    assert registry.select("Delete File") is None
+    assert registry.accepted_args(registry.get("Read File")) == {"path"}
+    assert registry.tools_names == "Web Search, Read File"
+
+
+def test_executor_actions_reuse_the_registry():
+    registry = _registry()
+    action = AgentAction(
+        thought="",
+        tool="Web Search",
+        tool_input='{"query": "crewai"}',
+        text='Action: Web Search\nAction Input: {"query": "crewai"}',
+    )
+
+    with patch.object(
+        ToolRegistry, "__init__", side_effect=AssertionError("rebuilt")
+    ):
+        for _ in range(2):
+            result = execute_tool_and_check_finality(
+                agent_action=action,
+                tools=registry.tools,
+                i18n=I18N(),
+                tool_registry=registry,
+            )
+            assert result.result == "results for crewai"
@@ -0,0 +1,164 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from crewai import Agent, Crew, Task
+from crewai.llm import LLM
+from crewai.llms.base_llm import BaseLLM
+from crewai.tools import tool
+from crewai.utilities.cancellation import (
+    CancellationToken,
+    ExecutionCancelledException,
+    ExecutionDeadlineExceededException,
+    cancellation_scope,
+    current_cancellation_token,
+    submit_in_context,
+)
+
+
+class LoopingLLM(BaseLLM):
+    """Keeps asking for a tool and never gives a final answer."""
+
+    def __init__(self, delay: float = 0.1):
+        super().__init__(model="looping-model")
+        self.delay = delay
+        self.calls = 0
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+    ):
+        self.calls += 1
+        time.sleep(self.delay)
+        return (
+            f"Thought: I need more data\nAction: lookup\n"
+            f'Action Input: {{"query": "call {self.calls}"}}'
+        )
+
+
+@tool("lookup")
+def lookup(query: str) -> str:
+    """Look up a query."""
+    return f"nothing found for {query}"
+
+
+def _agent(llm: BaseLLM, **kwargs) -> Agent:
+    return Agent(
+        role="Researcher",
+        goal="Research",
+        backstory="Thorough",
+        llm=llm,
+        tools=[lookup],
+        max_iter=1000,
+        allow_delegation=False,
+        **kwargs,
+    )
+
+
+def _task(agent: Agent) -> Task:
+    return Task(description="Research forever", expected_output="Notes", agent=agent)
+
+
+def test_child_token_follows_parent():
+    parent = CancellationToken(timeout=60)
+    child = parent.child(timeout=600)
+
+    assert child.remaining() <= 60
+    assert not child.cancelled
+
+    parent.cancel("stop")
+    with pytest.raises(ExecutionCancelledException, match="stop"):
+        child.raise_if_cancelled()
+    with pytest.raises(ExecutionDeadlineExceededException):
+        CancellationToken(timeout=0).raise_if_cancelled()
+
+
+def test_llm_request_timeout_is_capped_by_deadline():
+    llm = LLM(model="gpt-4o-mini", timeout=60)
+    messages = [{"role": "user", "content": "Hi"}]
+
+    assert llm._prepare_completion_params(messages)["timeout"] == 60
+    with cancellation_scope(CancellationToken(timeout=5)):
+        assert llm._prepare_completion_params(messages)["timeout"] <= 5
+
+
+def test_agent_timeout_stops_the_agent():
+    llm = LoopingLLM()
+    agent = _agent(llm, max_execution_time=1)
+
+    with pytest.raises(TimeoutError):
+        _task(agent).execute_sync()
+
+    calls_at_timeout = llm.calls
+    time.sleep(0.5)
+    assert llm.calls <= calls_at_timeout + 1
+
+
+def test_kickoff_deadline_stops_the_crew():
+    llm = LoopingLLM()
+    agent = _agent(llm)
+    crew = Crew(agents=[agent], tasks=[_task(agent)])
+
+    started_at = time.monotonic()
+    with pytest.raises(ExecutionDeadlineExceededException):
+        crew.kickoff(deadline=0.5)
+
+    assert time.monotonic() - started_at < 2
+    calls_at_deadline = llm.calls
+    time.sleep(0.3)
+    assert llm.calls == calls_at_deadline
+
+
+def test_cancel_stops_a_running_kickoff():
+    llm = LoopingLLM()
+    agent = _agent(llm)
+    crew = Crew(agents=[agent], tasks=[_task(agent)])
+
+    threading.Timer(0.3, crew.cancel, kwargs={"reason": "user abort"}).start()
+    with pytest.raises(ExecutionCancelledException, match="user abort"):
+        crew.kickoff()
+
+
+def test_cancel_before_kickoff_cancels_only_the_next_kickoff():
+    llm = LoopingLLM()
+    agent = _agent(llm)
+    crew = Crew(agents=[agent], tasks=[_task(agent)])
+
+    crew.cancel("cancelled early")
+    with pytest.raises(ExecutionCancelledException, match="cancelled early"):
+        crew.kickoff()
+    assert llm.calls == 0
+
+    with pytest.raises(ExecutionDeadlineExceededException):
+        crew.kickoff(deadline=0.3)
+    assert llm.calls > 0
+
+
+def test_submit_in_context_keeps_the_callers_token():
+    token = CancellationToken()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with cancellation_scope(token):
+            future = submit_in_context(executor, current_cancellation_token)
+        assert future.result() is token
+        assert executor.submit(current_cancellation_token).result() is None
+
+
+def test_closing_a_finished_kickoff_stream_does_not_cancel_the_next_kickoff():
+    llm = LoopingLLM()
+    agent = _agent(llm)
+    crew = Crew(agents=[agent], tasks=[_task(agent)])
+
+    # The kickoff has returned, but its stream has not yet seen the result
+    assert not crew._cancel_running_kickoff("Kickoff stream was closed")
+    assert crew._pending_cancellation is None
+
+    with pytest.raises(ExecutionDeadlineExceededException):
+        crew.kickoff(deadline=0.3)
+    assert llm.calls > 0
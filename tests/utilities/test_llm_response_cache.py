@@ -0,0 +1,145 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crewai.llm import LLM
+from crewai.utilities.events.crewai_event_bus import CrewAIEventsBus
+from crewai.utilities.events.llm_events import (
+    LLMCallCompletedEvent,
+    LLMCallStartedEvent,
+)
+from crewai.utilities.llm_response_cache_handler import LLMResponseCacheHandler
+
+
+def _mock_response(content: str) -> MagicMock:
+    mock_message = MagicMock()
+    mock_message.content = content
+    mock_message.tool_calls = []
+    mock_choice = MagicMock()
+    mock_choice.message = mock_message
+    mock_response = MagicMock()
+    mock_response.choices = [mock_choice]
+    mock_response.usage = {
+        "prompt_tokens": 5,
+        "completion_tokens": 5,
+        "total_tokens": 10,
+    }
+    return mock_response
+
+
+@pytest.fixture
+def cache(tmp_path) -> LLMResponseCacheHandler:
+    return LLMResponseCacheHandler(db_path=str(tmp_path / "llm_cache.db"))
+
+
+def test_cache_key_ignores_transport_params():
+    params = {"model": "gpt-4o", "messages": [{"role": "user", "content": "Hi"}]}
+    key = LLMResponseCacheHandler.make_key(params)
+
+    assert key == LLMResponseCacheHandler.make_key(
+        {**params, "api_key": "secret", "stream": True, "timeout": 30}
+    )
+    assert key != LLMResponseCacheHandler.make_key({**params, "temperature": 0.5})
+
+
+def test_llm_serves_repeated_call_from_cache(cache):
+    llm = LLM(model="gpt-4o-mini", response_cache=cache)
+    messages = [{"role": "user", "content": "Hello, world!"}]
+
+    with patch("litellm.completion") as mocked_completion:
+        mocked_completion.return_value = _mock_response("Test response")
+
+        assert llm.call(messages) == "Test response"
+        assert llm.call(messages) == "Test response"
+
+        mocked_completion.assert_called_once()
+
+
+def test_llm_cache_hit_emits_cached_events(cache):
+    llm = LLM(model="gpt-4o-mini", response_cache=cache)
+
+    with patch("litellm.completion") as mocked_completion:
+        mocked_completion.return_value = _mock_response("Test response")
+        llm.call("Hello, world!")
+
+    with patch.object(CrewAIEventsBus, "emit") as mock_emit:
+        assert llm.call("Hello, world!") == "Test response"
+
+    events = [call.kwargs["event"] for call in mock_emit.call_args_list]
+    assert [type(event) for event in events] == [
+        LLMCallStartedEvent,
+        LLMCallCompletedEvent,
+    ]
+    assert all(event.cached for event in events)
+
+
+def test_llm_cache_skipped_when_functions_available(cache):
+    llm = LLM(model="gpt-4o-mini", response_cache=cache)
+
+    with patch("litellm.completion") as mocked_completion:
+        mocked_completion.return_value = _mock_response("Test response")
+
+        llm.call("Hello", available_functions={"noop": lambda: None})
+        llm.call("Hello", available_functions={"noop": lambda: None})
+
+        assert mocked_completion.call_count == 2
+    assert cache.storage.count() == 0
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = LLMResponseCacheHandler(
+        max_entries=2, db_path=str(tmp_path / "llm_cache.db")
+    )
+    cache.add("crew", "a", "A")
+    cache.add("crew", "b", "B")
+    assert cache.read("crew", "a") == "A"
+    cache.add("crew", "c", "C")
+
+    assert cache.read("crew", "b") is None
+    assert cache.read("crew", "a") == "A"
+    assert cache.read("crew", "c") == "C"
+
+
+def test_cache_entries_expire_after_ttl(tmp_path):
+    cache = LLMResponseCacheHandler(ttl=10, db_path=str(tmp_path / "llm_cache.db"))
+
+    with patch("time.time", return_value=1000.0):
+        cache.add("crew", "a", "A")
+    with patch("time.time", return_value=1005.0):
+        assert cache.read("crew", "a") == "A"
+    with patch("time.time", return_value=1011.0):
+        assert cache.read("crew", "a") is None
+
+
+def test_cache_namespaces_are_isolated(cache):
+    cache.add("crew-a", "key", "A")
+
+    assert cache.read("crew-b", "key") is None
+    assert cache.read("crew-a", "key") == "A"
+
+    cache.reset("crew-a")
+    assert cache.read("crew-a", "key") is None
+
+
+def test_namespace_separates_crews_sharing_a_name(cache):
+    from crewai import Agent, Crew, Task
+
+    def crew_agent(goal):
+        agent = Agent(role="Writer", goal=goal, backstory="Writes")
+        agent.crew = Crew(
+            name="crew",
+            agents=[agent],
+            tasks=[Task(description=goal, expected_output="Text", agent=agent)],
+        )
+        return agent
+
+    first, second, rebuilt = (
+        crew_agent("Write poems"),
+        crew_agent("Write essays"),
+        crew_agent("Write poems"),
+    )
+
+    namespace = cache.resolve_namespace(from_agent=first)
+    assert namespace.startswith("crew:")
+    assert namespace != cache.resolve_namespace(from_agent=second)
+    assert namespace == cache.resolve_namespace(from_agent=rebuilt)
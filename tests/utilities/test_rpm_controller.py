@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+import pytest
+
+from crewai.utilities.rpm_controller import RPMController
+
+
+def test_requests_within_budget_do_not_wait():
+    controller = RPMController(max_rpm=3)
+
+    with patch.object(RPMController, "_wait_for_next_minute") as wait:
+        for _ in range(3):
+            assert controller.check_or_wait()
+
+    wait.assert_not_called()
+
+
+def test_waits_only_until_a_request_slot_refills():
+    controller = RPMController(max_rpm=60)
+
+    with patch("time.time", return_value=1000.0):
+        for _ in range(60):
+            controller.check_or_wait()
+
+    with (
+        patch("time.time", return_value=1000.5),
+        patch.object(RPMController, "_wait_for_next_minute") as wait,
+    ):
+        controller.check_or_wait()
+
+    delay = wait.call_args.args[0]
+    assert delay == pytest.approx(0.5)
+
+
+def test_recorded_tokens_delay_following_requests():
+    controller = RPMController(max_tpm=600)
+
+    with patch("time.time", return_value=1000.0):
+        controller.check_or_wait()
+        controller.record_tokens(900)
+
+    with (
+        patch("time.time", return_value=1000.0),
+        patch.object(RPMController, "_wait_for_next_minute") as wait,
+    ):
+        controller.check_or_wait()
+
+    assert wait.call_args.args[0] == pytest.approx(30.0)
+
+
+def test_shared_key_shares_budget_through_sqlite(tmp_path):
+    db_path = str(tmp_path / "rate_limits.db")
+    first = RPMController(max_rpm=1, shared_key="api-key", db_path=db_path)
+    second = RPMController(max_rpm=1, shared_key="api-key", db_path=db_path)
+    other = RPMController(max_rpm=1, shared_key="other-key", db_path=db_path)
+
+    with patch.object(RPMController, "_wait_for_next_minute") as wait:
+        first.check_or_wait()
+        other.check_or_wait()
+        wait.assert_not_called()
+
+        second.check_or_wait()
+        wait.assert_called_once()
+
+    first.reset()
+    with patch.object(RPMController, "_wait_for_next_minute") as wait:
+        second.check_or_wait()
+    wait.assert_not_called()
@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+from crewai.utilities.task_executor import TaskExecutor
+
+
+def test_task_executor_bounds_workers_and_reports_metrics():
+    executor = TaskExecutor(max_workers=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(timeout=5)
+        return "done"
+
+    running = executor.submit(blocking)
+    started.wait(timeout=5)
+    queued = executor.submit(lambda: "queued")
+
+    metrics = executor.metrics()
+    assert metrics.max_workers == 1
+    assert metrics.active_workers == 1
+    assert metrics.queue_depth == 1
+
+    release.set()
+    assert running.result(timeout=5) == "done"
+    assert queued.result(timeout=5) == "queued"
+    executor.shutdown()
+
+    metrics = executor.metrics()
+    assert metrics.active_workers == 0
+    assert metrics.queue_depth == 0
+    assert metrics.completed_tasks == 2
+
+
+def test_task_executor_propagates_exceptions_and_cancellation():
+    executor = TaskExecutor(max_workers=1)
+    release = threading.Event()
+
+    def failing():
+        release.wait(timeout=5)
+        raise ValueError("task failed")
+
+    failed = executor.submit(failing)
+    queued = executor.submit(lambda: "never runs")
+    assert queued.cancel()
+    assert executor.metrics().queue_depth == 0
+
+    release.set()
+    with pytest.raises(ValueError, match="task failed"):
+        failed.result(timeout=5)
+    executor.shutdown()
+
+    metrics = executor.metrics()
+    assert metrics.failed_tasks == 1
+    assert metrics.completed_tasks == 1
@@ -0,0 +1,114 @@
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from crewai import Agent, Crew, Process, Task
+from crewai.llm import LLM
+from crewai.utilities.task_result_cache_handler import TaskResultCacheHandler
+
+
+class Summary(BaseModel):
+    title: str
+
+
+@pytest.fixture
+def cache(tmp_path) -> TaskResultCacheHandler:
+    return TaskResultCacheHandler(db_path=str(tmp_path / "task_results.db"))
+
+
+def _agent(temperature: float = 0.1, api_key: str = "key") -> Agent:
+    return Agent(
+        role="Writer",
+        goal="Write articles",
+        backstory="A seasoned writer",
+        llm=LLM(model="gpt-4o-mini", temperature=temperature, api_key=api_key),
+    )
+
+
+def _build_crew(cache: TaskResultCacheHandler, last_description: str) -> Crew:
+    writer = _agent()
+    descriptions = ["Research the topic", "Draft the article", last_description]
+    tasks = [
+        Task(description=description, expected_output="Text", agent=writer)
+        for description in descriptions
+    ]
+    return Crew(
+        agents=[writer],
+        tasks=tasks,
+        process=Process.sequential,
+        task_cache=cache,
+    )
+
+
+def test_task_cache_key_covers_task_context_and_llm_config():
+    task = Task(description="Summarize", expected_output="A summary")
+    key = TaskResultCacheHandler.make_key(task, _agent(), "context", [])
+
+    assert key == TaskResultCacheHandler.make_key(
+        task, _agent(api_key="other"), "context", []
+    )
+    assert key != TaskResultCacheHandler.make_key(
+        task, _agent(temperature=0.7), "context", []
+    )
+    assert key != TaskResultCacheHandler.make_key(task, _agent(), "other", [])
+    edited = Task(description="Summarize briefly", expected_output="A summary")
+    assert key != TaskResultCacheHandler.make_key(edited, _agent(), "context", [])
+
+
+def test_crew_reruns_only_tasks_that_changed(cache):
+    with patch.object(
+        Agent, "execute_task", side_effect=lambda task, context, tools: task.description
+    ) as execute_task:
+        first = _build_crew(cache, "Edit the article").kickoff()
+        assert execute_task.call_count == 3
+
+        execute_task.reset_mock()
+        second = _build_crew(cache, "Edit the article for tone").kickoff()
+
+    execute_task.assert_called_once()
+    assert [output.raw for output in second.tasks_output[:2]] == [
+        output.raw for output in first.tasks_output[:2]
+    ]
+    assert second.raw == "Edit the article for tone"
+
+
+def test_task_cache_opt_in_and_opt_out(cache):
+    agent = _agent()
+    task = Task(
+        description="Name the article",
+        expected_output="A title",
+        agent=agent,
+        output_pydantic=Summary,
+        cache=True,
+    )
+    task._result_cache = cache
+
+    with patch.object(
+        Agent, "execute_task", return_value='{"title": "Soylent"}'
+    ) as execute_task:
+        assert task.execute_sync().pydantic == Summary(title="Soylent")
+        assert task.execute_sync().pydantic == Summary(title="Soylent")
+        execute_task.assert_called_once()
+
+        task.cache = False
+        task.execute_sync()
+        assert execute_task.call_count == 2
+
+
+def test_task_cache_skips_tasks_with_human_input(cache):
+    agent = _agent()
+    task = Task(
+        description="Name the article",
+        expected_output="A title",
+        agent=agent,
+        human_input=True,
+        cache=True,
+    )
+    task._result_cache = cache
+
+    with patch.object(Agent, "execute_task", return_value="Soylent") as execute_task:
+        task.execute_sync()
+        task.execute_sync()
+
+    assert execute_task.call_count == 2